@@ -4,39 +4,92 @@ from __future__ import annotations
 
 from typing import Final
 
+from ._cache import CachedFunction, CacheInfo, cached
 from ._cancelscope import (
     CancelScope,
-    cancel_stack,
+    cancel_stack,  # noqa: F401
     fail_after,
     fail_at,
+    get_current_effective_deadline,
     move_on_after,
     move_on_at,
 )
+from ._channels import (
+    BrokenChannelError,
+    ChannelClosedError,
+    ChannelStatistics,
+    EndOfChannelError,
+    MemoryReceiveChannel,
+    MemorySendChannel,
+    open_memory_channel,
+)
+from ._checkpoint import checkpoint, checkpointed
+from ._circuitbreaker import CircuitBreaker, CircuitOpenError
 from ._defer import Deferrer, _defer
-from ._gather import gather
+from ._gather import gather, gather_into
+from ._introspection import TaskTreeRegistry
+from ._loadshedding import LoadShedder, LoadShedError
+from ._looppool import LoopPool
+from ._overdue import OverdueDetector, OverdueReport
+from ._pipeline import Pipeline, Stage, pipeline
+from ._portal import Portal
+from ._processlimiter import ProcessLimiter
+from ._retry import ExponentialBackoff, retry
+from ._singleflight import SingleFlight
+from ._sync import CapacityLimiter, LimiterStatistics, Lock, Semaphore
 from ._taskgroup import TaskGroup
+from ._telemetry import CancelScopeTelemetry, Histogram, ScopeStats
 
 __all__ = [
+    "BrokenChannelError",
+    "CacheInfo",
+    "CachedFunction",
     "CancelScope",
+    "CancelScopeTelemetry",
+    "CapacityLimiter",
+    "ChannelClosedError",
+    "ChannelStatistics",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "Deferrer",
+    "EndOfChannelError",
+    "ExponentialBackoff",
+    "Histogram",
+    "LimiterStatistics",
+    "LoadShedError",
+    "LoadShedder",
+    "Lock",
+    "LoopPool",
+    "MemoryReceiveChannel",
+    "MemorySendChannel",
+    "OverdueDetector",
+    "OverdueReport",
+    "Pipeline",
+    "Portal",
+    "ProcessLimiter",
+    "ScopeStats",
+    "Semaphore",
+    "SingleFlight",
+    "Stage",
     "TaskGroup",
+    "TaskTreeRegistry",
+    "cached",
+    "checkpoint",
+    "checkpointed",
     "defer",
     "fail_after",
     "fail_at",
     "gather",
+    "gather_into",
     "get_current_effective_deadline",
     "move_on_after",
     "move_on_at",
+    "open_memory_channel",
+    "pipeline",
+    "retry",
 ]
 
 
-def get_current_effective_deadline() -> float:
-    return min(
-        [cs._deadline for cs in cancel_stack.get() if cs._deadline is not None],
-        default=float("inf"),
-    )
-
-
 # This needs to be here for Sphinx.
 defer: Final = _defer()
 """First wrap your coroutine function with `defer.enable`, then call me inside.
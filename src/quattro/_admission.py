@@ -0,0 +1,179 @@
+"""Admission policies for limited task groups."""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
+from collections.abc import Hashable
+from heapq import heappop, heappush
+from itertools import count
+
+from ._cancelscope import get_current_effective_deadline
+
+
+class _EDFSemaphore:
+    """A semaphore admitting waiters earliest deadline first.
+
+    The deadline of a waiter is the current effective deadline of the task
+    acquiring, which for task group children comes from the context they
+    were created in. Waiters without deadlines go last, in FIFO order.
+
+    Waiters whose deadline has passed by the time they would be admitted are
+    dropped by cancelling them instead.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        # Cancelled and dropped waiters are only removed when popped.
+        self._waiters: list[tuple[float, int, Future[None]]] = []
+        self._counter = count()
+
+    def locked(self) -> bool:
+        return self._value <= 0 or bool(self._waiters)
+
+    async def acquire(self) -> bool:
+        if not self.locked():
+            self._value -= 1
+            return True
+
+        loop = get_running_loop()
+        deadline = get_current_effective_deadline()
+        if deadline <= loop.time():
+            raise CancelledError()
+        fut = loop.create_future()
+        heappush(self._waiters, (deadline, next(self._counter), fut))
+        # The queue may only contain stale waiters.
+        self._wake()
+        try:
+            await fut
+        except CancelledError:
+            if fut.done() and not fut.cancelled():
+                # We were admitted just before being cancelled.
+                self.release()
+            else:
+                fut.cancel()
+            raise
+        return True
+
+    def release(self) -> None:
+        self._value += 1
+        self._wake()
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        if not waiters:
+            return
+        now = get_running_loop().time()
+        while waiters and self._value > 0:
+            deadline, _, fut = heappop(waiters)
+            if fut.done():
+                continue
+            if deadline <= now:
+                # Past due; the waiter cancels itself.
+                fut.cancel()
+                continue
+            self._value -= 1
+            fut.set_result(None)
+
+
+class _Tenant:
+    __slots__ = ("deficit", "waiters", "weight")
+
+    def __init__(self, weight: float) -> None:
+        self.waiters: deque[Future[None]] = deque()
+        self.weight = weight
+        self.deficit = 0.0
+
+
+class _FairSemaphore:
+    """A semaphore sharing slots between tenants, by deficit round robin.
+
+    Tenants with waiters take turns; on its turn, a tenant gets its weight
+    added to its deficit, and is admitted one waiter for every whole unit of
+    it. Tenants without waiters drop out of the rotation and forfeit their
+    deficit, so idle capacity goes to whoever is waiting. When a whole round
+    admits nobody, because all weights are small, weights are scaled up so
+    the smallest one is worth an admission per turn, until the rotation
+    empties.
+
+    Admission takes amortized constant time, regardless of the number of
+    tenants.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        # Tenants with waiters, in the order of their turns. The first one
+        # is the one whose turn it is.
+        self._active: deque[Hashable] = deque()
+        self._tenants: dict[Hashable, _Tenant] = {}
+        # What weights are multiplied by on every turn.
+        self._quantum = 1.0
+
+    def locked(self) -> bool:
+        return self._value <= 0 or bool(self._active)
+
+    async def acquire(self, tenant: Hashable = None, weight: float = 1.0) -> bool:
+        if not self.locked():
+            self._value -= 1
+            return True
+
+        fut = get_running_loop().create_future()
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = self._tenants[tenant] = _Tenant(weight)
+            self._active.append(tenant)
+        else:
+            state.weight = weight
+        state.waiters.append(fut)
+        # The rotation may only contain stale waiters.
+        self._wake()
+        try:
+            await fut
+        except CancelledError:
+            if fut.done() and not fut.cancelled():
+                # We were admitted just before being cancelled.
+                self.release()
+            else:
+                fut.cancel()
+            raise
+        return True
+
+    def release(self) -> None:
+        self._value += 1
+        self._wake()
+
+    def _wake(self) -> None:
+        active = self._active
+        tenants = self._tenants
+        # Turns in a row without an admission.
+        idle = 0
+        while active and self._value > 0:
+            tenant = active[0]
+            state = tenants[tenant]
+            waiters = state.waiters
+            # Cancelled waiters are only removed here.
+            while waiters and waiters[0].done():
+                waiters.popleft()
+            if not waiters:
+                active.popleft()
+                del tenants[tenant]
+                if not active:
+                    self._quantum = 1.0
+                continue
+            if state.deficit < 1:
+                # A new turn.
+                state.deficit += state.weight * self._quantum
+                if state.deficit < 1:
+                    active.rotate(-1)
+                    idle += 1
+                    if idle >= len(active):
+                        # A whole round without admissions.
+                        self._quantum = 1 / min(tenants[t].weight for t in active)
+                        idle = 0
+                    continue
+            idle = 0
+            state.deficit -= 1
+            self._value -= 1
+            waiters.popleft().set_result(None)
+            if state.deficit < 1:
+                active.rotate(-1)
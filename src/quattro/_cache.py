@@ -0,0 +1,257 @@
+"""Async memoization."""
+
+from __future__ import annotations
+
+from asyncio import Future, get_running_loop
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from functools import partial, update_wrapper
+from types import MethodType, TracebackType
+from typing import Any, Generic, ParamSpec, TypeVar, overload
+
+from attrs import define, frozen
+
+from ._singleflight import SingleFlight
+from ._taskgroup import TaskGroup
+
+__all__ = ["CacheInfo", "CachedFunction", "cached"]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return (*args, _KWARGS_MARK, *sorted(kwargs.items()))
+
+
+@define(slots=True)
+class _Entry:
+    value: Any
+    traceback: TracebackType | None
+    is_error: bool
+    expires_at: float
+    stale_until: float
+
+
+class _Load:
+    """A load in flight; stale once its key is invalidated."""
+
+    __slots__ = ("stale",)
+
+    def __init__(self) -> None:
+        self.stale = False
+
+
+@frozen
+class CacheInfo:
+    """Cache statistics, like `functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def _consume_exception(fut: Future[Any]) -> None:
+    # Refreshes may have no waiters; avoid 'exception never retrieved' logs.
+    if not fut.cancelled():
+        fut.exception()
+
+
+class CachedFunction(Generic[P, T]):
+    """A coroutine function wrapped by `cached`.
+
+    The cache needs a task group to run computations in. Either use the
+    function as an async context manager, or bind it to an existing task group
+    using `bind()`. When the task group exits, computations in flight
+    (including background refreshes) are cancelled.
+
+    Like `functools.lru_cache`, decorating methods works, with the instance
+    being part of the key.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __name__: str
+    __qualname__: str
+
+    def __init__(
+        self,
+        function: Callable[P, Coroutine[Any, Any, T]],
+        ttl: float | None,
+        maxsize: int | None,
+        error_ttl: float | None,
+        stale_ttl: float,
+    ) -> None:
+        self.__wrapped__ = function
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.error_ttl = error_ttl
+        self.stale_ttl = stale_ttl
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._flight: SingleFlight[Hashable, T] = SingleFlight()
+        self._loads: dict[Hashable, _Load] = {}
+        self._hits = 0
+        self._misses = 0
+        update_wrapper(self, function)
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type[Any] | None = None
+    ) -> CachedFunction[P, T]: ...
+
+    @overload
+    def __get__(
+        self, instance: object, owner: type[Any] | None = None
+    ) -> Callable[..., Coroutine[Any, Any, T]]: ...
+
+    def __get__(self, instance: object, owner: type[Any] | None = None) -> Any:
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    async def __aenter__(self) -> CachedFunction[P, T]:
+        await self._flight.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self._flight.__aexit__(et, exc, tb)
+
+    def bind(self, task_group: TaskGroup) -> None:
+        """Run computations as background tasks of this task group from now on."""
+        self._flight = SingleFlight(task_group)
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        key = _make_key(args, kwargs)
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = get_running_loop().time()
+            if now < entry.expires_at:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                if entry.is_error:
+                    raise entry.value.with_traceback(entry.traceback)
+                return entry.value
+            if now < entry.stale_until:
+                # Stale, but still usable while being refreshed.
+                self._hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._flight:
+                    call = self._flight._start(
+                        key, partial(self._load, key, args, kwargs)
+                    )
+                    call.future.add_done_callback(_consume_exception)
+                return entry.value
+            del self._entries[key]
+
+        self._misses += 1
+        return await self._flight.do(key, partial(self._load, key, args, kwargs))
+
+    def invalidate(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Drop the cached result for these arguments, if any.
+
+        A computation in flight for these arguments still returns its result
+        to the callers already waiting for it, but does not cache it.
+        """
+        key = _make_key(args, kwargs)
+        self._entries.pop(key, None)
+        self._forget(key)
+
+    def cache_clear(self) -> None:
+        """Drop all cached results, and reset the statistics.
+
+        Computations in flight do not cache their results.
+        """
+        self._entries.clear()
+        for key in list(self._loads):
+            self._forget(key)
+        self._hits = self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def _forget(self, key: Hashable) -> None:
+        load = self._loads.pop(key, None)
+        if load is not None:
+            load.stale = True
+        self._flight.forget(key)
+
+    async def _load(
+        self, key: Hashable, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> T:
+        load = self._loads[key] = _Load()
+        try:
+            result = await self.__wrapped__(*args, **kwargs)
+        except Exception as exc:
+            if self.error_ttl is not None and not load.stale:
+                now = get_running_loop().time()
+                expires_at = now + self.error_ttl
+                self._store(key, _Entry(exc, exc.__traceback__, True, expires_at, 0.0))
+            raise
+        finally:
+            if self._loads.get(key) is load:
+                del self._loads[key]
+        if load.stale:
+            # Invalidated while loading.
+            return result
+        now = get_running_loop().time()
+        expires_at = float("inf") if self.ttl is None else now + self.ttl
+        self._store(
+            key, _Entry(result, None, False, expires_at, expires_at + self.stale_ttl)
+        )
+        return result
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        entries = self._entries
+        entries[key] = entry
+        entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+
+def cached(
+    *,
+    ttl: float | None = None,
+    maxsize: int | None = 128,
+    error_ttl: float | None = None,
+    stale_ttl: float = 0.0,
+) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], CachedFunction[P, T]]:
+    """Memoize a coroutine function.
+
+    Results are cached by arguments, which must be hashable. Concurrent calls
+    with the same arguments share a single computation.
+
+    Args:
+        ttl: How long results stay fresh, in seconds. `None` means forever.
+        maxsize: How many results to keep, evicting the least recently used.
+            `None` means unbounded.
+        error_ttl: When provided, exceptions are cached for this long.
+        stale_ttl: How long after expiring results may still be returned, while
+            a refresh runs as a background task.
+
+    Example:
+        >>> @cached(ttl=60)
+        ... async def fetch_user(user_id: int) -> User: ...
+        >>> async with fetch_user:
+        ...     user = await fetch_user(1)
+
+    .. versionadded:: 26.2.0
+    """
+
+    def decorator(
+        function: Callable[P, Coroutine[Any, Any, T]],
+    ) -> CachedFunction[P, T]:
+        return CachedFunction(function, ttl, maxsize, error_ttl, stale_ttl)
+
+    return decorator
@@ -13,13 +13,55 @@ from typing import Final, Literal
 
 from attrs import define, field
 
+from ._threadsafe import _call_soon_threadsafe
+
 _is_311_or_later: Final = sys.version_info >= (3, 11)
 
 
+class _ScopeObserver:
+    """Receives cancel scope lifecycle events, for instrumentation.
+
+    Observers are only invoked while installed; without any, every hook
+    costs a loop over an empty tuple.
+    """
+
+    def scope_entered(self, scope: "CancelScope") -> None:
+        pass
+
+    def scope_timer_armed(self, scope: "CancelScope") -> None:
+        pass
+
+    def scope_timer_disarmed(self, scope: "CancelScope") -> None:
+        pass
+
+    def scope_timed_out(self, scope: "CancelScope") -> None:
+        pass
+
+    def scope_exited(self, scope: "CancelScope") -> None:
+        pass
+
+
+_observers: tuple[_ScopeObserver, ...] = ()
+
+
+def _add_observer(observer: _ScopeObserver) -> None:
+    global _observers
+    if all(o is not observer for o in _observers):
+        _observers = (*_observers, observer)
+
+
+def _remove_observer(observer: _ScopeObserver) -> None:
+    global _observers
+    _observers = tuple(o for o in _observers if o is not observer)
+
+
 @define
 class CancelScope:
     _deadline: float | None = None
 
+    label: str | None = field(default=None, kw_only=True)
+    """An optional label, used to group scopes in instrumentation."""
+
     cancelled_caught: bool = field(default=False, init=False)
     """Whether the scope finished by cancellation or not."""
 
@@ -44,8 +86,7 @@ class CancelScope:
         self._cancel_status = "called"
         self._current_task.cancel(id(self))
         if self._timeout_handler is not None:
-            self._timeout_handler.cancel()
-            self._timeout_handler = None
+            self._disarm()
 
     @property
     def deadline(self) -> float | None:
@@ -60,19 +101,95 @@ class CancelScope:
         """
         if self._deadline == value:
             return
+        self._apply_deadline(value)
+
+    def _apply_deadline(self, value: float | None) -> None:
         self._deadline = value
 
         # Only handle timers if we're already in the scope
         if self._current_task is not None and self._current_task != "done":
-            if self._timeout_handler is not None:
-                self._timeout_handler.cancel()
-                self._timeout_handler = None
+            handler = self._timeout_handler
+            if (
+                value is not None
+                and isinstance(handler, TimerHandle)
+                and value >= handler.when()
+            ):
+                # Extending the deadline; the timer re-arms itself when it fires.
+                return
+            if handler is not None:
+                self._disarm()
             if value is not None:
                 loop = get_running_loop()
                 if value <= loop.time():
+                    for observer in _observers:
+                        observer.scope_timed_out(self)
                     self.cancel()
                 else:
-                    self._timeout_handler = loop.call_at(value, self.__timeout_cb)
+                    self._arm(loop.call_at(value, self.__timeout_cb))
+
+    def reschedule(self, seconds: float) -> None:
+        """Set the deadline to `seconds` from now.
+
+        Useful for idle timeouts, by rescheduling on every bit of progress.
+        Moving the deadline later is cheap: the timer is not rescheduled, it
+        re-arms itself for the new deadline when it fires.
+
+        .. versionadded:: 26.2.0
+        """
+        self.deadline = get_running_loop().time() + seconds
+
+    def cancel_threadsafe(self) -> None:
+        """Request cancellation of this scope, from any thread.
+
+        The cancellation is applied by the event loop of the task in the
+        scope. Calls from other threads, for this and other scopes, are
+        batched: the loop is woken up once for all the calls made while it
+        is busy.
+
+        .. versionadded:: 26.2.0
+        """
+        task = self._current_task
+        if task is None:
+            self._cancel_status = "prequeued"
+            # The scope may have been entered in the meantime.
+            task = self._current_task
+            if task is None:
+                return
+        if task == "done":
+            return
+        _call_soon_threadsafe(task.get_loop(), self.cancel)
+
+    def set_deadline_threadsafe(self, value: float | None) -> None:
+        """Set the deadline to the given value from any thread, like `deadline`.
+
+        The deadline is applied by the event loop of the task in the scope,
+        with calls from other threads batched like with `cancel_threadsafe()`.
+
+        .. versionadded:: 26.2.0
+        """
+        task = self._current_task
+        if task is None:
+            self._deadline = value
+            # The scope may have been entered in the meantime.
+            task = self._current_task
+            if task is None:
+                return
+        if task == "done":
+            self._deadline = value
+            return
+        _call_soon_threadsafe(task.get_loop(), self._apply_deadline, value)
+
+    def _arm(self, handler: TimerHandle | Handle) -> None:
+        self._timeout_handler = handler
+        for observer in _observers:
+            observer.scope_timer_armed(self)
+
+    def _disarm(self) -> None:
+        assert self._timeout_handler is not None
+        self._timeout_handler.cancel()
+        self._timeout_handler = None
+        for observer in _observers:
+            observer.scope_timer_disarmed(self)
 
     if _is_311_or_later:
 
@@ -82,18 +199,20 @@ class CancelScope:
 
             self._current_task = current_task()
             cancel_stack.set((self, *cancel_stack.get()))
+            for observer in _observers:
+                observer.scope_entered(self)
             if self._cancel_status == "prequeued":
-                self._timeout_handler = get_running_loop().call_soon(self.__timeout_cb)
+                self._arm(get_running_loop().call_soon(self.__timeout_cb))
                 self._deadline = get_running_loop().time()
             elif self._deadline is not None:
                 loop = get_running_loop()
                 if self._deadline <= loop.time():
                     # No need to go to the trouble of scheduling a task to call this.
+                    for observer in _observers:
+                        observer.scope_timed_out(self)
                     self.cancel()
                 else:
-                    self._timeout_handler = loop.call_at(
-                        self._deadline, self.__timeout_cb
-                    )
+                    self._arm(loop.call_at(self._deadline, self.__timeout_cb))
             return self
 
         def __exit__(
@@ -103,8 +222,7 @@ class CancelScope:
             if self._timeout_handler is not None:
                 # Means the timeout handler hasn't run yet.
                 handler_done = False
-                self._timeout_handler.cancel()
-                self._timeout_handler = None
+                self._disarm()
 
             assert self._current_task is not None
             assert self._current_task != "done"
@@ -119,9 +237,13 @@ class CancelScope:
                 and ct.uncancel() == 0
             ):
                 self.cancelled_caught = True
+                for observer in _observers:
+                    observer.scope_exited(self)
                 if self._raise_on_cancel:
                     raise TimeoutError() from None
                 return True
+            for observer in _observers:
+                observer.scope_exited(self)
             return None
 
     else:
@@ -132,27 +254,28 @@ class CancelScope:
 
             self._current_task = current_task()
             cancel_stack.set((self, *cancel_stack.get()))
+            for observer in _observers:
+                observer.scope_entered(self)
             if self._cancel_status == "prequeued":
                 # The scope was cancelled before entering.
-                self._timeout_handler = get_running_loop().call_soon(self.__timeout_cb)
+                self._arm(get_running_loop().call_soon(self.__timeout_cb))
                 self._deadline = get_running_loop().time()
             elif self._deadline is not None:
                 loop = get_running_loop()
                 if self._deadline <= loop.time():
                     # No need to go to the trouble of scheduling a task to call this.
+                    for observer in _observers:
+                        observer.scope_timed_out(self)
                     self.cancel()
                 else:
-                    self._timeout_handler = loop.call_at(
-                        self._deadline, self.__timeout_cb
-                    )
+                    self._arm(loop.call_at(self._deadline, self.__timeout_cb))
             return self
 
         def __exit__(
             self, exc_type: type[BaseException] | None, exc_val, _
         ) -> bool | None:
             if self._timeout_handler is not None:
-                self._timeout_handler.cancel()
-                self._timeout_handler = None
+                self._disarm()
 
             self._current_task = "done"
             cancel_stack.set(cancel_stack.get()[1:])
@@ -163,9 +286,13 @@ class CancelScope:
                 and exc_val.args[0] == id(self)
             ):
                 self.cancelled_caught = True
+                for observer in _observers:
+                    observer.scope_exited(self)
                 if self._raise_on_cancel:
                     raise TimeoutError() from None
                 return True
+            for observer in _observers:
+                observer.scope_exited(self)
             return None
 
     def __timeout_cb(self) -> None:
@@ -174,28 +301,52 @@ class CancelScope:
         # Can this execute while the _current_task is `None`?
         # No, because `__enter__` sets the current task, and no
         # handlers are scheduled before that.
+        handler = self._timeout_handler
+        self._timeout_handler = None
+        for observer in _observers:
+            observer.scope_timer_disarmed(self)
+        deadline = self._deadline
+        if (
+            deadline is not None
+            and isinstance(handler, TimerHandle)
+            and deadline > handler.when()
+        ):
+            # The deadline was moved later in the meantime.
+            self._arm(get_running_loop().call_at(deadline, self.__timeout_cb))
+            return
+        if self._cancel_status != "prequeued":
+            # Scopes cancelled before entering do not time out.
+            for observer in _observers:
+                observer.scope_timed_out(self)
         self.cancel()
 
 
 cancel_stack = ContextVar[tuple[CancelScope, ...]]("cancel_stack", default=())
 
 
-def move_on_after(seconds: float) -> CancelScope:
+def get_current_effective_deadline() -> float:
+    return min(
+        [cs._deadline for cs in cancel_stack.get() if cs._deadline is not None],
+        default=float("inf"),
+    )
+
+
+def move_on_after(seconds: float, *, label: str | None = None) -> CancelScope:
     """
     Use as a context manager to create a cancel scope whose deadline is set to
     now + seconds.
     """
-    return move_on_at(get_running_loop().time() + seconds)
+    return move_on_at(get_running_loop().time() + seconds, label=label)
 
 
-def move_on_at(deadline: float) -> CancelScope:
+def move_on_at(deadline: float, *, label: str | None = None) -> CancelScope:
     """
     Use as a context manager to create a cancel scope with the given absolute deadline.
     """
-    return CancelScope(deadline)
+    return CancelScope(deadline, label=label)
 
 
-def fail_after(seconds: float) -> CancelScope:
+def fail_after(seconds: float, *, label: str | None = None) -> CancelScope:
     """
     Create a cancel scope with the given timeout, and raises an error if it is actually
     cancelled.
@@ -206,10 +357,10 @@ def fail_after(seconds: float) -> CancelScope:
     exception reaches move_on_after(), it's caught and discarded. When it reaches
     fail_after(), then it's caught and TimeoutError is raised in its place.
     """
-    return fail_at(get_running_loop().time() + seconds)
+    return fail_at(get_running_loop().time() + seconds, label=label)
 
 
-def fail_at(deadline: float) -> CancelScope:
+def fail_at(deadline: float, *, label: str | None = None) -> CancelScope:
     """
     Create a cancel scope with the given deadline, and raises an error if it is
     actually cancelled.
@@ -220,6 +371,6 @@ def fail_at(deadline: float) -> CancelScope:
     CancelledError exception reaches move_on_at(), it's caught and discarded. When it
     reaches fail_at(), then it's caught and TimeoutError is raised in its place.
     """
-    scope = CancelScope(deadline)
+    scope = CancelScope(deadline, label=label)
     scope._raise_on_cancel = True
     return scope
@@ -0,0 +1,420 @@
+"""Memory channels."""
+
+from __future__ import annotations
+
+import sys
+from asyncio import (
+    CancelledError,
+    Future,
+    QueueEmpty,
+    QueueFull,
+    current_task,
+    get_running_loop,
+)
+from collections import deque
+from contextlib import suppress
+from math import inf
+from types import TracebackType
+from typing import Any, Generic, TypeVar
+
+from attrs import frozen
+
+__all__ = [
+    "BrokenChannelError",
+    "ChannelClosedError",
+    "ChannelStatistics",
+    "EndOfChannelError",
+    "MemoryReceiveChannel",
+    "MemorySendChannel",
+    "open_memory_channel",
+]
+
+T = TypeVar("T")
+
+
+class ChannelClosedError(Exception):
+    """Raised when using a channel handle that was closed."""
+
+
+class BrokenChannelError(Exception):
+    """Raised when sending into a channel with no open receive handles."""
+
+
+class EndOfChannelError(Exception):
+    """Raised when receiving from a drained channel with no open send handles."""
+
+
+@frozen
+class ChannelStatistics:
+    """A snapshot of the state of a memory channel."""
+
+    current_buffer_used: int
+    max_buffer_size: float
+    open_send_channels: int
+    open_receive_channels: int
+    tasks_waiting_send: int
+    tasks_waiting_receive: int
+
+
+class _State(Generic[T]):
+    __slots__ = (
+        "buffer",
+        "max_buffer_size",
+        "open_receive_channels",
+        "open_send_channels",
+        "receivers",
+        "senders",
+    )
+
+    def __init__(self, max_buffer_size: float) -> None:
+        self.max_buffer_size = max_buffer_size
+        self.buffer: deque[T] = deque()
+        # Blocked senders, with the values they are sending.
+        self.senders: deque[tuple[Future[None], T]] = deque()
+        self.receivers: deque[Future[T]] = deque()
+        self.open_send_channels = 0
+        self.open_receive_channels = 0
+
+
+def _redeliver(exc: CancelledError) -> None:
+    """Postpone a cancellation to the next `await`.
+
+    Used when an operation completed before its task was woken up to be
+    cancelled: the result is kept, and the cancellation is requested again.
+    """
+    task = current_task()
+    assert task is not None
+    if sys.version_info >= (3, 11):
+        task.uncancel()
+    task.cancel(exc.args[0] if exc.args else None)
+
+
+class MemorySendChannel(Generic[T]):
+    """The sending end of a memory channel.
+
+    Create using `open_memory_channel()`.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, state: _State[T]) -> None:
+        self._state = state
+        self._closed = False
+        # Futures of the tasks blocked sending through this handle.
+        self._waiting: set[Future[None]] = set()
+        state.open_send_channels += 1
+
+    def send_nowait(self, value: T) -> None:
+        """Send a value without blocking.
+
+        Raises:
+            QueueFull: If the buffer is full.
+        """
+        if self._closed:
+            raise ChannelClosedError()
+        state = self._state
+        if not state.open_receive_channels:
+            raise BrokenChannelError()
+        receivers = state.receivers
+        while receivers:
+            receiver = receivers.popleft()
+            # Cancelled receivers are removed only once they run.
+            if not receiver.done():
+                receiver.set_result(value)
+                return
+        if len(state.buffer) < state.max_buffer_size:
+            state.buffer.append(value)
+        else:
+            raise QueueFull()
+
+    async def send(self, value: T) -> None:
+        """Send a value, waiting for room in the buffer if necessary.
+
+        If the send is cancelled, the value was not sent.
+        """
+        try:
+            self.send_nowait(value)
+        except QueueFull:
+            pass
+        else:
+            return
+
+        fut: Future[None] = get_running_loop().create_future()
+        entry = (fut, value)
+        state = self._state
+        state.senders.append(entry)
+        self._waiting.add(fut)
+        try:
+            await fut
+        except CancelledError as exc:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                # A receiver got the value just before we were cancelled.
+                _redeliver(exc)
+                return
+            with suppress(ValueError):
+                state.senders.remove(entry)
+            raise
+        finally:
+            self._waiting.discard(fut)
+
+    def clone(self) -> MemorySendChannel[T]:
+        """Return another send handle to the same channel.
+
+        The channel stays open for receivers until all send handles are closed.
+        """
+        if self._closed:
+            raise ChannelClosedError()
+        return MemorySendChannel(self._state)
+
+    def close(self) -> None:
+        """Close this handle.
+
+        Tasks blocked sending through it get `ChannelClosedError`. If this is
+        the last open send handle, receivers get `EndOfChannelError` once the
+        buffer is drained.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        state = self._state
+        for fut in self._waiting:
+            if not fut.done():
+                state.senders = deque(e for e in state.senders if e[0] is not fut)
+                fut.set_exception(ChannelClosedError())
+        state.open_send_channels -= 1
+        if not state.open_send_channels:
+            receivers = state.receivers
+            state.receivers = deque()
+            for receiver in receivers:
+                if not receiver.done():
+                    receiver.set_exception(EndOfChannelError())
+
+    async def aclose(self) -> None:
+        """Close this handle."""
+        self.close()
+
+    def statistics(self) -> ChannelStatistics:
+        """Return a snapshot of the state of the channel."""
+        return _statistics(self._state)
+
+    def __enter__(self) -> MemorySendChannel[T]:
+        return self
+
+    def __exit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> MemorySendChannel[T]:
+        return self
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class MemoryReceiveChannel(Generic[T]):
+    """The receiving end of a memory channel.
+
+    Create using `open_memory_channel()`. Iterating over it receives values
+    until the channel ends.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, state: _State[T]) -> None:
+        self._state = state
+        self._closed = False
+        # Futures of the tasks blocked receiving through this handle.
+        self._waiting: set[Future[T]] = set()
+        state.open_receive_channels += 1
+
+    def receive_nowait(self) -> T:
+        """Receive a value without blocking.
+
+        Raises:
+            QueueEmpty: If no value is available.
+        """
+        if self._closed:
+            raise ChannelClosedError()
+        state = self._state
+        if state.buffer:
+            value = state.buffer.popleft()
+            sender = _pop_sender(state)
+            if sender is not None:
+                # Make room for a blocked sender.
+                state.buffer.append(sender[1])
+            return value
+        sender = _pop_sender(state)
+        if sender is not None:
+            return sender[1]
+        if not state.open_send_channels:
+            raise EndOfChannelError()
+        raise QueueEmpty()
+
+    async def receive(self) -> T:
+        """Receive a value, waiting for one if necessary.
+
+        If the receive is cancelled, no value was received.
+
+        Raises:
+            EndOfChannelError: If the channel is drained and all send handles
+                are closed.
+        """
+        try:
+            return self.receive_nowait()
+        except QueueEmpty:
+            pass
+
+        fut: Future[T] = get_running_loop().create_future()
+        state = self._state
+        state.receivers.append(fut)
+        self._waiting.add(fut)
+        try:
+            return await fut
+        except CancelledError as exc:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                # A sender handed us a value just before we were cancelled.
+                _redeliver(exc)
+                return fut.result()
+            with suppress(ValueError):
+                state.receivers.remove(fut)
+            raise
+        finally:
+            self._waiting.discard(fut)
+
+    def clone(self) -> MemoryReceiveChannel[T]:
+        """Return another receive handle to the same channel.
+
+        Every value is received through exactly one of the handles.
+        """
+        if self._closed:
+            raise ChannelClosedError()
+        return MemoryReceiveChannel(self._state)
+
+    def close(self) -> None:
+        """Close this handle.
+
+        Tasks blocked receiving through it get `ChannelClosedError`. If this is
+        the last open receive handle, the buffer is dropped and senders get
+        `BrokenChannelError`.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        state = self._state
+        for fut in self._waiting:
+            if not fut.done():
+                state.receivers = deque(r for r in state.receivers if r is not fut)
+                fut.set_exception(ChannelClosedError())
+        state.open_receive_channels -= 1
+        if not state.open_receive_channels:
+            state.buffer.clear()
+            senders = state.senders
+            state.senders = deque()
+            for sender, _ in senders:
+                if not sender.done():
+                    sender.set_exception(BrokenChannelError())
+
+    async def aclose(self) -> None:
+        """Close this handle."""
+        self.close()
+
+    def statistics(self) -> ChannelStatistics:
+        """Return a snapshot of the state of the channel."""
+        return _statistics(self._state)
+
+    def __aiter__(self) -> MemoryReceiveChannel[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            return await self.receive()
+        except EndOfChannelError:
+            raise StopAsyncIteration from None
+
+    def __enter__(self) -> MemoryReceiveChannel[T]:
+        return self
+
+    def __exit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> MemoryReceiveChannel[T]:
+        return self
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _pop_sender(state: _State[T]) -> tuple[Future[None], T] | None:
+    """Take the value of the first blocked sender, waking it up."""
+    senders = state.senders
+    while senders:
+        sender = senders.popleft()
+        # Cancelled senders are removed only once they run.
+        if not sender[0].done():
+            sender[0].set_result(None)
+            return sender
+    return None
+
+
+def _statistics(state: _State[Any]) -> ChannelStatistics:
+    return ChannelStatistics(
+        len(state.buffer),
+        state.max_buffer_size,
+        state.open_send_channels,
+        state.open_receive_channels,
+        len(state.senders),
+        len(state.receivers),
+    )
+
+
+def open_memory_channel(
+    max_buffer_size: float,
+) -> tuple[MemorySendChannel[Any], MemoryReceiveChannel[Any]]:
+    """Open a channel for passing values between tasks, in memory.
+
+    Like Trio's memory channels: sends wait while the buffer is full, and both
+    ends can be cloned for many producers and consumers. The channel ends when
+    all send handles are closed, and breaks when all receive handles are
+    closed.
+
+    Sends and receives are cancellation-safe: if one raises `CancelledError`,
+    the value was not transferred.
+
+    Args:
+        max_buffer_size: How many values can be buffered. `0` means every send
+            waits for a receiver; `math.inf` means unbounded.
+
+    Example:
+        >>> send, receive = open_memory_channel(10)
+        >>> async with TaskGroup() as tg:
+        ...     tg.create_task(producer(send))
+        ...     async for value in receive:
+        ...         ...
+
+    .. versionadded:: 26.2.0
+    """
+    if max_buffer_size != inf and (
+        max_buffer_size < 0 or int(max_buffer_size) != max_buffer_size
+    ):
+        raise ValueError("max_buffer_size must be a non-negative int or math.inf")
+    state: _State[Any] = _State(max_buffer_size)
+    return MemorySendChannel(state), MemoryReceiveChannel(state)
@@ -0,0 +1,111 @@
+"""Cheap cooperative checkpoints for CPU-heavy coroutines."""
+
+from __future__ import annotations
+
+import sys
+from asyncio import Task, current_task
+from collections.abc import AsyncIterator, Awaitable, Generator, Iterable
+from threading import local
+from time import perf_counter
+from typing import Any, Final, TypeVar
+
+__all__ = ["checkpoint", "checkpointed"]
+
+T = TypeVar("T")
+
+DEFAULT_BUDGET: Final = 0.005
+
+
+class _Slice(local):
+    """The time slice of the task last seen checkpointing, per thread."""
+
+    task: Task[Any] | None = None
+    start: float = 0.0
+
+
+_slice: Final = _Slice()
+
+
+# Exhausted iterators stay exhausted, so one can be shared.
+_DONE: Final = iter(())
+
+
+class _Skip:
+    """An awaitable finishing immediately, without yielding."""
+
+    __slots__ = ()
+
+    def __await__(self) -> Generator[None, None, None]:
+        return _DONE  # type: ignore[return-value]
+
+
+class _Yield:
+    """An awaitable yielding to the event loop once, like `sleep(0)`."""
+
+    __slots__ = ()
+
+    def __await__(self) -> Generator[None, None, None]:
+        # A bare yield makes the task reschedule itself.
+        yield
+        _slice.start = perf_counter()
+
+
+_SKIP: Final = _Skip()
+_YIELD: Final = _Yield()
+
+
+if sys.version_info >= (3, 11):
+
+    def _cancel_pending(task: Task[Any]) -> bool:
+        return task.cancelling() > 0
+
+else:
+
+    def _cancel_pending(task: Task[Any]) -> bool:
+        return task._must_cancel  # type: ignore[attr-defined]
+
+
+def checkpoint(budget: float = DEFAULT_BUDGET) -> Awaitable[None]:
+    """Yield to the event loop, but only if the current task is due.
+
+    The current task is due when it has run for longer than `budget`
+    seconds since its last checkpoint that yielded, or when a cancellation
+    of it is pending, like after a cancel scope around it was cancelled.
+    Otherwise, awaiting the result does nothing, so calling this in every
+    iteration of a CPU-heavy loop is cheap, unlike `await asyncio.sleep(0)`.
+
+    Deadlines expiring during a time slice are only noticed by the event
+    loop when the task yields, so cancel scopes around the task fire at
+    most `budget` seconds late.
+
+    The time slice of a task starts at its first checkpoint since another
+    task checkpointed in the same thread, so a task may yield once sooner
+    after having awaited something else.
+
+    .. versionadded:: 26.2.0
+    """
+    task = current_task()
+    if task is None:
+        return _SKIP
+    now = perf_counter()
+    state = _slice
+    if task is not state.task:
+        state.task = task
+        state.start = now
+    elif now - state.start >= budget:
+        return _YIELD
+    if _cancel_pending(task):
+        return _YIELD
+    return _SKIP
+
+
+async def checkpointed(
+    iterable: Iterable[T], budget: float = DEFAULT_BUDGET
+) -> AsyncIterator[T]:
+    """Iterate over `iterable`, with a `checkpoint()` after every item.
+
+    .. versionadded:: 26.2.0
+    """
+    for item in iterable:
+        yield item
+        await checkpoint(budget)
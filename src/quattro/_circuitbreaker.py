@@ -0,0 +1,158 @@
+"""Circuit breakers."""
+
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from collections.abc import Awaitable, Callable
+from typing import Literal, TypeVar
+
+from attrs import define, field
+
+from ._cancelscope import CancelScope, fail_after
+
+__all__ = ["CircuitBreaker", "CircuitOpenError"]
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit breaker."""
+
+
+@define(eq=False)
+class CircuitBreaker:
+    """Fails fast while a dependency is failing.
+
+    The breaker starts out closed. After `failure_threshold` consecutive
+    failures, it opens and rejects all calls with `CircuitOpenError`.
+    After `reset_timeout` seconds, it goes half-open and lets a single trial
+    call through: if it succeeds, the breaker closes again; if not, it reopens.
+
+    Calls are guarded using `guard()` or `call()`, or by passing the breaker
+    to a `TaskGroup` or `gather()`.
+
+    Args:
+        failure_threshold: How many consecutive failures open the breaker.
+        reset_timeout: How long the breaker stays open, in seconds.
+        timeout: When provided, every guarded call runs in a `fail_after` scope
+            with this timeout, and timeouts count as failures.
+        failure_types: Exception types that count as failures.
+        name: Used as the label of the timeout cancel scopes.
+
+    .. versionadded:: 26.2.0
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    timeout: float | None = None
+    failure_types: type[BaseException] | tuple[type[BaseException], ...] = Exception
+    name: str | None = None
+
+    successes: int = field(default=0, init=False)
+    """How many guarded calls succeeded."""
+    failures: int = field(default=0, init=False)
+    """How many guarded calls failed, including timeouts."""
+    timeouts: int = field(default=0, init=False)
+    """How many guarded calls timed out."""
+    rejections: int = field(default=0, init=False)
+    """How many calls were rejected while the breaker was open."""
+
+    _state: Literal["closed", "open", "half_open"] = field(default="closed", init=False)
+    _consecutive_failures: int = field(default=0, init=False)
+    _opened_at: float = field(default=0.0, init=False)
+    _trial_running: bool = field(default=False, init=False)
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        """The current state of the breaker."""
+        if (
+            self._state == "open"
+            and get_running_loop().time() >= self._opened_at + self.reset_timeout
+        ):
+            self._state = "half_open"
+        return self._state
+
+    def guard(self) -> _Guard:
+        """Return a context manager guarding the code inside it.
+
+        Entering the context manager raises `CircuitOpenError` if the breaker
+        is open.
+        """
+        return _Guard(self)
+
+    async def call(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await `factory()` under the guard of this breaker."""
+        with self.guard():
+            return await factory()
+
+    def record_success(self) -> None:
+        """Record a successful call made outside of a guard."""
+        self.successes += 1
+        if self._state != "open":
+            self._state = "closed"
+            self._consecutive_failures = 0
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Record a failed call made outside of a guard."""
+        self.failures += 1
+        if self._state == "open":
+            return
+        self._consecutive_failures += 1
+        if (
+            self._state == "half_open"
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            self._state = "open"
+            self._opened_at = get_running_loop().time()
+            self._trial_running = False
+
+    def _check(self) -> None:
+        """Fail fast if the breaker is open, without claiming a trial call."""
+        if self.state == "open":
+            self.rejections += 1
+            raise CircuitOpenError(self.name)
+
+    def _admit(self) -> bool:
+        """Admit a call, returning whether it is a half-open trial call."""
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_running):
+            self.rejections += 1
+            raise CircuitOpenError(self.name)
+        if state == "half_open":
+            self._trial_running = True
+            return True
+        return False
+
+
+class _Guard:
+    __slots__ = ("_breaker", "_scope", "_trial")
+
+    def __init__(self, breaker: CircuitBreaker) -> None:
+        self._breaker = breaker
+
+    def __enter__(self) -> CancelScope:
+        breaker = self._breaker
+        self._trial = breaker._admit()
+        self._scope = (
+            CancelScope(label=breaker.name)
+            if breaker.timeout is None
+            else fail_after(breaker.timeout, label=breaker.name)
+        )
+        return self._scope.__enter__()
+
+    def __exit__(self, exc_type, exc_val, tb) -> bool | None:
+        try:
+            return self._scope.__exit__(exc_type, exc_val, tb)
+        finally:
+            breaker = self._breaker
+            if self._scope.cancelled_caught:
+                breaker.timeouts += 1
+                breaker.record_failure()
+            elif exc_type is None:
+                breaker.record_success()
+            elif issubclass(exc_type, breaker.failure_types):
+                breaker.record_failure()
+            elif self._trial:
+                # Neither a success nor a failure, like an outside cancellation.
+                breaker._trial_running = False
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Coroutine
-from typing import Any, Literal, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar, overload
 
 from ._taskgroup import TaskGroup
 
+if TYPE_CHECKING:
+    from ._circuitbreaker import CircuitBreaker
+    from ._loadshedding import LoadShedder
+    from ._processlimiter import ProcessLimiter
+    from ._sync import CapacityLimiter, Semaphore
+
 # Type hints taken from https://github.com/python/typeshed/blob/main/stdlib/asyncio/tasks.pyi,
 # bless their hearts.
 _T = TypeVar("_T")
@@ -16,6 +22,16 @@ _T3 = TypeVar("_T3")
 _T4 = TypeVar("_T4")
 _T5 = TypeVar("_T5")
 _T6 = TypeVar("_T6")
+_T_contra = TypeVar("_T_contra", contravariant=True)
+
+
+class _Buffer(Protocol[_T_contra]):
+    def __len__(self) -> int: ...
+
+    def __setitem__(self, index: int, value: _T_contra, /) -> None: ...
+
+
+_B = TypeVar("_B", bound=_Buffer[Any])
 
 
 @overload
@@ -23,7 +39,10 @@ async def gather(  # type: ignore[overload-overlap]
     coro: Coroutine[Any, Any, _T1],
     *,
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1]: ...
 
 
@@ -33,7 +52,10 @@ async def gather(  # type: ignore[overload-overlap]
     __coro_or_future2: Coroutine[Any, Any, _T2],
     *,
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1, _T2]: ...
 
 
@@ -44,7 +66,10 @@ async def gather(  # type: ignore[overload-overlap]
     __coro_or_future3: Coroutine[Any, Any, _T3],
     *,
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1, _T2, _T3]: ...
 
 
@@ -56,7 +81,10 @@ async def gather(  # type: ignore[overload-overlap]
     __coro_or_future4: Coroutine[Any, Any, _T4],
     *,
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1, _T2, _T3, _T4]: ...
 
 
@@ -69,7 +97,10 @@ async def gather(  # type: ignore[overload-overlap]
     __coro_or_future5: Coroutine[Any, Any, _T5],
     *,
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1, _T2, _T3, _T4, _T5]: ...
 
 
@@ -83,7 +114,10 @@ async def gather(  # type: ignore[overload-overlap]
     __coro_or_future6: Coroutine[Any, Any, _T6],
     *,
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1, _T2, _T3, _T4, _T5, _T6]: ...
 
 
@@ -91,7 +125,10 @@ async def gather(  # type: ignore[overload-overlap]
 async def gather(  # type: ignore[overload-overlap]
     *coros_or_futures: Coroutine[Any, Any, _T],
     return_exceptions: Literal[False] = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> list[_T]: ...
 
 
@@ -100,7 +137,10 @@ async def gather(
     __coro_or_future1: Coroutine[Any, Any, _T1],
     *,
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1 | BaseException]: ...
 
 
@@ -110,7 +150,10 @@ async def gather(
     __coro_or_future2: Coroutine[Any, Any, _T2],
     *,
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1 | BaseException, _T2 | BaseException]: ...
 
 
@@ -121,7 +164,10 @@ async def gather(
     __coro_or_future3: Coroutine[Any, Any, _T3],
     *,
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[_T1 | BaseException, _T2 | BaseException, _T3 | BaseException]: ...
 
 
@@ -133,7 +179,10 @@ async def gather(
     __coro_or_future4: Coroutine[Any, Any, _T4],
     *,
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[
     _T1 | BaseException,
     _T2 | BaseException,
@@ -151,7 +200,10 @@ async def gather(
     __coro_or_future5: Coroutine[Any, Any, _T5],
     *,
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[
     _T1 | BaseException,
     _T2 | BaseException,
@@ -171,7 +223,10 @@ async def gather(
     __coro_or_future6: Coroutine[Any, Any, _T6],
     *,
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple[
     _T1 | BaseException,
     _T2 | BaseException,
@@ -186,14 +241,20 @@ async def gather(
 async def gather(
     *coros_or_futures: Coroutine[Any, Any, _T],
     return_exceptions: bool,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> list[_T | BaseException]: ...
 
 
 async def gather(  # type: ignore[misc]
     *coros: Coroutine,
     return_exceptions: bool = False,
-    concurrency_limit: int | None = None,
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
 ) -> tuple:
     """A safer version of `asyncio.gather`.
 
@@ -202,7 +263,18 @@ async def gather(  # type: ignore[misc]
 
     Args:
         concurrency_limit: When provided, limit the number of parallel tasks to this
-            number.
+            number. A `quattro.Semaphore`, a `quattro.CapacityLimiter` or a
+            `quattro.ProcessLimiter` can be provided instead, to share the
+            limit with other calls, task groups and processes.
+        circuit_breaker: When provided, child tasks run under the guard of this
+            circuit breaker. While it is open, children fail fast with
+            `CircuitOpenError`.
+        load_shedder: When provided, child tasks that cannot be expected to
+            finish before the effective deadline fail with `LoadShedError`
+            instead of running.
+        eager: When true on Python 3.12+, child tasks start running eagerly,
+            and children finishing without blocking never reach the event
+            loop.
 
     Notable differences are:
 
@@ -220,22 +292,75 @@ async def gather(  # type: ignore[misc]
     .. versionadded:: 23.1.0
     .. versionchanged:: 26.1.0
         Added the `concurrency_limit` parameter.
+    .. versionchanged:: 26.2.0
+        Added the `circuit_breaker` parameter.
+    .. versionchanged:: 26.2.0
+        Added the `load_shedder` parameter.
+    .. versionchanged:: 26.2.0
+        Added the `eager` parameter.
+    .. versionchanged:: 26.2.0
+        `concurrency_limit` accepts deadline-aware primitives.
     """
     if not coros:
         return ()
 
-    async with TaskGroup(concurrency_limit=concurrency_limit) as tg:
+    async with TaskGroup(
+        concurrency_limit=concurrency_limit,
+        circuit_breaker=circuit_breaker,
+        load_shedder=load_shedder,
+        eager=eager,
+    ) as tg:
         subtasks = [
-            tg.create_task(coro if not return_exceptions else _wrap_coro(coro))
-            for coro in coros
+            tg._create_task(coro, None, None, return_exceptions) for coro in coros
         ]
 
-    return tuple([await f for f in subtasks])
+    # The tasks are done, so there is no need to await them again.
+    return tuple([f.result() for f in subtasks])
+
 
+async def gather_into(
+    buffer: _B,
+    *coros: Coroutine[Any, Any, Any],
+    concurrency_limit: int | Semaphore | CapacityLimiter | ProcessLimiter | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    load_shedder: LoadShedder | None = None,
+    eager: bool = False,
+) -> _B:
+    """Like `gather`, but store the results into `buffer`, by position.
 
-async def _wrap_coro(coro: Coroutine[Any, Any, _T]) -> _T | BaseException:
-    """Adapt a raised exception into the return value."""
-    try:
-        return await coro
-    except BaseException as exc:
-        return exc
+    The buffer can be anything supporting `len()` and item assignment, like a
+    `list`, an `array.array` or a NumPy array, and needs to have room for all
+    results. Every result is written into its slot as soon as its task
+    finishes, without building intermediate containers.
+
+    Exceptions in child tasks propagate like in `gather` without
+    `return_exceptions`; slots of failed tasks are left alone.
+
+    Returns:
+        The buffer.
+
+    Example:
+        >>> from array import array
+        >>> prices = array("d", bytes(8 * len(ids)))
+        >>> await gather_into(prices, *map(fetch_price, ids))
+
+    .. versionadded:: 26.2.0
+    """
+    if len(buffer) < len(coros):
+        for coro in coros:
+            # Prevent warnings about them never being awaited.
+            coro.close()
+        raise ValueError(f"buffer too small for {len(coros)} results")
+    if not coros:
+        return buffer
+
+    async with TaskGroup(
+        concurrency_limit=concurrency_limit,
+        circuit_breaker=circuit_breaker,
+        load_shedder=load_shedder,
+        eager=eager,
+    ) as tg:
+        for ix, coro in enumerate(coros):
+            tg._create_task(coro, None, None, False, buffer, ix)
+
+    return buffer
@@ -0,0 +1,201 @@
+"""Live introspection of structured concurrency state."""
+
+from __future__ import annotations
+
+import json
+from asyncio import AbstractEventLoop, Task, current_task, get_running_loop
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from attrs import frozen
+
+from ._cancelscope import CancelScope, _ScopeObserver
+from ._cancelscope import _add_observer as _add_scope_observer
+from ._cancelscope import _remove_observer as _remove_scope_observer
+from ._taskgroup import TaskGroup, _GroupObserver
+from ._taskgroup import _add_observer as _add_group_observer
+from ._taskgroup import _remove_observer as _remove_group_observer
+
+__all__ = ["TaskTreeRegistry"]
+
+
+@frozen
+class _GroupInfo:
+    loop: AbstractEventLoop
+    parent_task: Task | None
+    entered_at: float
+
+
+class TaskTreeRegistry(_ScopeObserver, _GroupObserver):
+    """Tracks live task groups, their children and cancel scopes.
+
+    The registry only holds weak references, and only tracks task groups
+    entered and cancel scopes entered while it is installed.
+
+    Every task lists the cancel scopes it entered itself, outermost first;
+    scopes inherited from the task that created it are listed under that task.
+
+    `snapshot()` reads live task group state, so call it from the event loop
+    thread, for example from a debug endpoint or a handler installed with
+    `loop.add_signal_handler()`. It is not safe to call from other threads.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self) -> None:
+        self._groups: WeakKeyDictionary[TaskGroup, _GroupInfo] = WeakKeyDictionary()
+        self._tasks: WeakKeyDictionary[Task, float] = WeakKeyDictionary()
+        # Cancel scopes are not hashable, so they are tracked with their
+        # entry times per task.
+        self._task_scopes: WeakKeyDictionary[Task, list[tuple[CancelScope, float]]] = (
+            WeakKeyDictionary()
+        )
+
+    def install(self) -> None:
+        """Start tracking task groups and cancel scopes."""
+        _add_scope_observer(self)
+        _add_group_observer(self)
+
+    def uninstall(self) -> None:
+        """Stop tracking, and forget everything tracked so far."""
+        _remove_scope_observer(self)
+        _remove_group_observer(self)
+        self._groups.clear()
+        self._tasks.clear()
+        self._task_scopes.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current task tree as a JSON-serializable dictionary.
+
+        Task groups started from a child of another task group are nested
+        under that child.
+
+        Must be called from the event loop thread.
+        """
+        groups = list(self._groups.items())
+        child_of = {}
+        for group, _ in groups:
+            for task in (*group._tasks, *group._bg_tasks):
+                child_of[task] = group
+
+        nested: dict[Task, list[tuple[TaskGroup, _GroupInfo]]] = {}
+        roots = []
+        for group, info in groups:
+            parent = info.parent_task
+            if parent is not None and parent in child_of:
+                nested.setdefault(parent, []).append((group, info))
+            else:
+                roots.append((group, info))
+
+        return {
+            "groups": [self._dump_group(group, info, nested) for group, info in roots]
+        }
+
+    def dump_json(self, **kwargs: Any) -> str:
+        """Return the snapshot as a JSON string.
+
+        Keyword arguments are passed to `json.dumps`.
+        """
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def _dump_group(
+        self,
+        group: TaskGroup,
+        info: _GroupInfo,
+        nested: dict[Task, list[tuple[TaskGroup, _GroupInfo]]],
+    ) -> dict[str, Any]:
+        now = info.loop.time()
+        bg_tasks = set(group._bg_tasks)
+        waiting = set(group._waiting)
+        return {
+            "id": id(group),
+            "age": now - info.entered_at,
+            "parent_task": _task_name(info.parent_task),
+            "concurrency_limit": group._concurrency_limit,
+            "tasks": [
+                self._dump_task(task, now, task in waiting, nested)
+                for task in list(group._tasks)
+                if task not in bg_tasks
+            ],
+            "background_tasks": [
+                self._dump_task(task, now, False, nested) for task in bg_tasks
+            ],
+        }
+
+    def _dump_task(
+        self,
+        task: Task,
+        now: float,
+        waiting: bool,
+        nested: dict[Task, list[tuple[TaskGroup, _GroupInfo]]],
+    ) -> dict[str, Any]:
+        created = self._tasks.get(task)
+        if task.done():
+            state = "done"
+        elif waiting:
+            state = "waiting_for_slot"
+        else:
+            state = "running"
+        return {
+            "name": task.get_name(),
+            "id": id(task),
+            "age": None if created is None else now - created,
+            "state": state,
+            "cancel_scopes": [
+                _dump_scope(scope, entered, now)
+                for scope, entered in list(self._task_scopes.get(task, ()))
+            ],
+            "groups": [
+                self._dump_group(group, info, nested)
+                for group, info in nested.get(task, ())
+            ],
+        }
+
+    def group_entered(self, group: TaskGroup) -> None:
+        loop = get_running_loop()
+        self._groups[group] = _GroupInfo(loop, current_task(), loop.time())
+
+    def group_task_created(
+        self, group: TaskGroup, task: Task, background: bool
+    ) -> None:
+        self._tasks[task] = task.get_loop().time()
+
+    def group_exited(self, group: TaskGroup) -> None:
+        self._groups.pop(group, None)
+
+    def scope_entered(self, scope: CancelScope) -> None:
+        task = scope._current_task
+        if isinstance(task, Task):
+            self._task_scopes.setdefault(task, []).append(
+                (scope, task.get_loop().time())
+            )
+
+    def scope_exited(self, scope: CancelScope) -> None:
+        # Scopes are exited in the task that entered them.
+        task = current_task()
+        if task is None:
+            return
+        scopes = self._task_scopes.get(task)
+        if not scopes:
+            return
+        for ix in range(len(scopes) - 1, -1, -1):
+            if scopes[ix][0] is scope:
+                del scopes[ix]
+                break
+        if not scopes:
+            del self._task_scopes[task]
+
+
+def _task_name(task: Task | None) -> str | None:
+    return None if task is None else task.get_name()
+
+
+def _dump_scope(scope: CancelScope, entered: float, now: float) -> dict[str, Any]:
+    deadline = scope.deadline
+    return {
+        "label": scope.label,
+        "deadline": deadline,
+        "remaining": None if deadline is None else deadline - now,
+        "age": now - entered,
+        "cancel_called": scope._cancel_status == "called",
+    }
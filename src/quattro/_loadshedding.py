@@ -0,0 +1,87 @@
+"""Deadline-based load shedding."""
+
+from __future__ import annotations
+
+from asyncio import TimeoutError, get_running_loop
+from bisect import bisect_left, insort
+from collections import deque
+
+from attrs import define, field
+
+from ._cancelscope import get_current_effective_deadline
+
+__all__ = ["LoadShedError", "LoadShedder"]
+
+
+class LoadShedError(TimeoutError):
+    """Raised instead of running a task that could not meet its deadline."""
+
+
+@define(eq=False)
+class LoadShedder:
+    """Drops tasks that cannot finish before their deadline.
+
+    Pass it to a `TaskGroup` or `gather()` using `load_shedder`. Before a
+    child task starts running, and before it queues for a concurrency slot,
+    the shedder checks the current effective deadline of the task: if it has
+    passed, or is closer than the median run time of recent children, the
+    child fails with `LoadShedError` without running.
+
+    Share a shedder between calls to keep the run time history.
+
+    Args:
+        window: How many recent run times the median is taken over.
+        min_samples: How many run times are needed before the median is used;
+            until then, only children whose deadline passed are dropped.
+
+    .. versionadded:: 26.2.0
+    """
+
+    window: int = 100
+    min_samples: int = 5
+
+    admitted: int = field(default=0, init=False)
+    """How many children were allowed to run."""
+    shed: int = field(default=0, init=False)
+    """How many children were dropped."""
+
+    _run_times: deque[float] = field(init=False)
+    # The same run times, kept sorted so the median is cheap on the hot path.
+    _sorted: list[float] = field(factory=list, init=False)
+
+    @_run_times.default
+    def _default_run_times(self) -> deque[float]:
+        return deque(maxlen=self.window)
+
+    @property
+    def median_run_time(self) -> float | None:
+        """The median run time of recent children, if known."""
+        run_times = self._sorted
+        n = len(run_times)
+        if n < self.min_samples or not n:
+            return None
+        mid = n // 2
+        if n % 2:
+            return run_times[mid]
+        return (run_times[mid - 1] + run_times[mid]) / 2
+
+    def _check(self) -> None:
+        """Fail if the current task cannot be expected to meet its deadline."""
+        deadline = get_current_effective_deadline()
+        if deadline == float("inf"):
+            return
+        now = get_running_loop().time()
+        expected = self.median_run_time
+        if now >= deadline or (expected is not None and now + expected > deadline):
+            self.shed += 1
+            raise LoadShedError()
+
+    def _record(self, run_time: float) -> None:
+        run_times = self._run_times
+        if run_times.maxlen == 0:
+            return
+        if len(run_times) == run_times.maxlen:
+            # The oldest run time drops out of the window.
+            del self._sorted[bisect_left(self._sorted, run_times[0])]
+        run_times.append(run_time)
+        insort(self._sorted, run_time)
@@ -0,0 +1,252 @@
+"""Running coroutines on a pool of event loops."""
+
+from __future__ import annotations
+
+import os
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Future,
+    Task,
+    get_running_loop,
+    new_event_loop,
+    shield,
+    wrap_future,
+)
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+from multiprocessing.context import BaseContext
+from threading import Thread
+from types import TracebackType
+from typing import Any, ParamSpec, TypeVar
+
+from ._cancelscope import fail_after, get_current_effective_deadline
+
+__all__ = ["LoopPool"]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class _Job:
+    """A coroutine running on a shard, driven from the caller's loop."""
+
+    __slots__ = ("done", "task")
+
+    def __init__(self, done: Future[Any]) -> None:
+        # Resolved in the caller's loop, with the outcome.
+        self.done = done
+        # Only touched from the shard's loop.
+        self.task: Task[Any] | None = None
+
+
+class _Shard:
+    """An event loop running in its own thread."""
+
+    def __init__(self, name: str) -> None:
+        self.loop = new_event_loop()
+        self.thread = Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self.thread.start()
+        # Jobs in flight, for balancing.
+        self.load = 0
+
+    def start(self, job: _Job, coro: Coroutine[Any, Any, Any]) -> None:
+        # Runs in the shard thread.
+        job.task = task = self.loop.create_task(coro)
+        task.add_done_callback(lambda t: _report(job.done, t))
+
+    def cancel(self, job: _Job) -> None:
+        # Runs in the shard thread, always after `start()`.
+        assert job.task is not None
+        job.task.cancel()
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class LoopPool:
+    """A pool of event loops, for running coroutines on several cores.
+
+    Each worker runs its own event loop, in a thread or in a process.
+    `run()` sends a coroutine function to the least busy worker, and waits
+    for its result in the current loop. Use it with a `TaskGroup` or
+    `gather()` to fan work out across the workers in a structured way; errors
+    propagate as usual, and cancelling a call cancels the coroutine in its
+    worker.
+
+    Threads only run Python code in parallel on free-threaded builds of
+    Python. Elsewhere, use `processes=True`; coroutine functions and their
+    arguments need to be picklable then, and calls are run one at a time per
+    worker process.
+
+    Args:
+        workers: The number of workers. Defaults to the number of CPUs.
+        processes: Whether the workers are processes instead of threads.
+        mp_context: With `processes`, the multiprocessing context for
+            starting the workers.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        processes: bool = False,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self._closed = False
+        self._shards: list[_Shard] = []
+        self._executor: ProcessPoolExecutor | None = None
+        if processes:
+            self._executor = ProcessPoolExecutor(workers, mp_context=mp_context)
+        else:
+            self._shards = [_Shard(f"quattro-loop-pool-{ix}") for ix in range(workers)]
+
+    async def run(
+        self,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Run `func(*args, **kwargs)` on a worker loop, and return its result.
+
+        The current effective deadline applies in the worker too, like with
+        `fail_after`.
+
+        Cancelling the call cancels the coroutine in the worker, and waits for
+        it to finish. Calls already running in worker processes cannot be
+        cancelled; they are waited for instead.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+        """
+        if self._closed:
+            raise RuntimeError("LoopPool is closed")
+        loop = get_running_loop()
+        deadline = get_current_effective_deadline()
+        timeout = None if deadline == inf else max(deadline - loop.time(), 0.0)
+
+        if self._executor is not None:
+            cf = self._executor.submit(_run_in_process, func, args, kwargs, timeout)
+            fut = wrap_future(cf)
+            try:
+                return await shield(fut)
+            except CancelledError:
+                if not cf.cancel():
+                    await _wait(fut)
+                raise
+
+        shard = min(self._shards, key=lambda s: s.load)
+        job = _Job(loop.create_future())
+        coro = _run_with_timeout(func, args, kwargs, timeout)
+        shard.load += 1
+        try:
+            try:
+                shard.loop.call_soon_threadsafe(shard.start, job, coro)
+            except BaseException:
+                # The coroutine will never run.
+                coro.close()
+                raise
+            try:
+                return await shield(job.done)
+            except CancelledError:
+                shard.loop.call_soon_threadsafe(shard.cancel, job)
+                await _wait(job.done)
+                raise
+        finally:
+            shard.load -= 1
+
+    def close(self) -> None:
+        """Stop the workers.
+
+        Calls still in flight should be waited for first.
+        """
+        self._closed = True
+        for shard in self._shards:
+            shard.stop()
+        self._shards = []
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self) -> LoopPool:
+        return self
+
+    def __exit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+async def _run_with_timeout(
+    func: Callable[..., Coroutine[Any, Any, T]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    timeout: float | None,
+) -> T:
+    if timeout is None:
+        return await func(*args, **kwargs)
+    with fail_after(timeout):
+        return await func(*args, **kwargs)
+
+
+async def _wait(fut: Future[Any]) -> None:
+    """Wait for `fut` to finish, ignoring its outcome."""
+    while not fut.done():
+        try:
+            await shield(fut)
+        except CancelledError:
+            # Cancelled again while waiting; we are cancelled already.
+            continue
+        except BaseException:
+            return
+
+
+def _report(done: Future[Any], task: Task[Any]) -> None:
+    # Runs in the shard thread.
+    exc: BaseException | None
+    if task.cancelled():
+        result, exc = None, CancelledError()
+    elif (exc := task.exception()) is None:
+        result = task.result()
+    else:
+        result = None
+    done.get_loop().call_soon_threadsafe(_set_outcome, done, result, exc)
+
+
+def _set_outcome(done: Future[Any], result: Any, exc: BaseException | None) -> None:
+    if isinstance(exc, CancelledError):
+        done.cancel()
+    elif exc is not None:
+        done.set_exception(exc)
+    else:
+        done.set_result(result)
+
+
+# The event loop of a worker process.
+_process_loop: AbstractEventLoop | None = None
+
+
+def _run_in_process(
+    func: Callable[..., Coroutine[Any, Any, T]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    timeout: float | None,
+) -> T:
+    global _process_loop
+    if _process_loop is None:
+        _process_loop = new_event_loop()
+    return _process_loop.run_until_complete(
+        _run_with_timeout(func, args, kwargs, timeout)
+    )
@@ -0,0 +1,210 @@
+"""Detection of cancel scopes that overshoot their deadlines."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from asyncio import current_task, get_running_loop
+from collections import deque
+from collections.abc import Callable
+from heapq import heapify, heappop, heappush
+from math import inf
+from threading import Condition, Thread, get_ident
+from time import monotonic
+from traceback import format_stack
+from typing import TYPE_CHECKING, Final
+
+from attrs import define, frozen
+
+from ._cancelscope import _add_observer, _remove_observer, _ScopeObserver
+
+if TYPE_CHECKING:
+    from ._cancelscope import CancelScope
+
+__all__ = ["OverdueDetector", "OverdueReport"]
+
+logger = logging.getLogger("quattro")
+
+# How many new entries can pile up before the watchdog purges finished ones.
+_PURGE_BATCH: Final = 1024
+
+
+@frozen
+class OverdueReport:
+    """A cancel scope that exited too long after its deadline."""
+
+    label: str | None
+    task_name: str | None
+    deadline: float
+    lag: float
+    """Seconds between the deadline and the scope exiting."""
+    cancelled_caught: bool
+    stack: tuple[str, ...] | None
+    """The event loop thread's stack once the scope became overdue.
+
+    This is where the loop was stuck while the cancellation could not be
+    delivered. `None` if the scope exited before it could be sampled.
+    """
+
+
+@define(eq=False)
+class _Entry:
+    # Dropped once the entry is done, so finished scopes are not kept alive.
+    scope: CancelScope | None
+    deadline: float
+    thread_id: int
+    stack: tuple[str, ...] | None = None
+    done: bool = False
+
+    def __lt__(self, other: _Entry) -> bool:
+        return self.deadline < other.deadline
+
+
+def _log_report(report: OverdueReport) -> None:
+    logger.warning(
+        "Cancel scope %r in task %r exited %.3fs after its deadline%s",
+        report.label,
+        report.task_name,
+        report.lag,
+        "" if report.stack is None else ":\n" + "".join(report.stack),
+    )
+
+
+class OverdueDetector(_ScopeObserver):
+    """Reports cancel scopes that exit more than `threshold` after their deadline.
+
+    A watchdog thread samples the event loop thread's stack as soon as an
+    active scope becomes overdue, pinpointing the code blocking the loop.
+
+    Args:
+        threshold: The allowed lag, in seconds.
+        reporter: Called with an `OverdueReport` for every overdue scope.
+            Logs a warning to the `quattro` logger by default.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        reporter: Callable[[OverdueReport], None] = _log_report,
+    ) -> None:
+        self.threshold = threshold
+        self.reporter = reporter
+        # Entries by `id(scope)`, since scopes are not hashable.
+        self._entries: dict[int, _Entry] = {}
+        # New entries, handed to the watchdog without locking.
+        self._incoming: deque[tuple[float, _Entry]] = deque()
+        # Only touched by the watchdog; due times are in monotonic time.
+        self._heap: list[tuple[float, _Entry]] = []
+        # When the watchdog wakes up next. Entries due earlier wake it up.
+        self._wake_at = inf
+        self._condition = Condition()
+        self._watchdog: Thread | None = None
+
+    def install(self) -> None:
+        """Start watching cancel scopes."""
+        with self._condition:
+            if self._watchdog is None:
+                self._watchdog = Thread(
+                    target=self._watch, name="quattro-overdue-watchdog", daemon=True
+                )
+                self._watchdog.start()
+        _add_observer(self)
+
+    def uninstall(self) -> None:
+        """Stop watching cancel scopes, and stop the watchdog thread."""
+        _remove_observer(self)
+        with self._condition:
+            watchdog = self._watchdog
+            self._watchdog = None
+            self._condition.notify()
+        if watchdog is not None:
+            watchdog.join()
+        self._heap.clear()
+        self._incoming.clear()
+        self._entries.clear()
+
+    def scope_timer_armed(self, scope: CancelScope) -> None:
+        deadline = scope.deadline
+        if deadline is None:
+            return
+        entry = _Entry(scope, deadline, get_ident())
+        old = self._entries.get(id(scope))
+        if old is not None:
+            old.done = True
+            old.scope = None
+        self._entries[id(scope)] = entry
+        due = deadline - get_running_loop().time() + monotonic() + self.threshold
+        incoming = self._incoming
+        incoming.append((due, entry))
+        # Only wake the watchdog if it would sleep past the new entry, or to
+        # let it purge finished entries.
+        if due < self._wake_at or len(incoming) >= _PURGE_BATCH:
+            with self._condition:
+                self._condition.notify()
+
+    def scope_timer_disarmed(self, scope: CancelScope) -> None:
+        if scope.deadline is None:
+            # The deadline was removed.
+            self._forget(scope)
+
+    def scope_exited(self, scope: CancelScope) -> None:
+        entry = self._forget(scope)
+        if entry is None:
+            return
+        deadline = scope.deadline
+        if deadline is None:
+            return
+        lag = get_running_loop().time() - deadline
+        if lag <= self.threshold:
+            return
+        task = current_task()
+        self.reporter(
+            OverdueReport(
+                scope.label,
+                None if task is None else task.get_name(),
+                deadline,
+                lag,
+                scope.cancelled_caught,
+                entry.stack,
+            )
+        )
+
+    def _forget(self, scope: CancelScope) -> _Entry | None:
+        entry = self._entries.pop(id(scope), None)
+        if entry is not None:
+            entry.done = True
+            entry.scope = None
+        return entry
+
+    def _watch(self) -> None:
+        me = self._watchdog
+        heap = self._heap
+        incoming = self._incoming
+        with self._condition:
+            while self._watchdog is me:
+                # Entries arriving from now on wake us up.
+                self._wake_at = inf
+                while incoming:
+                    heappush(heap, incoming.popleft())
+                if len(heap) > 2 * len(self._entries) + _PURGE_BATCH:
+                    # Mostly finished entries; drop them.
+                    heap[:] = [item for item in heap if not item[1].done]
+                    heapify(heap)
+
+                now = monotonic()
+                while heap and heap[0][0] <= now:
+                    _, entry = heappop(heap)
+                    scope = entry.scope
+                    if entry.done or scope is None or scope.deadline != entry.deadline:
+                        continue
+                    frame = sys._current_frames().get(entry.thread_id)
+                    if frame is not None:
+                        entry.stack = tuple(format_stack(frame))
+
+                if heap:
+                    self._wake_at = heap[0][0]
+                    self._condition.wait(self._wake_at - now)
+                else:
+                    self._condition.wait()
@@ -0,0 +1,166 @@
+"""Structured multi-stage pipelines."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from types import TracebackType
+from typing import Any
+
+from attrs import field, frozen
+
+from ._channels import MemoryReceiveChannel, MemorySendChannel, open_memory_channel
+from ._taskgroup import TaskGroup
+
+__all__ = ["Pipeline", "Stage", "pipeline"]
+
+
+def _at_least_one(_: Any, attribute: Any, value: int) -> None:
+    if value < 1:
+        raise ValueError(f"{attribute.name} must be >= 1")
+
+
+@frozen
+class Stage:
+    """A pipeline stage.
+
+    Args:
+        function: The coroutine function applied to every item.
+        concurrency: How many items this stage processes in parallel.
+            With more than one, items may be reordered.
+        buffer_size: The capacity of the buffer to the next stage.
+
+    .. versionadded:: 26.2.0
+    """
+
+    function: Callable[[Any], Awaitable[Any]]
+    concurrency: int = field(default=1, validator=_at_least_one)
+    buffer_size: int = field(default=1, validator=_at_least_one)
+
+
+class Pipeline:
+    """A running pipeline; an async iterator of results of the last stage.
+
+    Create using `pipeline()`.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Any] | AsyncIterable[Any],
+        stages: tuple[Stage, ...],
+        buffer_size: int,
+    ) -> None:
+        self._source = source
+        self._stages = stages
+        self._buffer_size = buffer_size
+        self._task_group: TaskGroup | None = None
+        self._output: MemoryReceiveChannel[Any] | None = None
+
+    async def __aenter__(self) -> Pipeline:
+        if self._task_group is not None:
+            raise RuntimeError("Pipeline already running")
+        tg = TaskGroup()
+        await tg.__aenter__()
+        self._task_group = tg
+
+        send, inbox = open_memory_channel(self._buffer_size)
+        tg.create_background_task(_feed(self._source, send))
+        for stage in self._stages:
+            send, outbox = open_memory_channel(stage.buffer_size)
+            # Every worker holds its own handles; a stage ends once all of its
+            # workers are done, closing the channel to the next stage.
+            with inbox, send:
+                for _ in range(stage.concurrency):
+                    tg.create_background_task(
+                        _work(stage.function, inbox.clone(), send.clone())
+                    )
+            inbox = outbox
+        self._output = inbox
+        return self
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        tg = self._task_group
+        output = self._output
+        assert tg is not None and output is not None
+        try:
+            # Stages still running are background tasks, and get cancelled here.
+            await tg.__aexit__(et, exc, tb)
+        finally:
+            output.close()
+
+    def __aiter__(self) -> Pipeline:
+        return self
+
+    async def __anext__(self) -> Any:
+        output = self._output
+        if output is None:
+            raise StopAsyncIteration
+        return await output.__anext__()
+
+
+async def _feed(
+    source: Iterable[Any] | AsyncIterable[Any], outbox: MemorySendChannel[Any]
+) -> None:
+    with outbox:
+        if isinstance(source, AsyncIterable):
+            async for item in source:
+                await outbox.send(item)
+        else:
+            for item in source:
+                await outbox.send(item)
+
+
+async def _work(
+    function: Callable[[Any], Awaitable[Any]],
+    inbox: MemoryReceiveChannel[Any],
+    outbox: MemorySendChannel[Any],
+) -> None:
+    with inbox, outbox:
+        async for item in inbox:
+            await outbox.send(await function(item))
+
+
+def pipeline(
+    source: Iterable[Any] | AsyncIterable[Any],
+    *stages: Stage | Callable[[Any], Awaitable[Any]],
+    buffer_size: int = 1,
+) -> Pipeline:
+    """Run items from `source` through a series of stages.
+
+    Every stage runs as background tasks of a single `TaskGroup`, connected to
+    the next stage with a bounded memory channel, so a slow stage applies
+    backpressure all the way to the source. Plain coroutine functions are used
+    as stages with a concurrency of 1.
+
+    Use the result as an async context manager, and iterate over it to get the
+    results of the last stage. If any stage raises, the whole pipeline is
+    cancelled and the errors are raised out of the context manager in an
+    exception group. Exiting the context manager early cancels the pipeline.
+
+    Args:
+        source: An iterable or async iterable of items.
+        buffer_size: The capacity of the buffer between the source and the
+            first stage.
+
+    Example:
+        >>> async with pipeline(
+        ...     urls, Stage(fetch, concurrency=8), parse, Stage(write, concurrency=2)
+        ... ) as results:
+        ...     async for result in results:
+        ...         print(result)
+
+    .. versionadded:: 26.2.0
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be >= 1")
+    return Pipeline(
+        source,
+        tuple(s if isinstance(s, Stage) else Stage(s) for s in stages),
+        buffer_size,
+    )
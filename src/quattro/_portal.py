@@ -0,0 +1,128 @@
+"""Submitting work into task groups from other threads."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, CancelledError, Task
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from contextvars import Context
+from functools import partial
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+from ._threadsafe import _call_soon_threadsafe
+
+if TYPE_CHECKING:
+    from ._taskgroup import TaskGroup
+
+__all__ = ["Portal"]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class Portal:
+    """A way into a running `TaskGroup` from other threads.
+
+    Create one with `TaskGroup.portal()`.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __slots__ = ("_context", "_group", "_loop")
+
+    def __init__(
+        self, group: TaskGroup, loop: AbstractEventLoop, context: Context
+    ) -> None:
+        self._group = group
+        self._loop = loop
+        self._context = context
+
+    def submit(
+        self,
+        func: Callable[P, Coroutine[Any, Any, T]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        """Run `func(*args, **kwargs)` as a child of the task group.
+
+        Safe to call from any thread but the one running the event loop of
+        the group, which would deadlock waiting for the result. `func` is
+        called in the event loop thread. Submissions made while the loop is
+        busy are batched, waking the loop up once.
+
+        The child is subject to the concurrency limit and the other
+        admission policies of the group, and is cancelled when the group is
+        aborted. Errors are set on the returned future, and do not abort the
+        group. Cancelling the future cancels the child.
+
+        Raises:
+            RuntimeError: If the event loop is closed.
+        """
+        fut: Future[T] = Future()
+        _call_soon_threadsafe(self._loop, self._start, fut, func, args, kwargs)
+        return fut
+
+    def _start(
+        self,
+        fut: Future[Any],
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        # Runs in the event loop thread.
+        if fut.cancelled():
+            return
+        context = self._context.copy()
+        coro = None
+        try:
+            coro = context.run(func, *args, **kwargs)
+            task = self._group._create_task(_resolve(fut, coro), None, context, True)
+        except BaseException as exc:
+            if coro is not None:
+                # The child will never run.
+                coro.close()
+            if fut.set_running_or_notify_cancel():
+                fut.set_exception(exc)
+            return
+        task.add_done_callback(partial(_report, fut, coro))
+        fut.add_done_callback(partial(_cancel, self._loop, task))
+
+
+async def _resolve(fut: Future[T], coro: Coroutine[Any, Any, T]) -> None:
+    """Run the submitted coroutine, resolving `fut` with its outcome."""
+    try:
+        res = await coro
+    except CancelledError:
+        fut.cancel()
+        raise
+    except BaseException as exc:
+        if fut.set_running_or_notify_cancel():
+            fut.set_exception(exc)
+        # Let the admission policies of the group see the failure.
+        raise
+    if fut.set_running_or_notify_cancel():
+        fut.set_result(res)
+
+
+def _report(fut: Future[Any], coro: Coroutine[Any, Any, Any], task: Task[Any]) -> None:
+    if fut.done():
+        # Resolved by `_resolve`.
+        return
+    # The child never ran, so this prevents a warning about it never being
+    # awaited.
+    coro.close()
+    if task.cancelled():
+        # Cancelled before starting.
+        fut.cancel()
+        return
+    # Rejected by an admission policy of the group, which returns the error.
+    exc = task.result()
+    if isinstance(exc, CancelledError):
+        fut.cancel()
+    elif fut.set_running_or_notify_cancel():
+        fut.set_exception(exc)
+
+
+def _cancel(loop: AbstractEventLoop, task: Task[Any], fut: Future[Any]) -> None:
+    if fut.cancelled() and not task.done():
+        _call_soon_threadsafe(loop, task.cancel)
@@ -0,0 +1,391 @@
+"""A concurrency limit shared between processes."""
+
+from __future__ import annotations
+
+import os
+import sys
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Future,
+    TimerHandle,
+    get_running_loop,
+)
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from mmap import mmap
+from struct import Struct
+from types import TracebackType
+from typing import Final
+
+if sys.platform != "win32":
+    import fcntl
+
+__all__ = ["ProcessLimiter"]
+
+_MAGIC: Final = b"QLIM"
+# Magic, total tokens, size of the waiter table, and padding.
+_HEADER: Final = Struct("=4sIII")
+# How many processes can be registered as waiting at once. Waiting processes
+# that do not fit are only woken up by the reclaim timer.
+_MAX_WAITING_PROCESSES: Final = 1024
+
+
+class ProcessLimiter:
+    """A limit on how many tasks can proceed at once, across processes.
+
+    The tokens live in a small memory-mapped file, shared by every process
+    opening a `ProcessLimiter` with the same `path`, like the worker
+    processes of a web server. Pass it to a `TaskGroup` or `gather()` as the
+    `concurrency_limit` to cap concurrency host-wide.
+
+    A token is recorded with the PID of the process holding it. Tokens held
+    by processes that died without releasing them are reclaimed by the next
+    process trying to acquire one.
+
+    Waiting does not poll: waiting processes register in the file, and a
+    process releasing a token wakes them up through a FIFO next to the file.
+    While tasks are waiting, the limiter also retries every
+    `reclaim_interval` seconds, to reclaim tokens of processes that died.
+
+    Tokens are handed out in FIFO order within a process, but not across
+    processes. Only available on POSIX systems.
+
+    Args:
+        path: The path of the shared file, preferably on a memory-backed
+            filesystem like `/dev/shm`. It is created if it does not exist.
+        total_tokens: The number of tokens. Must match the number the file
+            was created with.
+        reclaim_interval: How often to retry while waiting, in seconds.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        total_tokens: int,
+        *,
+        reclaim_interval: float = 1.0,
+    ) -> None:
+        if sys.platform == "win32":
+            raise RuntimeError("ProcessLimiter is not available on Windows")
+        if total_tokens < 1:
+            raise ValueError("total_tokens must be >= 1")
+        self._path = os.fspath(path)
+        self._total_tokens = total_tokens
+        self.reclaim_interval = reclaim_interval
+
+        # Opened lazily, and reopened after forking.
+        self._pid = 0
+        self._fd = -1
+        self._mmap: mmap | None = None
+        self._slots: memoryview | None = None
+        self._waiting_pids: memoryview | None = None
+
+        # The slots held by this process.
+        self._held: list[int] = []
+        # Local tasks waiting for a token, receiving the slot index.
+        self._waiters: deque[Future[int]] = deque()
+        self._loop: AbstractEventLoop | None = None
+        self._wake_fd = -1
+        self._timer: TimerHandle | None = None
+
+    @property
+    def total_tokens(self) -> int:
+        return self._total_tokens
+
+    @property
+    def borrowed_tokens(self) -> int:
+        """The number of tokens held by live processes."""
+        with self._lock():
+            return sum(1 for pid in self._slots_view() if pid and _alive(pid))
+
+    def locked(self) -> bool:
+        """Whether acquiring would have to wait."""
+        if self._waiters:
+            return True
+        with self._lock():
+            return self._free_slot() is None
+
+    async def acquire(self) -> bool:
+        """Acquire a token, waiting if necessary."""
+        if not self._waiters:
+            with self._lock():
+                slot = self._take()
+            if slot is not None:
+                self._held.append(slot)
+                return True
+
+        loop = get_running_loop()
+        # Be ready for wakeups before registering for them.
+        self._start_waiting(loop)
+        with self._lock():
+            slot = None if self._waiters else self._take()
+            if slot is None:
+                self._register_waiting()
+        if slot is not None:
+            self._held.append(slot)
+            self._stop_waiting()
+            return True
+
+        fut = loop.create_future()
+        self._waiters.append(fut)
+        try:
+            slot = await fut
+        except CancelledError:
+            if fut.done() and not fut.cancelled():
+                # We were handed a token just before being cancelled.
+                self._held.append(fut.result())
+                self.release()
+            else:
+                fut.cancel()
+                self._wake()
+            raise
+        self._held.append(slot)
+        return True
+
+    def release(self) -> None:
+        """Release a token held by this process.
+
+        Raises:
+            ValueError: If released more times than acquired.
+        """
+        if not self._held:
+            raise ValueError("ProcessLimiter released too many times")
+        slot = self._held.pop()
+        with self._lock():
+            self._slots_view()[slot] = 0
+            waiting = [pid for pid in self._waiting_view() if pid]
+        for pid in waiting:
+            if pid != self._pid:
+                self._notify(pid)
+        self._wake()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def close(self) -> None:
+        """Release the resources of this process.
+
+        Tokens still held are released, and waiting tasks are cancelled.
+        """
+        for fut in self._waiters:
+            fut.cancel()
+        self._waiters.clear()
+        while self._held:
+            self.release()
+        self._stop_waiting()
+        self._close_file()
+
+    def _close_file(self) -> None:
+        if self._mmap is not None:
+            assert self._slots is not None and self._waiting_pids is not None
+            self._slots.release()
+            self._waiting_pids.release()
+            self._mmap.close()
+            os.close(self._fd)
+            self._mmap = self._slots = self._waiting_pids = None
+            self._fd = -1
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Hold the file lock. Never awaited while held, so it is brief."""
+        self._open()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _open(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        if self._pid:
+            # We were forked; the state of the parent is not ours.
+            self._held.clear()
+            self._waiters.clear()
+            self._loop = self._timer = None
+            if self._wake_fd != -1:
+                os.close(self._wake_fd)
+                self._wake_fd = -1
+            self._close_file()
+
+        total = self._total_tokens
+        size = _HEADER.size + 4 * (total + _MAX_WAITING_PROCESSES)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size == 0:
+                    os.ftruncate(fd, size)
+                    os.pwrite(
+                        fd, _HEADER.pack(_MAGIC, total, _MAX_WAITING_PROCESSES, 0), 0
+                    )
+                else:
+                    magic, file_total, _, _ = _HEADER.unpack(
+                        os.pread(fd, _HEADER.size, 0)
+                    )
+                    if magic != _MAGIC:
+                        raise ValueError(f"{self._path} is not a ProcessLimiter file")
+                    if file_total != total:
+                        raise ValueError(
+                            f"{self._path} has {file_total} tokens, not {total}"
+                        )
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            mm = mmap(fd, size)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self._mmap = mm
+        view = memoryview(mm)[_HEADER.size :].cast("i")
+        self._slots = view[:total]
+        self._waiting_pids = view[total:]
+        view.release()
+        self._pid = pid
+
+    def _slots_view(self) -> memoryview:
+        assert self._slots is not None
+        return self._slots
+
+    def _waiting_view(self) -> memoryview:
+        assert self._waiting_pids is not None
+        return self._waiting_pids
+
+    def _free_slot(self) -> int | None:
+        """Find a free slot, reclaiming those of dead processes."""
+        slots = self._slots_view()
+        for ix, pid in enumerate(slots):
+            if not pid:
+                return ix
+            if pid != self._pid and not _alive(pid):
+                slots[ix] = 0
+                return ix
+        return None
+
+    def _take(self) -> int | None:
+        slot = self._free_slot()
+        if slot is not None:
+            self._slots_view()[slot] = self._pid
+        return slot
+
+    def _register_waiting(self) -> None:
+        """Register this process as waiting, if there is room."""
+        pids = self._waiting_view()
+        free = None
+        for ix, pid in enumerate(pids):
+            if pid == self._pid:
+                return
+            if free is None and (not pid or not _alive(pid)):
+                free = ix
+        if free is not None:
+            pids[free] = self._pid
+
+    def _unregister_waiting(self) -> None:
+        pids = self._waiting_view()
+        for ix, pid in enumerate(pids):
+            if pid == self._pid:
+                pids[ix] = 0
+
+    def _wake(self) -> None:
+        """Hand free tokens to local waiters."""
+        waiters = self._waiters
+        while waiters:
+            if waiters[0].done():
+                waiters.popleft()
+                continue
+            with self._lock():
+                slot = self._take()
+            if slot is None:
+                return
+            waiters.popleft().set_result(slot)
+        self._stop_waiting()
+
+    def _wake_path(self, pid: int) -> str:
+        return f"{self._path}.{pid}.wake"
+
+    def _start_waiting(self, loop: AbstractEventLoop) -> None:
+        if self._wake_fd == -1:
+            path = self._wake_path(self._pid)
+            with suppress(FileNotFoundError):
+                os.unlink(path)
+            os.mkfifo(path, 0o600)
+            # Opening for writing too means reads never hit EOF.
+            self._wake_fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+            self._loop = loop
+            loop.add_reader(self._wake_fd, self._on_wake)
+        if self._timer is None:
+            self._timer = loop.call_later(self.reclaim_interval, self._on_timer)
+
+    def _stop_waiting(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._wake_fd != -1:
+            assert self._loop is not None
+            with self._lock():
+                self._unregister_waiting()
+            if not self._loop.is_closed():
+                self._loop.remove_reader(self._wake_fd)
+            os.close(self._wake_fd)
+            self._wake_fd = -1
+            self._loop = None
+            with suppress(FileNotFoundError):
+                os.unlink(self._wake_path(self._pid))
+
+    def _on_wake(self) -> None:
+        with suppress(BlockingIOError):
+            while os.read(self._wake_fd, 4096):
+                pass
+        self._wake()
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._wake()
+        if self._waiters:
+            assert self._loop is not None
+            self._timer = self._loop.call_later(self.reclaim_interval, self._on_timer)
+
+    def _notify(self, pid: int) -> None:
+        path = self._wake_path(pid)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError:
+            # Nobody is reading. The process may only be between waits.
+            if _alive(pid):
+                return
+            with self._lock():
+                pids = self._waiting_view()
+                for ix, waiting_pid in enumerate(pids):
+                    if waiting_pid == pid:
+                        pids[ix] = 0
+            return
+        try:
+            # A full pipe means a wakeup is pending already.
+            with suppress(BlockingIOError):
+                os.write(fd, b"\0")
+        finally:
+            os.close(fd)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # It exists, but belongs to someone else.
+        return True
+    return True
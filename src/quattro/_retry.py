@@ -0,0 +1,102 @@
+"""Deadline-aware retries."""
+
+from __future__ import annotations
+
+from asyncio import get_running_loop, sleep
+from collections.abc import Awaitable, Callable
+from random import uniform
+from typing import Final, TypeVar
+
+from attrs import frozen
+
+from ._cancelscope import CancelScope, fail_after, get_current_effective_deadline
+
+__all__ = ["ExponentialBackoff", "retry"]
+
+T = TypeVar("T")
+
+
+@frozen
+class ExponentialBackoff:
+    """Exponential backoff, with optional full jitter.
+
+    The delay before retry number `n` (starting at 1) is
+    `min(initial * multiplier ** (n - 1), maximum)`; with jitter, a uniformly
+    random delay between 0 and that value is used instead.
+
+    .. versionadded:: 26.2.0
+    """
+
+    initial: float = 0.1
+    multiplier: float = 2.0
+    maximum: float = 10.0
+    jitter: bool = True
+
+    def __call__(self, retry: int) -> float:
+        delay = min(self.initial * self.multiplier ** (retry - 1), self.maximum)
+        if self.jitter:
+            return uniform(0, delay)  # noqa: S311
+        return delay
+
+
+_DEFAULT_BACKOFF: Final = ExponentialBackoff()
+
+
+async def retry(
+    factory: Callable[[], Awaitable[T]],
+    attempts: int,
+    *,
+    backoff: Callable[[int], float] = _DEFAULT_BACKOFF,
+    retry_on: type[BaseException] | tuple[type[BaseException], ...] = Exception,
+    attempt_timeout: float | None = None,
+    min_attempt_duration: float = 0.0,
+    label: str | None = None,
+) -> T:
+    """Await the result of `factory()`, retrying on errors.
+
+    Every attempt runs in its own cancel scope. Retries respect the current
+    effective deadline: a retry is skipped, and the last error raised, if the
+    backoff delay plus the expected duration of an attempt would not fit in the
+    remaining budget. The expected duration is the quickest attempt observed
+    so far, but no less than `min_attempt_duration`.
+
+    Args:
+        factory: A callable producing a new awaitable for every attempt.
+        attempts: The maximum number of attempts.
+        backoff: Maps the retry number (starting at 1) to a delay, in seconds.
+        retry_on: Exception types to retry on. `TimeoutError` from
+            `attempt_timeout` is retried on by default.
+        attempt_timeout: When provided, every attempt runs in a `fail_after`
+            scope with this timeout.
+        min_attempt_duration: A lower bound for the expected attempt duration,
+            in seconds.
+        label: The label for the attempt cancel scopes.
+
+    .. versionadded:: 26.2.0
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be >= 1")
+
+    loop = get_running_loop()
+    fastest = float("inf")
+    for attempt in range(attempts):
+        if attempt:
+            delay = backoff(attempt)
+            expected = max(fastest, min_attempt_duration)
+            if loop.time() + delay + expected >= get_current_effective_deadline():
+                break
+            await sleep(delay)
+
+        start = loop.time()
+        try:
+            with (
+                CancelScope(label=label)
+                if attempt_timeout is None
+                else fail_after(attempt_timeout, label=label)
+            ):
+                return await factory()
+        except retry_on as exc:
+            last_exc = exc
+        fastest = min(fastest, loop.time() - start)
+
+    raise last_exc
@@ -0,0 +1,133 @@
+"""Request coalescing."""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Future, Task, get_running_loop, shield
+from collections.abc import Awaitable, Callable, Hashable
+from types import TracebackType
+from typing import Generic, TypeVar
+
+from ._taskgroup import TaskGroup
+
+__all__ = ["SingleFlight"]
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("future", "task", "waiters")
+
+    def __init__(self, future: Future[T]) -> None:
+        self.future = future
+        self.task: Task[None] | None = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[K, T]):
+    """Coalesces concurrent calls with the same key into a single computation.
+
+    The computation runs as a background task of a task group: either the one
+    given, or one owned by the `SingleFlight` itself while it is used as an
+    async context manager. Either way, in-flight computations are cancelled
+    when the task group exits.
+
+    Every caller waits for the shared result under its own cancel scopes, so
+    deadlines apply per caller. When all callers for a key have left, the
+    computation is cancelled.
+
+    Example:
+        >>> async with SingleFlight() as flight:
+        ...     user = await flight.do(user_id, lambda: fetch_user(user_id))
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, task_group: TaskGroup | None = None) -> None:
+        self._task_group = task_group
+        self._own_task_group: TaskGroup | None = None
+        self._calls: dict[K, _Call[T]] = {}
+
+    async def __aenter__(self) -> SingleFlight[K, T]:
+        if self._task_group is not None:
+            raise RuntimeError("SingleFlight already has a task group")
+        tg = TaskGroup()
+        await tg.__aenter__()
+        self._task_group = self._own_task_group = tg
+        return self
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        tg = self._own_task_group
+        assert tg is not None
+        self._task_group = self._own_task_group = None
+        for call in self._calls.values():
+            if call.task is not None:
+                call.task.cancel()
+        await tg.__aexit__(et, exc, tb)
+
+    def __contains__(self, key: K) -> bool:
+        """Whether a computation for the key is in flight."""
+        return key in self._calls
+
+    async def do(self, key: K, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of `factory()`, sharing it with concurrent callers.
+
+        If a computation for `key` is already in flight, wait for its result
+        instead of calling `factory`.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._start(key, factory)
+
+        call.waiters += 1
+        try:
+            return await shield(call.future)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.future.done():
+                # Nobody is interested in the result anymore.
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                assert call.task is not None
+                call.task.cancel()
+
+    def _start(self, key: K, factory: Callable[[], Awaitable[T]]) -> _Call[T]:
+        """Start a computation for the key, without waiting for it."""
+        tg = self._task_group
+        if tg is None:
+            raise RuntimeError("SingleFlight needs a task group, or to be entered")
+        call = _Call(get_running_loop().create_future())
+        call.task = tg.create_background_task(self._run(key, call, factory))
+        if not call.future.done():
+            # With eager tasks, the computation might be done already.
+            self._calls[key] = call
+        return call
+
+    def forget(self, key: K) -> None:
+        """Make the next call for the key start a new computation.
+
+        Callers already waiting for the computation in flight keep waiting
+        for it.
+        """
+        self._calls.pop(key, None)
+
+    async def _run(
+        self, key: K, call: _Call[T], factory: Callable[[], Awaitable[T]]
+    ) -> None:
+        try:
+            result = await factory()
+        except CancelledError:
+            call.future.cancel()
+            raise
+        except Exception as exc:
+            call.future.set_exception(exc)
+        else:
+            call.future.set_result(result)
+        finally:
+            if self._calls.get(key) is call:
+                del self._calls[key]
@@ -0,0 +1,299 @@
+"""Deadline-aware synchronization primitives."""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Future, current_task, get_running_loop
+from collections import deque
+from collections.abc import Hashable
+from types import TracebackType
+from typing import Final
+
+from attrs import frozen
+
+from ._cancelscope import CancelScope, cancel_stack
+
+__all__ = ["CapacityLimiter", "LimiterStatistics", "Lock", "Semaphore"]
+
+# The weight of the latest hold time in the moving average.
+_EWMA_WEIGHT: Final = 0.2
+
+
+@frozen
+class LimiterStatistics:
+    """A snapshot of the state of a deadline-aware primitive."""
+
+    borrowed_tokens: int
+    total_tokens: int
+    tasks_waiting: int
+    mean_hold_time: float | None
+    """The moving average of how long tokens are held, in seconds.
+
+    `None` until a token is released for the first time.
+    """
+    acquisitions: int
+    rejections: int
+    """How many acquisitions were rejected for not fitting the deadline."""
+
+
+class _Limiter:
+    """Tokens handed out in FIFO order, with hold time tracking.
+
+    Waiters that cannot expect a token before their current effective deadline
+    are rejected by cancelling the cancel scope owning that deadline, as if
+    the deadline had passed already.
+    """
+
+    def __init__(self, total_tokens: int) -> None:
+        if total_tokens < 1:
+            raise ValueError("total_tokens must be >= 1")
+        self._total_tokens = total_tokens
+        self._borrowed = 0
+        self._waiters: deque[Future[None]] = deque()
+        self._hold_time: float | None = None
+        self._acquisitions = 0
+        self._rejections = 0
+
+    def locked(self) -> bool:
+        """Whether acquiring would have to wait."""
+        return self._borrowed >= self._total_tokens or bool(self._waiters)
+
+    def statistics(self) -> LimiterStatistics:
+        """Return a snapshot of the state of this primitive."""
+        return LimiterStatistics(
+            self._borrowed,
+            self._total_tokens,
+            len(self._waiters),
+            self._hold_time,
+            self._acquisitions,
+            self._rejections,
+        )
+
+    def _try_acquire(self) -> bool:
+        if self.locked():
+            return False
+        self._borrowed += 1
+        self._acquisitions += 1
+        return True
+
+    async def _acquire(self) -> None:
+        if self._try_acquire():
+            return
+
+        loop = get_running_loop()
+        scope = _doomed_scope(self._expected_wait(), loop.time())
+        if scope is not None:
+            self._rejections += 1
+            # If the scope belongs to this task, the wait below gets cancelled
+            # right away. If it was inherited from a parent task, the parent
+            # gets cancelled, and it will cancel us in turn.
+            scope.cancel()
+
+        fut = loop.create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except CancelledError:
+            if fut.done() and not fut.cancelled():
+                # We were handed a token just before being cancelled.
+                self._borrowed -= 1
+                self._wake()
+            else:
+                self._waiters.remove(fut)
+            raise
+
+    def _expected_wait(self) -> float:
+        """How long a new waiter can expect to wait, in seconds."""
+        if self._hold_time is None:
+            return 0.0
+        # Every waiter ahead of us, and then us, needs a token to be released.
+        return (len(self._waiters) + 1) * self._hold_time / self._total_tokens
+
+    def _release(self, acquired_at: float) -> None:
+        hold_time = get_running_loop().time() - acquired_at
+        self._hold_time = (
+            hold_time
+            if self._hold_time is None
+            else self._hold_time + _EWMA_WEIGHT * (hold_time - self._hold_time)
+        )
+        self._borrowed -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        while waiters and self._borrowed < self._total_tokens:
+            fut = waiters.popleft()
+            # Cancelled waiters are removed only once they run.
+            if not fut.done():
+                self._borrowed += 1
+                self._acquisitions += 1
+                fut.set_result(None)
+
+
+def _doomed_scope(expected_wait: float, now: float) -> CancelScope | None:
+    """Return the scope owning the effective deadline, if we cannot make it."""
+    if not expected_wait:
+        return None
+    scope = min(
+        (cs for cs in cancel_stack.get() if cs._deadline is not None),
+        key=lambda cs: cs._deadline,  # type: ignore[arg-type,return-value]
+        default=None,
+    )
+    if scope is None or now + expected_wait <= scope._deadline:  # type: ignore[operator]
+        return None
+    return scope
+
+
+class Semaphore(_Limiter):
+    """A deadline-aware semaphore.
+
+    Like `asyncio.BoundedSemaphore`, but acquiring fails fast if the expected
+    wait, based on the observed hold times, does not fit in the current
+    effective deadline: the cancel scope owning the deadline is cancelled
+    right away instead of waiting for it to expire.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, value: int = 1) -> None:
+        super().__init__(value)
+        # Acquisition times, paired with releases in order.
+        self._acquired_at: deque[float] = deque()
+
+    async def acquire(self) -> bool:
+        """Acquire the semaphore, waiting if necessary."""
+        await self._acquire()
+        self._acquired_at.append(get_running_loop().time())
+        return True
+
+    def release(self) -> None:
+        """Release the semaphore.
+
+        Raises:
+            ValueError: If released more times than acquired.
+        """
+        if not self._acquired_at:
+            raise ValueError("Semaphore released too many times")
+        self._release(self._acquired_at.popleft())
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+class _BorrowerLimiter(_Limiter):
+    """Tokens are held by borrowers, the current task by default."""
+
+    def __init__(self, total_tokens: int) -> None:
+        super().__init__(total_tokens)
+        self._borrowers: dict[Hashable, float] = {}
+
+    async def _acquire_for(self, borrower: Hashable) -> None:
+        if borrower in self._borrowers:
+            raise RuntimeError("Already holding a token")
+        await self._acquire()
+        self._borrowers[borrower] = get_running_loop().time()
+
+    def _release_for(self, borrower: Hashable) -> None:
+        acquired_at = self._borrowers.pop(borrower, None)
+        if acquired_at is None:
+            raise RuntimeError("Not holding a token")
+        self._release(acquired_at)
+
+    async def __aenter__(self) -> None:
+        await self._acquire_for(current_task())
+
+    async def __aexit__(
+        self,
+        et: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._release_for(current_task())
+
+
+class Lock(_BorrowerLimiter):
+    """A deadline-aware lock, owned by the task acquiring it.
+
+    Acquiring fails fast if the expected wait, based on the observed hold
+    times, does not fit in the current effective deadline. See `Semaphore`.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self) -> None:
+        super().__init__(1)
+
+    async def acquire(self) -> bool:
+        """Acquire the lock, waiting if necessary."""
+        await self._acquire_for(current_task())
+        return True
+
+    def release(self) -> None:
+        """Release the lock.
+
+        Raises:
+            RuntimeError: If the current task does not hold the lock.
+        """
+        self._release_for(current_task())
+
+
+class CapacityLimiter(_BorrowerLimiter):
+    """A deadline-aware limit on how many borrowers can proceed at once.
+
+    Like Trio's `CapacityLimiter`: tokens are borrowed by tasks (or any other
+    hashable borrower), each borrower holds at most one token, and the total
+    can be changed at any time.
+
+    Acquiring fails fast if the expected wait, based on the observed hold
+    times, does not fit in the current effective deadline. See `Semaphore`.
+
+    .. versionadded:: 26.2.0
+    """
+
+    @property
+    def total_tokens(self) -> int:
+        return self._total_tokens
+
+    @total_tokens.setter
+    def total_tokens(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("total_tokens must be >= 1")
+        self._total_tokens = value
+        self._wake()
+
+    @property
+    def borrowed_tokens(self) -> int:
+        return self._borrowed
+
+    @property
+    def available_tokens(self) -> int:
+        return max(self._total_tokens - self._borrowed, 0)
+
+    @property
+    def borrowers(self) -> tuple[Hashable, ...]:
+        """The current borrowers, in the order they acquired their tokens."""
+        return tuple(self._borrowers)
+
+    async def acquire(self) -> bool:
+        """Borrow a token for the current task, waiting if necessary."""
+        await self._acquire_for(current_task())
+        return True
+
+    async def acquire_on_behalf_of(self, borrower: Hashable) -> None:
+        """Borrow a token for the given borrower, waiting if necessary."""
+        await self._acquire_for(borrower)
+
+    def release(self) -> None:
+        """Return the token borrowed by the current task."""
+        self._release_for(current_task())
+
+    def release_on_behalf_of(self, borrower: Hashable) -> None:
+        """Return the token borrowed by the given borrower."""
+        self._release_for(borrower)
@@ -1,14 +1,34 @@
 from __future__ import annotations
 
 import sys
-from asyncio import Semaphore
-from contextvars import Context
-from typing import TYPE_CHECKING, TypeVar
+from asyncio import Semaphore, Task, current_task, get_running_loop
+from collections.abc import Hashable
+from contextvars import Context, copy_context
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeAlias, TypeVar
+
+from ._admission import _EDFSemaphore, _FairSemaphore
+from ._portal import Portal
+from ._processlimiter import ProcessLimiter
+from ._sync import _Limiter
 
 if TYPE_CHECKING:
-    from asyncio import Task, _CoroutineLike
+    from asyncio import _CoroutineLike
     from types import TracebackType
 
+    from ._circuitbreaker import CircuitBreaker
+    from ._loadshedding import LoadShedder
+    from ._sync import CapacityLimiter
+    from ._sync import Semaphore as _DeadlineSemaphore
+
+    _AnySemaphore: TypeAlias = (
+        Semaphore
+        | _DeadlineSemaphore
+        | CapacityLimiter
+        | _EDFSemaphore
+        | _FairSemaphore
+        | ProcessLimiter
+    )
+
 
 if sys.version_info < (3, 11):
     from taskgroup import TaskGroup as _TaskGroup
@@ -20,23 +40,136 @@ __all__ = ["TaskGroup"]
 T = TypeVar("T")
 
 
+class _Slots(Protocol):
+    def __setitem__(self, index: int, value: Any, /) -> None: ...
+
+
+class _GroupObserver:
+    """Receives task group lifecycle events, for instrumentation."""
+
+    def group_entered(self, group: TaskGroup) -> None:
+        pass
+
+    def group_task_created(
+        self, group: TaskGroup, task: Task, background: bool
+    ) -> None:
+        pass
+
+    def group_exited(self, group: TaskGroup) -> None:
+        pass
+
+
+_observers: tuple[_GroupObserver, ...] = ()
+
+
+def _add_observer(observer: _GroupObserver) -> None:
+    global _observers
+    if all(o is not observer for o in _observers):
+        _observers = (*_observers, observer)
+
+
+def _remove_observer(observer: _GroupObserver) -> None:
+    global _observers
+    _observers = tuple(o for o in _observers if o is not observer)
+
+
 class TaskGroup(_TaskGroup):
-    def __init__(self, *, concurrency_limit: int | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        concurrency_limit: int
+        | _DeadlineSemaphore
+        | CapacityLimiter
+        | ProcessLimiter
+        | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        load_shedder: LoadShedder | None = None,
+        eager: bool = False,
+        admission: Literal["fifo", "edf", "fair"] = "fifo",
+    ) -> None:
         """
         Args:
             concurrency_limit: When provided, use a semaphore to limit the number of
-                non-background tasks that run in parallel.
+                non-background tasks that run in parallel. A
+                `quattro.Semaphore` or a `quattro.CapacityLimiter` can be
+                provided instead, to share the limit with other code and to
+                make waiting for a slot deadline-aware, or a
+                `quattro.ProcessLimiter`, to share it with other processes.
+            circuit_breaker: When provided, non-background tasks run under the
+                guard of this circuit breaker. While it is open, tasks fail with
+                `CircuitOpenError` without running, and queued tasks fail
+                without waiting for a concurrency slot.
+            load_shedder: When provided, non-background tasks that cannot be
+                expected to finish before their effective deadline fail with
+                `LoadShedError` instead of running, or waiting for a
+                concurrency slot.
+            eager: When true, tasks start running eagerly, in
+                `create_task()`, until they first block. Tasks finishing
+                without blocking never reach the event loop. Ignored on
+                Python 3.10 and 3.11.
+            admission: The order in which non-background tasks waiting for a
+                concurrency slot are admitted. With `"fifo"`, tasks are admitted
+                in creation order. With `"edf"`, tasks are admitted earliest
+                effective deadline first, based on the cancel scopes active
+                when they were created, and tasks past their deadline are
+                cancelled instead of admitted. With `"fair"`, slots are shared
+                between the tenants given to `create_task()`, in proportion to
+                their weights, by deficit round robin. Policies other than
+                `"fifo"` require an integer `concurrency_limit`.
 
         .. versionchanged:: 26.1.0
            Added the `concurrency_limit` parameter.
+        .. versionchanged:: 26.2.0
+           Added the `circuit_breaker` parameter.
+        .. versionchanged:: 26.2.0
+           `concurrency_limit` accepts deadline-aware primitives.
+        .. versionchanged:: 26.2.0
+           Added the `load_shedder` parameter.
+        .. versionchanged:: 26.2.0
+           Added the `eager` parameter.
+        .. versionchanged:: 26.2.0
+           Added the `admission` parameter.
         """
         _TaskGroup.__init__(self)
         self._bg_tasks: set[Task] = set()
-        if concurrency_limit is not None and concurrency_limit < 1:
-            raise ValueError("concurrency_limit must be >= 1")
-        self._semaphore = (
-            None if concurrency_limit is None else Semaphore(concurrency_limit)
-        )
+        self._semaphore: _AnySemaphore | None
+        if admission != "fifo" and not isinstance(concurrency_limit, int):
+            raise ValueError(f"{admission!r} admission requires a concurrency_limit")
+        if concurrency_limit is None or isinstance(concurrency_limit, int):
+            if concurrency_limit is not None and concurrency_limit < 1:
+                raise ValueError("concurrency_limit must be >= 1")
+            self._int_limit = concurrency_limit
+            if concurrency_limit is None:
+                self._semaphore = None
+            elif admission == "edf":
+                self._semaphore = _EDFSemaphore(concurrency_limit)
+            elif admission == "fair":
+                self._semaphore = _FairSemaphore(concurrency_limit)
+            elif admission == "fifo":
+                self._semaphore = Semaphore(concurrency_limit)
+            else:
+                raise ValueError(f"Unknown admission policy: {admission!r}")
+        else:
+            self._int_limit = None
+            self._semaphore = concurrency_limit
+        self._circuit_breaker = circuit_breaker
+        self._load_shedder = load_shedder
+        # Children currently waiting for a concurrency slot.
+        self._waiting: set[Task] = set()
+        self._eager = eager and sys.version_info >= (3, 12)
+
+    @property
+    def _concurrency_limit(self) -> int | None:
+        # Shared limiters can be resized.
+        if isinstance(self._semaphore, (_Limiter, ProcessLimiter)):
+            return self._semaphore._total_tokens
+        return self._int_limit
+
+    async def __aenter__(self) -> TaskGroup:
+        await _TaskGroup.__aenter__(self)
+        for observer in _observers:
+            observer.group_entered(self)
+        return self
 
     def create_task(
         self,
@@ -44,13 +177,177 @@ class TaskGroup(_TaskGroup):
         *,
         name: str | None = None,
         context: Context | None = None,
+        tenant: Hashable = None,
+        weight: float = 1.0,
     ) -> Task[T]:
-        return super().create_task(
-            coro if self._semaphore is None else _wrap_coro(coro, self._semaphore),
-            name=name,
-            context=context,
+        """Create a new task in this group and return it.
+
+        Args:
+            tenant: With fair admission, the tenant the task is queued
+                under while waiting for a concurrency slot. Ignored otherwise.
+            weight: With fair admission, the share of the concurrency slots
+                the tenant gets relative to other tenants, while it has
+                tasks waiting. Ignored otherwise.
+
+        .. versionchanged:: 26.2.0
+           Added the `tenant` and `weight` parameters.
+        """
+        if weight <= 0:
+            coro.close()
+            raise ValueError("weight must be > 0")
+        return self._create_task(
+            coro, name, context, False, tenant=tenant, weight=weight
         )
 
+    def _create_task(
+        self,
+        coro: _CoroutineLike[Any],
+        name: str | None,
+        context: Context | None,
+        return_exceptions: bool,
+        slots: _Slots | None = None,
+        ix: int = 0,
+        tenant: Hashable = None,
+        weight: float = 1.0,
+    ) -> Task:
+        """Create a non-background task.
+
+        With `return_exceptions`, exceptions are returned as the task result
+        instead of aborting the group.
+
+        With `slots`, the result of a successful child is also written into
+        `slots[ix]` by the task itself, which is cheaper than a done callback.
+        """
+        child = coro
+        if (
+            return_exceptions
+            or slots is not None
+            or self._semaphore is not None
+            or self._circuit_breaker is not None
+            or self._load_shedder is not None
+        ):
+            coro = self._run_child(coro, return_exceptions, slots, ix, tenant, weight)
+        try:
+            if sys.version_info >= (3, 12) and self._eager:
+                task = self._create_eager_task(coro, name, context)
+            else:
+                task = super().create_task(coro, name=name, context=context)
+        except RuntimeError:
+            # The group is not running; neither coroutine will be awaited.
+            coro.close()
+            child.close()
+            raise
+        for observer in _observers:
+            observer.group_task_created(self, task, False)
+        return task
+
+    async def _run_child(
+        self,
+        coro: _CoroutineLike[Any],
+        return_exceptions: bool,
+        slots: _Slots | None,
+        ix: int,
+        tenant: Hashable,
+        weight: float,
+    ) -> Any:
+        """Run a child coroutine under the admission policies of the group.
+
+        This is the only wrapper a child gets, whatever the policies.
+        """
+        breaker = self._circuit_breaker
+        semaphore = self._semaphore
+        shedder = self._load_shedder
+        try:
+            if breaker is not None:
+                breaker._check()
+            if semaphore is not None:
+                if semaphore.locked():
+                    if shedder is not None:
+                        shedder._check()
+                    await self._wait_for_slot(semaphore, tenant, weight)
+                else:
+                    await semaphore.acquire()
+            try:
+                if shedder is not None:
+                    shedder._check()
+                    shedder.admitted += 1
+                    start = get_running_loop().time()
+                if breaker is None:
+                    res = await coro
+                else:
+                    with breaker.guard():
+                        res = await coro
+                if shedder is not None:
+                    shedder._record(get_running_loop().time() - start)
+                if slots is not None:
+                    slots[ix] = res
+                return res
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+        except BaseException as exc:
+            # If the coroutine was rejected before running, this prevents
+            # a warning about it never being awaited.
+            coro.close()
+            if return_exceptions:
+                return exc
+            raise
+
+    async def _wait_for_slot(
+        self, semaphore: _AnySemaphore, tenant: Hashable, weight: float
+    ) -> None:
+        # Only the slow path is tracked, for introspection.
+        task = current_task()
+        assert task is not None
+        self._waiting.add(task)
+        try:
+            if isinstance(semaphore, _FairSemaphore):
+                await semaphore.acquire(tenant, weight)
+            else:
+                await semaphore.acquire()
+        finally:
+            self._waiting.discard(task)
+
+    if sys.version_info >= (3, 12):
+
+        def _create_eager_task(
+            self, coro: _CoroutineLike[Any], name: str | None, context: Context | None
+        ) -> Task:
+            """Like `asyncio.TaskGroup.create_task`, but start the task eagerly.
+
+            The task is created directly, bypassing the task factory of the
+            loop.
+            """
+            if not self._entered:  # type: ignore[attr-defined]
+                coro.close()
+                raise RuntimeError(f"TaskGroup {self!r} has not been entered")
+            if self._exiting and not self._tasks:  # type: ignore[attr-defined]
+                coro.close()
+                raise RuntimeError(f"TaskGroup {self!r} is finished")
+            if self._aborting:  # type: ignore[attr-defined]
+                coro.close()
+                raise RuntimeError(f"TaskGroup {self!r} is shutting down")
+            task = Task(
+                coro, loop=self._loop, name=name, context=context, eager_start=True
+            )
+            # Tasks that finished successfully need no bookkeeping. Failures
+            # go through the done callback, so the group is not aborted
+            # while still inside `create_task()`.
+            if not task.done() or task.cancelled() or task.exception() is not None:
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+            return task
+
+    def portal(self) -> Portal:
+        """Return a portal for submitting children from other threads.
+
+        The children run in a copy of the current context, like children
+        created here.
+
+        .. versionadded:: 26.2.0
+        """
+        return Portal(self, get_running_loop(), copy_context())
+
     def create_background_task(
         self,
         coro: _CoroutineLike[T],
@@ -67,10 +364,15 @@ class TaskGroup(_TaskGroup):
 
         Background tasks do not count against the concurrency limit.
         """
-        task = _TaskGroup.create_task(self, coro, name=name, context=context)
+        if sys.version_info >= (3, 12) and self._eager:
+            task = self._create_eager_task(coro, name, context)
+        else:
+            task = _TaskGroup.create_task(self, coro, name=name, context=context)
         if not task.done():
             self._bg_tasks.add(task)
             task.add_done_callback(lambda t: self._bg_tasks.discard(t))
+        for observer in _observers:
+            observer.group_task_created(self, task, True)
         return task
 
     async def __aexit__(
@@ -89,9 +391,8 @@ class TaskGroup(_TaskGroup):
 
             bg_task.cancel()
 
-        await _TaskGroup.__aexit__(self, et, exc, tb)
-
-
-async def _wrap_coro(coro: _CoroutineLike[T], semaphore: Semaphore) -> T:
-    async with semaphore:
-        return await coro
+        try:
+            await _TaskGroup.__aexit__(self, et, exc, tb)
+        finally:
+            for observer in _observers:
+                observer.group_exited(self)
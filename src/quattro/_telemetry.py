@@ -0,0 +1,213 @@
+"""Opt-in instrumentation for cancel scopes."""
+
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+from attrs import Factory, define, field
+
+from ._cancelscope import _add_observer, _remove_observer, _ScopeObserver
+
+if TYPE_CHECKING:
+    from ._cancelscope import CancelScope
+
+__all__ = ["CancelScopeTelemetry", "Histogram", "ScopeStats"]
+
+DEFAULT_REMAINING_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    60.0,
+)
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+
+
+@define
+class Histogram:
+    """A fixed-bucket histogram.
+
+    `counts[i]` holds the number of observations `<= bounds[i]`
+    (and greater than the previous bound); the last count holds everything
+    above the last bound.
+    """
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field()
+    count: int = 0
+    sum: float = 0.0
+
+    @counts.default
+    def _counts_default(self) -> list[int]:
+        return [0] * (len(self.bounds) + 1)
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+@define
+class ScopeStats:
+    """Statistics for all cancel scopes sharing a label."""
+
+    remaining: Histogram
+    """Budget left over when the scope exited without firing, in seconds."""
+
+    cancel_latency: Histogram
+    """Time from the deadline to `__exit__` for scopes that fired, in seconds."""
+
+    entered: int = 0
+    """How many scopes were entered."""
+
+    fired: int = 0
+    """How many scopes finished by their deadline expiring.
+
+    Scopes cancelled by `cancel()` are not counted.
+    """
+
+    timers_armed: int = 0
+    """How many deadline timers were scheduled on the event loop."""
+
+    live_timers: int = 0
+    """How many deadline timers are currently scheduled on the event loop."""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "entered": self.entered,
+            "fired": self.fired,
+            "timers_armed": self.timers_armed,
+            "live_timers": self.live_timers,
+            "remaining": self.remaining.to_dict(),
+            "cancel_latency": self.cancel_latency.to_dict(),
+        }
+
+
+@define(eq=False)
+class CancelScopeTelemetry(_ScopeObserver):
+    """Collects per-label statistics about cancel scopes.
+
+    Scopes are grouped by their `label` (see `fail_after` and friends);
+    unlabeled scopes are grouped under `None`.
+
+    Nothing is recorded until `install()` is called, and `uninstall()`
+    restores the uninstrumented fast path.
+
+    Args:
+        exporter: Called with a snapshot of the statistics by `export()`.
+        remaining_buckets: Histogram bounds for the remaining budget.
+        latency_buckets: Histogram bounds for the time-to-cancel latency.
+
+    .. versionadded:: 26.2.0
+    """
+
+    exporter: Callable[[Mapping[str | None, ScopeStats]], None] | None = None
+    remaining_buckets: tuple[float, ...] = DEFAULT_REMAINING_BUCKETS
+    latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    stats: dict[str | None, ScopeStats] = Factory(dict)
+    # Scopes whose deadlines expired, by ID, until they exit.
+    _timed_out: set[int] = field(factory=set, init=False, repr=False)
+
+    def install(self) -> None:
+        """Start receiving cancel scope events."""
+        _add_observer(self)
+
+    def uninstall(self) -> None:
+        """Stop receiving cancel scope events."""
+        _remove_observer(self)
+
+    def snapshot(self) -> dict[str | None, ScopeStats]:
+        """Return a copy of the current statistics."""
+        return deepcopy(self.stats)
+
+    def export(self, *, reset: bool = False) -> None:
+        """Pass a snapshot of the statistics to the exporter.
+
+        Args:
+            reset: Whether to clear counters and histograms afterwards.
+                Live timer gauges are preserved.
+        """
+        if self.exporter is not None:
+            self.exporter(self.snapshot())
+        if reset:
+            self.stats = {
+                label: self._new_stats(live_timers=stats.live_timers)
+                for label, stats in self.stats.items()
+                if stats.live_timers
+            }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {str(label): stats.to_dict() for label, stats in self.stats.items()}
+
+    def _new_stats(self, live_timers: int = 0) -> ScopeStats:
+        return ScopeStats(
+            Histogram(self.remaining_buckets),
+            Histogram(self.latency_buckets),
+            live_timers=live_timers,
+        )
+
+    def _stats_for(self, scope: CancelScope) -> ScopeStats:
+        stats = self.stats.get(scope.label)
+        if stats is None:
+            stats = self.stats[scope.label] = self._new_stats()
+        return stats
+
+    def scope_entered(self, scope: CancelScope) -> None:
+        self._stats_for(scope).entered += 1
+
+    def scope_timer_armed(self, scope: CancelScope) -> None:
+        stats = self._stats_for(scope)
+        stats.timers_armed += 1
+        stats.live_timers += 1
+
+    def scope_timer_disarmed(self, scope: CancelScope) -> None:
+        stats = self._stats_for(scope)
+        # The timer may have been armed before we were installed.
+        if stats.live_timers:
+            stats.live_timers -= 1
+
+    def scope_timed_out(self, scope: CancelScope) -> None:
+        self._timed_out.add(id(scope))
+
+    def scope_exited(self, scope: CancelScope) -> None:
+        deadline = scope.deadline
+        stats = self._stats_for(scope)
+        timed_out = id(scope) in self._timed_out
+        if timed_out:
+            self._timed_out.discard(id(scope))
+        if timed_out and scope.cancelled_caught:
+            stats.fired += 1
+            if deadline is not None:
+                stats.cancel_latency.record(
+                    max(0.0, get_running_loop().time() - deadline)
+                )
+        elif deadline is not None and not scope.cancelled_caught:
+            stats.remaining.record(max(0.0, deadline - get_running_loop().time()))
@@ -0,0 +1,82 @@
+"""Batched calls into event loops from other threads."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+from weakref import WeakKeyDictionary, ref
+
+
+class _CallBatch:
+    """Callbacks queued for an event loop by other threads.
+
+    The first callback queued wakes the loop up with a single
+    `call_soon_threadsafe`; callbacks queued before the loop gets to them
+    ride along, without waking it up again.
+    """
+
+    __slots__ = ("_lock", "_loop", "_pending")
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        # Weak, so the batch does not keep its loop alive in `_batches`.
+        self._loop = ref(loop)
+        self._lock = Lock()
+        self._pending: list[tuple[Callable[..., object], tuple[Any, ...]]] = []
+
+    def call_soon(self, callback: Callable[..., object], *args: Any) -> None:
+        with self._lock:
+            self._pending.append((callback, args))
+            if len(self._pending) > 1:
+                # A wakeup is on its way.
+                return
+        loop = self._loop()
+        try:
+            if loop is None:
+                raise RuntimeError("Event loop is closed")
+            loop.call_soon_threadsafe(self._run)
+        except RuntimeError:
+            # The loop is closed; nobody will run these.
+            with self._lock:
+                self._pending.clear()
+            raise
+
+    def _run(self) -> None:
+        loop = self._loop()
+        assert loop is not None
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for callback, args in pending:
+            try:
+                callback(*args)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                loop.call_exception_handler(
+                    {
+                        "message": f"Exception in callback {callback!r}",
+                        "exception": exc,
+                    }
+                )
+
+
+_batches: WeakKeyDictionary[AbstractEventLoop, _CallBatch] = WeakKeyDictionary()
+_batches_lock = Lock()
+
+
+def _call_soon_threadsafe(
+    loop: AbstractEventLoop, callback: Callable[..., object], *args: Any
+) -> None:
+    """Schedule `callback(*args)` on `loop` from any thread.
+
+    Like `loop.call_soon_threadsafe`, but calls made while the loop is busy
+    are coalesced into a single wakeup.
+    """
+    batch = _batches.get(loop)
+    if batch is None:
+        with _batches_lock:
+            batch = _batches.get(loop)
+            if batch is None:
+                batch = _batches[loop] = _CallBatch(loop)
+    batch.call_soon(callback, *args)
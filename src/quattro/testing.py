@@ -0,0 +1,144 @@
+"""Testing helpers: a virtual clock for event loops."""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, SelectorEventLoop, get_running_loop
+from asyncio.selector_events import BaseSelectorEventLoop
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import contextmanager
+from math import inf
+from selectors import BaseSelector, DefaultSelector, SelectorKey
+from typing import Any
+
+__all__ = ["VirtualClock", "VirtualClockEventLoop"]
+
+
+class VirtualClock:
+    """A clock for event loops that only moves when told to, or when idle.
+
+    With autojump, when every task is blocked and no I/O arrives within
+    `autojump_threshold` seconds of real time, the clock jumps forward to the
+    next scheduled timer instead of waiting for it. Code sleeping and timing
+    out then runs as fast as it can, and deterministically.
+
+    A jump happens whenever the loop is idle, including while threads
+    started with `asyncio.to_thread()` are still working. Raise the
+    threshold to give them real time to finish first, or set it to `inf` to
+    only move the clock with `advance()`.
+
+    Args:
+        autojump_threshold: How long the event loop has to be idle, in real
+            seconds, before the clock jumps.
+        start: The starting time.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, autojump_threshold: float = 0.0, start: float = 0.0) -> None:
+        if autojump_threshold < 0:
+            raise ValueError("autojump_threshold must be >= 0")
+        self.autojump_threshold = autojump_threshold
+        self._time = start
+
+    def time(self) -> float:
+        """The current time."""
+        return self._time
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by `seconds`."""
+        if seconds < 0:
+            raise ValueError("The clock cannot go back")
+        self._time += seconds
+
+
+class _VirtualSelector(BaseSelector):
+    """A selector advancing a virtual clock instead of waiting for timers."""
+
+    def __init__(self, selector: BaseSelector, clock: VirtualClock) -> None:
+        self._selector = selector
+        self._clock = clock
+
+    def register(self, fileobj: Any, events: int, data: Any = None) -> SelectorKey:
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj: Any) -> SelectorKey:
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj: Any, events: int, data: Any = None) -> SelectorKey:
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: float | None = None) -> list[tuple[SelectorKey, int]]:
+        # The timeout is until the next timer, if any.
+        if timeout is None or timeout <= 0:
+            return self._selector.select(timeout)
+        threshold = self._clock.autojump_threshold
+        if threshold == inf:
+            return self._selector.select(None)
+        events = self._selector.select(min(timeout, threshold))
+        if not events:
+            self._clock.advance(timeout)
+        return events
+
+    def close(self) -> None:
+        self._selector.close()
+
+    def get_key(self, fileobj: Any) -> SelectorKey:
+        return self._selector.get_key(fileobj)
+
+    def get_map(self) -> Mapping[Any, SelectorKey]:
+        return self._selector.get_map()
+
+
+class VirtualClockEventLoop(SelectorEventLoop):
+    """A selector event loop running on a `VirtualClock`.
+
+    Use it with `asyncio.Runner(loop_factory=VirtualClockEventLoop)`, or
+    `asyncio.run(..., loop_factory=VirtualClockEventLoop)` on Python 3.12+.
+    With pytest, the `virtual_clock` fixture is usually more convenient.
+
+    .. versionadded:: 26.2.0
+    """
+
+    def __init__(self, clock: VirtualClock | None = None) -> None:
+        self.clock = VirtualClock() if clock is None else clock
+        super().__init__(_VirtualSelector(DefaultSelector(), self.clock))
+
+    def time(self) -> float:
+        return self.clock.time()
+
+
+@contextmanager
+def _virtual_time(loop: AbstractEventLoop, clock: VirtualClock) -> Iterator[None]:
+    """Run an existing selector event loop on `clock`, temporarily."""
+    if not isinstance(loop, BaseSelectorEventLoop):
+        raise TypeError("A virtual clock requires a selector event loop")
+    selector = loop._selector  # type: ignore[attr-defined]
+    loop._selector = _VirtualSelector(selector, clock)  # type: ignore[attr-defined]
+    loop.time = clock.time  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        del loop.time
+        loop._selector = selector  # type: ignore[attr-defined]
+
+
+try:
+    import pytest_asyncio
+except ImportError:  # pragma: no cover
+    pass
+else:
+
+    @pytest_asyncio.fixture
+    async def virtual_clock() -> AsyncIterator[VirtualClock]:
+        """Run the test on a `VirtualClock` with autojump, and return it.
+
+        The clock starts at the current time of the event loop.
+        Make it available with `pytest_plugins = ["quattro.testing"]` in a
+        `conftest.py`.
+
+        .. versionadded:: 26.2.0
+        """
+        loop = get_running_loop()
+        clock = VirtualClock(start=loop.time())
+        with _virtual_time(loop, clock):
+            yield clock
@@ -0,0 +1,181 @@
+"""Tests for task group admission policies."""
+
+from asyncio import CancelledError, Event, get_running_loop, sleep
+from collections.abc import Sequence
+from contextvars import copy_context
+from inspect import CORO_CLOSED, getcoroutinestate
+
+import pytest
+
+from quattro import CapacityLimiter, TaskGroup, move_on_at
+
+
+async def test_edf_order() -> None:
+    """Waiting children are admitted earliest deadline first."""
+    order = []
+    release = Event()
+
+    async def holder() -> None:
+        await release.wait()
+
+    async def child(name: str) -> None:
+        order.append(name)
+
+    now = get_running_loop().time()
+    async with TaskGroup(concurrency_limit=1, admission="edf") as tg:
+        tg.create_task(holder())
+        tg.create_task(child("none"))
+        for name, deadline in [("late", 20), ("early", 10), ("middle", 15)]:
+            with move_on_at(now + deadline):
+                tg.create_task(child(name))
+        tg.create_task(child("none2"))
+        await sleep(0)
+        release.set()
+
+    assert order == ["early", "middle", "late", "none", "none2"]
+
+
+async def test_edf_drops_past_due() -> None:
+    """Children past their deadline are cancelled instead of admitted."""
+    admitted = []
+    release = Event()
+
+    async def holder() -> None:
+        await release.wait()
+
+    async def child(name: str) -> None:
+        admitted.append(name)
+
+    loop = get_running_loop()
+    async with TaskGroup(concurrency_limit=1, admission="edf") as tg:
+        tg.create_task(holder())
+        with move_on_at(loop.time() + 0.01):
+            past_due = tg.create_task(child("past due"))
+            ctx = copy_context()
+        tg.create_task(child("ok"))
+        await sleep(0.02)
+        already_past_due = tg.create_task(child("already past due"), context=ctx)
+        release.set()
+
+    assert admitted == ["ok"]
+    assert past_due.cancelled()
+    assert already_past_due.cancelled()
+
+
+async def test_edf_cancelled_waiter() -> None:
+    """Cancelled waiters do not take up slots."""
+    release = Event()
+
+    async def holder() -> None:
+        await release.wait()
+
+    async def child() -> int:
+        return 1
+
+    async with TaskGroup(concurrency_limit=1, admission="edf") as tg:
+        tg.create_task(holder())
+        cancelled = tg.create_task(child())
+        waiting = tg.create_task(child())
+        await sleep(0)
+        cancelled.cancel()
+        await sleep(0)
+        release.set()
+
+    with pytest.raises(CancelledError):
+        cancelled.result()
+    assert waiting.result() == 1
+    assert tg._semaphore is not None
+    assert not tg._semaphore.locked()
+
+
+async def _admission_order(tasks: Sequence[tuple[str, float]]) -> list[str]:
+    """Queue up tasks by tenant and weight, returning the admission order."""
+    order = []
+    release = Event()
+
+    async def holder() -> None:
+        await release.wait()
+
+    async def child(tenant: str) -> None:
+        order.append(tenant)
+
+    async with TaskGroup(concurrency_limit=1, admission="fair") as tg:
+        tg.create_task(holder())
+        for tenant, weight in tasks:
+            tg.create_task(child(tenant), tenant=tenant, weight=weight)
+        await sleep(0)
+        release.set()
+    return order
+
+
+async def test_fair_round_robin() -> None:
+    """A noisy tenant does not starve others, and idle capacity is used."""
+    order = await _admission_order([("noisy", 1)] * 6 + [("quiet", 1)] * 2)
+    assert "".join(t[0] for t in order) == "nqnqnnnn"
+
+
+async def test_fair_weights() -> None:
+    """Tenants get slots in proportion to their weights."""
+    order = await _admission_order([("a", 2)] * 6 + [("b", 1)] * 3 + [("c", 0.5)] * 2)
+    assert "".join(order) == "aabaabcaabc"
+
+
+async def test_fair_tiny_weights() -> None:
+    """Tiny weights keep their proportions, without spinning."""
+    order = await _admission_order([("a", 2e-9)] * 6 + [("b", 1e-9)] * 3)
+    assert "".join(order) == "aabaabaab"
+
+
+async def test_fair_many_tenants() -> None:
+    """Thousands of tenants each get a turn."""
+    order = await _admission_order([(str(i % 2000), 1) for i in range(6000)])
+    assert order[:2000] == [str(i) for i in range(2000)]
+    assert sorted(order) == sorted(str(i % 2000) for i in range(6000))
+
+
+async def test_fair_cancelled_waiter() -> None:
+    """Cancelled waiters do not take up slots or turns."""
+    release = Event()
+
+    async def holder() -> None:
+        await release.wait()
+
+    async def child() -> int:
+        return 1
+
+    async with TaskGroup(concurrency_limit=1, admission="fair") as tg:
+        tg.create_task(holder())
+        cancelled = tg.create_task(child(), tenant="a")
+        waiting = tg.create_task(child(), tenant="b")
+        await sleep(0)
+        cancelled.cancel()
+        await sleep(0)
+        release.set()
+
+    assert cancelled.cancelled()
+    assert waiting.result() == 1
+    assert tg._semaphore is not None
+    assert not tg._semaphore.locked()
+
+
+def test_validation() -> None:
+    """Admission policies need an integer limit."""
+    with pytest.raises(ValueError):
+        TaskGroup(admission="edf")
+    with pytest.raises(ValueError):
+        TaskGroup(concurrency_limit=CapacityLimiter(1), admission="edf")
+    with pytest.raises(ValueError):
+        TaskGroup(concurrency_limit=1, admission="lifo")  # type: ignore[arg-type]
+
+
+async def test_weight_validation() -> None:
+    """Weights must be positive."""
+
+    async def child() -> None:
+        pass
+
+    async with TaskGroup(concurrency_limit=1, admission="fair") as tg:
+        coro = child()
+        with pytest.raises(ValueError):
+            tg.create_task(coro, tenant="a", weight=0)
+        assert getcoroutinestate(coro) == CORO_CLOSED
@@ -0,0 +1,237 @@
+"""Tests for async memoization."""
+
+from asyncio import CancelledError, Event, sleep
+
+import pytest
+
+from quattro import TaskGroup, cached, gather
+
+
+async def test_memoization() -> None:
+    """Results are cached by arguments, and concurrent misses are coalesced."""
+    calls = []
+
+    @cached()
+    async def double(x: int, *, extra: int = 0) -> int:
+        calls.append(x)
+        await sleep(0.01)
+        return 2 * x + extra
+
+    async with double:
+        assert await gather(*(double(1) for _ in range(5))) == (2,) * 5
+        assert await double(1) == 2
+        assert await double(2) == 4
+        assert await double(2, extra=1) == 5
+
+    assert calls == [1, 2, 2]
+    info = double.cache_info()
+    assert info.misses == 7
+    assert info.hits == 1
+    assert info.currsize == 3
+    assert double.__name__ == "double"
+
+
+async def test_lru_eviction() -> None:
+    """The least recently used results are evicted."""
+    calls = []
+
+    @cached(maxsize=2)
+    async def ident(x: int) -> int:
+        calls.append(x)
+        return x
+
+    async with ident:
+        await ident(1)
+        await ident(2)
+        await ident(1)
+        await ident(3)  # Evicts 2.
+        await ident(1)
+        await ident(2)
+
+    assert calls == [1, 2, 3, 2]
+    assert ident.cache_info().currsize == 2
+
+
+async def test_ttl() -> None:
+    """Results expire after the TTL."""
+    calls = 0
+
+    @cached(ttl=0.05)
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async with compute:
+        assert await compute() == 1
+        assert await compute() == 1
+        await sleep(0.06)
+        assert await compute() == 2
+
+
+async def test_errors() -> None:
+    """Errors are only cached with `error_ttl`."""
+    calls = 0
+
+    async def fail() -> None:
+        nonlocal calls
+        calls += 1
+        raise ValueError(calls)
+
+    uncached = cached()(fail)
+    errors_cached = cached(error_ttl=0.05)(fail)
+
+    async with TaskGroup() as tg:
+        uncached.bind(tg)
+        errors_cached.bind(tg)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await uncached()
+        assert calls == 2
+
+        for _ in range(2):
+            with pytest.raises(ValueError) as exc_info:
+                await errors_cached()
+            assert exc_info.value.args == (3,)
+        await sleep(0.06)
+        with pytest.raises(ValueError):
+            await errors_cached()
+        assert calls == 4
+
+
+async def test_stale_while_revalidate() -> None:
+    """Stale results are returned while a background refresh runs."""
+    calls = 0
+    refreshing = Event()
+
+    @cached(ttl=0.05, stale_ttl=1)
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        res = calls
+        if res > 1:
+            refreshing.set()
+            await sleep(0.01)
+        return res
+
+    async with compute:
+        assert await compute() == 1
+        await sleep(0.06)
+        assert await compute() == 1
+        assert await compute() == 1
+        await refreshing.wait()
+        await sleep(0.02)
+        assert await compute() == 2
+    assert calls == 2
+
+
+async def test_refresh_cancelled_on_exit() -> None:
+    """Background refreshes are cancelled when the owning task group exits."""
+    cancelled = False
+
+    @cached(ttl=0, stale_ttl=10)
+    async def compute() -> int:
+        nonlocal cancelled
+        if compute.cache_info().currsize:
+            try:
+                await sleep(10)
+            except CancelledError:
+                cancelled = True
+                raise
+        return 1
+
+    async with compute:
+        assert await compute() == 1
+        assert await compute() == 1
+        await sleep(0)
+
+    assert cancelled
+
+
+async def test_invalidate() -> None:
+    """Invalidation drops a single cached result."""
+    calls = 0
+
+    @cached()
+    async def compute(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async with compute:
+        assert await compute(1) == 1
+        assert await compute(2) == 2
+        compute.invalidate(1)
+        assert await compute(1) == 3
+        assert await compute(2) == 2
+        compute.cache_clear()
+        assert compute.cache_info().currsize == 0
+
+
+async def test_invalidate_in_flight() -> None:
+    """Computations in flight while invalidated do not cache their results."""
+    calls = 0
+    loading = Event()
+    release = Event()
+
+    @cached()
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        res = calls
+        loading.set()
+        await release.wait()
+        return res
+
+    async with TaskGroup() as tg:
+        compute.bind(tg)
+        for invalidate in (compute.invalidate, compute.cache_clear):
+            loading.clear()
+            release.clear()
+            in_flight = tg.create_task(compute())
+            await loading.wait()
+            invalidate()
+            release.set()
+            # Waiting callers still get the result.
+            assert await in_flight == calls
+            assert compute.cache_info().currsize == 0
+            assert await compute() == calls
+            assert compute.cache_info().currsize == 1
+            compute.cache_clear()
+
+    assert calls == 4
+
+
+async def test_methods() -> None:
+    """Methods can be cached, with the instance as part of the key."""
+    calls = []
+
+    class Doubler:
+        def __init__(self, factor: int) -> None:
+            self.factor = factor
+
+        @cached()
+        async def double(self, x: int) -> int:
+            calls.append((self.factor, x))
+            return self.factor * x
+
+    one, two = Doubler(1), Doubler(2)
+    async with Doubler.double:
+        assert await one.double(3) == 3
+        assert await two.double(3) == 6
+        assert await one.double(3) == 3
+
+    assert calls == [(1, 3), (2, 3)]
+    assert Doubler.double.cache_info().currsize == 2
+
+
+async def test_needs_task_group() -> None:
+    """Misses without a task group raise."""
+
+    @cached()
+    async def compute() -> int:
+        return 1
+
+    with pytest.raises(RuntimeError):
+        await compute()
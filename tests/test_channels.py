@@ -0,0 +1,206 @@
+"""Tests for memory channels."""
+
+from asyncio import (
+    CancelledError,
+    QueueEmpty,
+    QueueFull,
+    create_task,
+    gather,
+    sleep,
+)
+from math import inf
+
+import pytest
+
+from quattro import (
+    BrokenChannelError,
+    ChannelClosedError,
+    EndOfChannelError,
+    TaskGroup,
+    move_on_after,
+    open_memory_channel,
+)
+
+
+async def test_buffered() -> None:
+    """Values are buffered up to the capacity."""
+    send, receive = open_memory_channel(2)
+
+    send.send_nowait(1)
+    await send.send(2)
+    with pytest.raises(QueueFull):
+        send.send_nowait(3)
+    assert send.statistics().current_buffer_used == 2
+
+    assert receive.receive_nowait() == 1
+    assert await receive.receive() == 2
+    with pytest.raises(QueueEmpty):
+        receive.receive_nowait()
+
+
+async def test_unbuffered() -> None:
+    """With no buffer, senders wait for receivers."""
+    send, receive = open_memory_channel(0)
+
+    with pytest.raises(QueueFull):
+        send.send_nowait(1)
+
+    async with TaskGroup() as tg:
+        t = tg.create_task(send.send(1))
+        await sleep(0)
+        assert not t.done()
+        assert send.statistics().tasks_waiting_send == 1
+        assert await receive.receive() == 1
+    assert t.done()
+
+
+async def test_unbounded() -> None:
+    """`math.inf` makes the buffer unbounded."""
+    send, receive = open_memory_channel(inf)
+    for i in range(1000):
+        send.send_nowait(i)
+    send.close()
+    assert [v async for v in receive] == list(range(1000))
+
+
+async def test_close_on_last_handle() -> None:
+    """Channels end when the last send handle is closed."""
+    send, receive = open_memory_channel(10)
+
+    async def producer(send, start: int) -> None:
+        with send:
+            for i in range(start, start + 3):
+                await send.send(i)
+
+    async with TaskGroup() as tg:
+        with send:
+            tg.create_task(producer(send.clone(), 0))
+            tg.create_task(producer(send.clone(), 10))
+        assert sorted([v async for v in receive]) == [0, 1, 2, 10, 11, 12]
+
+    with pytest.raises(EndOfChannelError):
+        await receive.receive()
+    with pytest.raises(ChannelClosedError):
+        await send.send(1)
+    with pytest.raises(ChannelClosedError):
+        send.clone()
+
+
+async def test_receivers_woken_on_end() -> None:
+    """Closing the last send handle wakes up blocked receivers."""
+    send, receive = open_memory_channel(0)
+
+    t = create_task(receive.receive())
+    await sleep(0)
+    send.close()
+    with pytest.raises(EndOfChannelError):
+        await t
+
+
+async def test_broken() -> None:
+    """Closing the last receive handle breaks the channel."""
+    send, receive = open_memory_channel(1)
+    send.send_nowait(1)
+
+    t = create_task(send.send(2))
+    await sleep(0)
+    clone = receive.clone()
+    receive.close()
+    assert not t.done()
+    await clone.aclose()
+
+    with pytest.raises(BrokenChannelError):
+        await t
+    with pytest.raises(BrokenChannelError):
+        await send.send(3)
+    assert send.statistics().current_buffer_used == 0
+
+
+async def test_closing_handle_wakes_its_tasks() -> None:
+    """Tasks blocked on a handle get an error when it is closed."""
+    send, receive = open_memory_channel(0)
+    clone = receive.clone()
+
+    t = create_task(clone.receive())
+    await sleep(0)
+    clone.close()
+    with pytest.raises(ChannelClosedError):
+        await t
+    assert send.statistics().tasks_waiting_receive == 0
+
+
+async def test_cancelled_send() -> None:
+    """A cancelled send does not send."""
+    send, receive = open_memory_channel(0)
+
+    with move_on_after(0.01) as scope:
+        await send.send(1)
+    assert scope.cancelled_caught
+
+    with pytest.raises(QueueEmpty):
+        receive.receive_nowait()
+
+
+async def test_completed_operations_are_not_cancelled() -> None:
+    """Operations that complete before their cancellation is delivered succeed.
+
+    The cancellation is delivered on the next `await` instead.
+    """
+    send, receive = open_memory_channel(0)
+    received = []
+    sent = []
+
+    async def receiver() -> None:
+        received.append(await receive.receive())
+        await sleep(1)
+
+    async def sender() -> None:
+        await send.send(1)
+        sent.append(1)
+        await sleep(1)
+
+    r = create_task(receiver())
+    await sleep(0)
+    send.send_nowait(1)
+    # The value is handed over, but the receiver is yet to run.
+    r.cancel()
+
+    s = create_task(sender())
+    await sleep(0)
+    assert receive.receive_nowait() == 1
+    s.cancel()
+
+    res = await gather(r, s, return_exceptions=True)
+    assert all(isinstance(e, CancelledError) for e in res)
+    assert received == [1]
+    assert sent == [1]
+
+
+async def test_fan_out() -> None:
+    """Every value is received exactly once among receive clones."""
+    send, receive = open_memory_channel(1)
+    results: list[int] = []
+
+    async def worker(receive) -> None:
+        with receive:
+            async for v in receive:
+                results.append(v)
+                await sleep(0)
+
+    async with TaskGroup() as tg:
+        with receive:
+            for _ in range(3):
+                tg.create_task(worker(receive.clone()))
+        with send:
+            for i in range(30):
+                await send.send(i)
+
+    assert sorted(results) == list(range(30))
+
+
+def test_validation() -> None:
+    """Invalid buffer sizes are rejected."""
+    with pytest.raises(ValueError):
+        open_memory_channel(-1)
+    with pytest.raises(ValueError):
+        open_memory_channel(1.5)
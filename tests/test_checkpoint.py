@@ -0,0 +1,78 @@
+"""Tests for cooperative checkpoints."""
+
+from asyncio import create_task, sleep
+
+from quattro import checkpoint, checkpointed, move_on_after
+
+
+async def test_no_yield_within_budget() -> None:
+    """Checkpoints do not yield within the budget."""
+    ran = False
+
+    async def other() -> None:
+        nonlocal ran
+        ran = True
+
+    t = create_task(other())
+    for _ in range(1000):
+        await checkpoint(budget=10)
+    assert not ran
+    await t
+
+
+async def test_yield_over_budget() -> None:
+    """Checkpoints yield once the budget is spent."""
+    ran = False
+
+    async def other() -> None:
+        nonlocal ran
+        ran = True
+
+    t = create_task(other())
+    await checkpoint(budget=0)
+    await checkpoint(budget=0)
+    assert ran
+    await t
+
+
+async def test_pending_cancel() -> None:
+    """Checkpoints yield when a cancellation is pending."""
+    with move_on_after(10) as scope:
+        scope.cancel()
+        await checkpoint(budget=10)
+        raise AssertionError("Not cancelled")
+    assert scope.cancelled_caught
+
+
+async def test_deadline() -> None:
+    """Busy loops with checkpoints are cancelled by deadlines."""
+    iterations = 0
+    with move_on_after(0.01) as scope:
+        while iterations < 100_000_000:
+            iterations += 1
+            await checkpoint(budget=0.001)
+    assert scope.cancelled_caught
+    assert iterations < 100_000_000
+
+
+async def test_checkpointed() -> None:
+    """Iteration with checkpoints yields all items, and other tasks run."""
+    order: list[int | str] = []
+
+    async def other() -> None:
+        order.append("other")
+
+    t = create_task(other())
+    async for item in checkpointed(range(3), budget=0):
+        order.append(item)
+    await t
+    assert order == [0, 1, "other", 2]
+
+    items = [item async for item in checkpointed(range(1000))]
+    assert items == list(range(1000))
+
+    with move_on_after(0.01) as scope:
+        async for _ in checkpointed(iter(int, 1)):
+            pass
+    assert scope.cancelled_caught
+    await sleep(0)
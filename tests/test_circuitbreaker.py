@@ -0,0 +1,116 @@
+"""Tests for circuit breakers."""
+
+import sys
+from asyncio import TimeoutError, sleep
+
+import pytest
+
+from quattro import CircuitBreaker, CircuitOpenError, TaskGroup, gather
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
+
+async def fail() -> None:
+    raise ValueError()
+
+
+async def succeed() -> int:
+    return 1
+
+
+async def test_opens_and_recovers() -> None:
+    """The breaker opens after failures, and recovers after a successful trial."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await breaker.call(fail)
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(succeed)
+    assert breaker.rejections == 1
+
+    await sleep(0.05)
+    assert breaker.state == "half_open"
+    assert await breaker.call(succeed) == 1
+    assert breaker.state == "closed"
+    assert (breaker.successes, breaker.failures) == (1, 2)
+
+
+async def test_half_open_failure_reopens() -> None:
+    """A failed trial call reopens the breaker, and only one trial runs."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    with pytest.raises(ValueError):
+        await breaker.call(fail)
+    await sleep(0.01)
+
+    async def slow_failure() -> None:
+        await sleep(0.01)
+        raise ValueError()
+
+    trial, rejected = await gather(
+        breaker.call(slow_failure), breaker.call(succeed), return_exceptions=True
+    )
+    assert isinstance(trial, ValueError)
+    assert isinstance(rejected, CircuitOpenError)
+    assert breaker.state == "open"
+
+
+async def test_timeouts() -> None:
+    """Timeouts count as failures."""
+    breaker = CircuitBreaker(failure_threshold=1, timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        await breaker.call(lambda: sleep(1))
+
+    assert breaker.timeouts == 1
+    assert breaker.state == "open"
+
+
+async def test_unrelated_errors() -> None:
+    """Errors not in `failure_types` do not count."""
+    breaker = CircuitBreaker(failure_threshold=1, failure_types=KeyError)
+    with pytest.raises(ValueError):
+        await breaker.call(fail)
+    assert breaker.state == "closed"
+
+
+async def test_gather() -> None:
+    """gather children fail fast while the breaker is open."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    ran = 0
+
+    async def counted() -> int:
+        nonlocal ran
+        ran += 1
+        return await succeed()
+
+    results = await gather(
+        fail(),
+        counted(),
+        counted(),
+        return_exceptions=True,
+        concurrency_limit=1,
+        circuit_breaker=breaker,
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert all(isinstance(r, CircuitOpenError) for r in results[1:])
+    assert ran == 0
+
+
+async def test_taskgroup() -> None:
+    """Rejected TaskGroup children abort the group."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    with pytest.raises(ValueError):
+        await breaker.call(fail)
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        async with TaskGroup(circuit_breaker=breaker) as tg:
+            tg.create_task(succeed())
+            tg.create_background_task(succeed())
+
+    [exc] = exc_info.value.exceptions
+    assert isinstance(exc, CircuitOpenError)
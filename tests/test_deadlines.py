@@ -1,9 +1,11 @@
-from asyncio import TimeoutError, get_running_loop, sleep
+from asyncio import Event, TimeoutError, create_task, get_running_loop, sleep
 
 import pytest
 
 from quattro import (
+    CancelScope,
     TaskGroup,
+    cancel_stack,
     fail_at,
     get_current_effective_deadline,
     move_on_at,
@@ -132,3 +134,79 @@ async def test_precancelled_deadline() -> None:
     # assert get_current_effective_deadline() == deadline
 
     assert get_current_effective_deadline() == float("inf")
+
+
+async def test_deadline_set_late() -> None:
+    """Deadlines set on entered scopes are seen by the stack."""
+    with CancelScope() as outer:
+        inner_deadline = get_running_loop().time() + 10
+        with move_on_at(inner_deadline):
+            outer.deadline = inner_deadline - 1
+            assert get_current_effective_deadline() == inner_deadline - 1
+
+        stack = cancel_stack.get()
+        assert len(stack) == 1
+        assert stack[0] is outer
+        assert get_current_effective_deadline() == inner_deadline - 1
+
+    assert cancel_stack.get() == ()
+    assert get_current_effective_deadline() == float("inf")
+
+
+async def test_deadline_set_after_spawning() -> None:
+    """Children spawned before a deadline is set see it."""
+    moved = Event()
+    deadline = get_running_loop().time() + 10
+    seen = []
+
+    async def child() -> None:
+        await moved.wait()
+        seen.append(get_current_effective_deadline())
+
+    async with TaskGroup() as tg:
+        with CancelScope() as scope:
+            tg.create_task(child())
+            await sleep(0)
+            scope.deadline = deadline
+            moved.set()
+            await sleep(0)
+
+    assert seen == [deadline]
+
+
+async def test_cancel_from_other_task() -> None:
+    """Scopes without deadlines can be cancelled from other tasks."""
+    entered = Event()
+
+    async def victim(scope: CancelScope) -> None:
+        with scope:
+            entered.set()
+            await sleep(10)
+
+    scope = CancelScope()
+    task = create_task(victim(scope))
+    await entered.wait()
+    scope.cancel()
+    await task
+    assert scope.cancelled_caught
+
+
+async def test_deadline_set_from_other_task() -> None:
+    """Deadlines set from other tasks are seen by the owning task."""
+    entered = Event()
+    moved = Event()
+    deadline = get_running_loop().time() + 10
+
+    async def owner(scope: CancelScope) -> None:
+        with scope:
+            entered.set()
+            await moved.wait()
+            assert get_current_effective_deadline() == deadline
+        assert get_current_effective_deadline() == float("inf")
+
+    scope = CancelScope()
+    task = create_task(owner(scope))
+    await entered.wait()
+    scope.deadline = deadline
+    moved.set()
+    await task
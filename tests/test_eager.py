@@ -0,0 +1,117 @@
+"""Tests for eager task groups."""
+
+import sys
+from asyncio import CancelledError, sleep
+
+import pytest
+
+from quattro import TaskGroup, gather
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
+EAGER = sys.version_info >= (3, 12)
+
+
+async def _hit(i: int) -> int:
+    return i
+
+
+async def _miss(i: int) -> int:
+    await sleep(0.01)
+    return i
+
+
+async def test_synchronous_completion() -> None:
+    """Children finishing without blocking are done right away."""
+    async with TaskGroup(eager=True) as tg:
+        hit = tg.create_task(_hit(1))
+        miss = tg.create_task(_miss(2))
+        assert hit.done() is EAGER
+        assert not miss.done()
+
+    assert hit.result() == 1
+    assert miss.result() == 2
+    assert not tg._tasks
+
+
+async def test_gather() -> None:
+    """gather supports eager children, with all its options."""
+    coros = [_hit(i) if i % 2 else _miss(i) for i in range(10)]
+    assert await gather(*coros, eager=True) == tuple(range(10))
+
+    coros = [_hit(i) if i % 2 else _miss(i) for i in range(10)]
+    assert await gather(
+        *coros, eager=True, concurrency_limit=2, return_exceptions=True
+    ) == tuple(range(10))
+
+
+async def test_concurrency_limit() -> None:
+    """Eager children respect the concurrency limit."""
+    running = 0
+    max_running = 0
+
+    async def child() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.01)
+        running -= 1
+
+    async with TaskGroup(concurrency_limit=2, eager=True) as tg:
+        for _ in range(5):
+            tg.create_task(child())
+        assert running == (2 if EAGER else 0)
+
+    assert max_running == 2
+
+
+async def test_error() -> None:
+    """Children failing eagerly abort the group, but not inside create_task."""
+
+    async def fail() -> None:
+        raise ValueError()
+
+    reached = False
+    with pytest.raises(ExceptionGroup) as exc_info:
+        async with TaskGroup(eager=True) as tg:
+            tg.create_task(fail())
+            reached = True
+            await sleep(1)
+
+    assert reached
+    assert exc_info.value.subgroup(ValueError) is not None
+
+
+async def test_background_tasks() -> None:
+    """Background tasks start eagerly too, and are cancelled on exit."""
+    cancelled = False
+
+    async def forever() -> None:
+        nonlocal cancelled
+        try:
+            await sleep(10)
+        except CancelledError:
+            cancelled = True
+            raise
+
+    async with TaskGroup(eager=True) as tg:
+        hit = tg.create_background_task(_hit(1))
+        tg.create_background_task(forever())
+        assert hit.done() is EAGER
+        assert len(tg._bg_tasks) == (1 if EAGER else 2)
+        await sleep(0)
+
+    assert hit.result() == 1
+    assert cancelled
+
+
+async def test_create_task_after_exit() -> None:
+    """Eager tasks cannot be created in finished groups."""
+    async with TaskGroup(eager=True) as tg:
+        pass
+
+    coro = _hit(1)
+    with pytest.raises(RuntimeError):
+        tg.create_task(coro)
+    coro.close()
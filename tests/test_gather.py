@@ -1,10 +1,12 @@
 import sys
+from array import array
 from asyncio import CancelledError, current_task, get_running_loop, sleep
 from asyncio import gather as asyncio_gather
+from inspect import CORO_CLOSED, getcoroutinestate
 
 from pytest import mark, raises
 
-from quattro import gather
+from quattro import gather, gather_into
 
 if sys.version_info < (3, 11):
     from exceptiongroup import ExceptionGroup
@@ -166,3 +168,38 @@ async def test_gather_concurrency_limit():
         4,
     )
     assert max_running == 2
+
+
+async def test_gather_into():
+    """Results are written into the buffer by position."""
+
+    async def test(i: int) -> float:
+        await sleep(0.01 * (3 - i))
+        return i * 1.5
+
+    buffer = array("d", bytes(8 * 4))
+    assert await gather_into(buffer, *(test(i) for i in range(3))) is buffer
+    assert buffer.tolist() == [0.0, 1.5, 3.0, 0.0]
+
+    assert await gather_into([], concurrency_limit=1) == []
+
+
+async def test_gather_into_error():
+    """Errors propagate, and too small buffers are rejected."""
+
+    async def fail() -> int:
+        raise ValueError()
+
+    async def test() -> int:
+        return 1
+
+    buffer = [0, 0]
+    with raises(ExceptionGroup) as exc_info:
+        await gather_into(buffer, fail(), test())
+    assert exc_info.value.subgroup(ValueError) is not None
+    assert buffer[0] == 0
+
+    coros = [test(), test()]
+    with raises(ValueError):
+        await gather_into([0], *coros)
+    assert all(getcoroutinestate(coro) == CORO_CLOSED for coro in coros)
@@ -0,0 +1,76 @@
+"""Tests for the task tree registry."""
+
+import json
+from asyncio import Event, sleep
+
+import pytest
+
+from quattro import TaskGroup, TaskTreeRegistry, move_on_after
+
+
+@pytest.fixture
+def registry():
+    registry = TaskTreeRegistry()
+    registry.install()
+    yield registry
+    registry.uninstall()
+
+
+async def test_snapshot_tree(registry: TaskTreeRegistry) -> None:
+    """Nested groups, children and scopes show up in the snapshot."""
+    inner_started = Event()
+    release = Event()
+
+    async def inner_child() -> None:
+        with move_on_after(10, label="inner"):
+            inner_started.set()
+            await release.wait()
+
+    async def child() -> None:
+        async with TaskGroup() as inner:
+            inner.create_task(inner_child(), name="inner-child")
+
+    async def bg() -> None:
+        await release.wait()
+
+    async with TaskGroup(concurrency_limit=1) as tg:
+        tg.create_task(child(), name="child")
+        tg.create_task(sleep(0), name="queued")
+        tg.create_background_task(bg(), name="bg")
+        await inner_started.wait()
+
+        snapshot = json.loads(registry.dump_json())
+        release.set()
+
+    [group] = snapshot["groups"]
+    assert group["concurrency_limit"] == 1
+    assert {t["name"]: t["state"] for t in group["tasks"]} == {
+        "child": "running",
+        "queued": "waiting_for_slot",
+    }
+    assert [t["name"] for t in group["background_tasks"]] == ["bg"]
+
+    [child_task] = [t for t in group["tasks"] if t["name"] == "child"]
+    [nested] = child_task["groups"]
+    [inner_task] = nested["tasks"]
+    assert inner_task["name"] == "inner-child"
+    [scope] = inner_task["cancel_scopes"]
+    assert scope["label"] == "inner"
+    assert 9 < scope["remaining"] <= 10
+    assert scope["age"] >= 0
+    assert not scope["cancel_called"]
+
+    assert registry.snapshot() == {"groups": []}
+
+
+async def test_exited_scopes_are_forgotten(registry: TaskTreeRegistry) -> None:
+    """Exited scopes do not linger."""
+
+    async def child() -> None:
+        with move_on_after(10):
+            await sleep(0)
+
+    async with TaskGroup() as tg:
+        tg.create_task(child())
+
+    assert not registry._task_scopes
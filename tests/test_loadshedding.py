@@ -0,0 +1,95 @@
+"""Tests for load shedding."""
+
+import sys
+import time
+from asyncio import TimeoutError, get_running_loop, sleep
+from statistics import median
+
+import pytest
+
+from quattro import LoadShedder, LoadShedError, TaskGroup, gather, move_on_at
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
+
+async def _work(duration: float) -> float:
+    await sleep(duration)
+    return duration
+
+
+async def test_no_deadline() -> None:
+    """Without a deadline, nothing is shed."""
+    shedder = LoadShedder()
+    assert await gather(*(_work(0) for _ in range(3)), load_shedder=shedder) == (
+        0,
+        0,
+        0,
+    )
+    assert shedder.admitted == 3
+    assert shedder.shed == 0
+
+
+async def test_passed_deadline() -> None:
+    """Children whose deadline passed are shed, even without run times."""
+    shedder = LoadShedder()
+    with move_on_at(get_running_loop().time() + 0.01):
+        # Block the loop, so the deadline passes before the scope is cancelled.
+        time.sleep(0.02)
+        with pytest.raises(LoadShedError):
+            shedder._check()
+    assert shedder.shed == 1
+
+
+async def test_median_run_time() -> None:
+    """Queued children that would not finish in time are shed."""
+    shedder = LoadShedder(min_samples=2)
+    await gather(_work(0.05), _work(0.05), load_shedder=shedder)
+    assert shedder.median_run_time is not None
+    assert shedder.median_run_time >= 0.05
+
+    with move_on_at(get_running_loop().time() + 0.08):
+        res = await gather(
+            *(_work(0.05) for _ in range(4)),
+            return_exceptions=True,
+            concurrency_limit=2,
+            load_shedder=shedder,
+        )
+
+    # The first two fit, the queued ones do not.
+    assert res[:2] == (0.05, 0.05)
+    assert all(isinstance(r, LoadShedError) for r in res[2:])
+    assert shedder.shed == 2
+    assert isinstance(res[2], TimeoutError)
+
+
+def test_median_window() -> None:
+    """The median is taken over the most recent run times."""
+    shedder = LoadShedder(window=5, min_samples=1)
+    assert shedder.median_run_time is None
+    # Repeating, with duplicates.
+    run_times = [i * i % 7 / 10 for i in range(50)]
+    for ix, run_time in enumerate(run_times):
+        shedder._record(run_time)
+        assert shedder.median_run_time == median(run_times[max(ix - 4, 0) : ix + 1])
+
+
+async def test_taskgroup() -> None:
+    """Shedding in task groups aborts the group, like other errors."""
+    shedder = LoadShedder(min_samples=1)
+    await gather(_work(0.05), load_shedder=shedder)
+
+    ran = False
+
+    async def child() -> None:
+        nonlocal ran
+        ran = True
+
+    with (
+        pytest.raises(ExceptionGroup) as exc_info,
+        move_on_at(get_running_loop().time() + 0.01),
+    ):
+        async with TaskGroup(load_shedder=shedder) as tg:
+            tg.create_task(child())
+    assert exc_info.value.subgroup(LoadShedError) is not None
+    assert not ran
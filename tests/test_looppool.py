@@ -0,0 +1,162 @@
+"""Tests for loop pools."""
+
+import sys
+import threading
+from asyncio import (
+    CancelledError,
+    Event,
+    TimeoutError,
+    create_task,
+    get_running_loop,
+    sleep,
+)
+from collections.abc import Coroutine
+from inspect import CORO_CLOSED, getcoroutinestate
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from quattro import (
+    LoopPool,
+    TaskGroup,
+    fail_after,
+    gather,
+    get_current_effective_deadline,
+    move_on_after,
+)
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
+
+async def _square(x: int) -> tuple[int, str]:
+    await sleep(0)
+    return x * x, threading.current_thread().name
+
+
+async def _fail() -> None:
+    raise ValueError()
+
+
+async def _remaining() -> float:
+    return get_current_effective_deadline() - get_running_loop().time()
+
+
+async def _slow_square(x: int, delay: float) -> int:
+    await sleep(delay)
+    return x * x
+
+
+@pytest.fixture
+def pool():
+    with LoopPool(2) as pool:
+        yield pool
+
+
+async def test_run(pool: LoopPool) -> None:
+    """Calls run on the worker loops, spread between them."""
+    results = await gather(*(pool.run(_square, i) for i in range(10)))
+    assert [r for r, _ in results] == [i * i for i in range(10)]
+    assert {name for _, name in results} == {
+        "quattro-loop-pool-0",
+        "quattro-loop-pool-1",
+    }
+
+
+async def test_errors(pool: LoopPool) -> None:
+    """Errors in workers propagate, and abort task groups."""
+    with pytest.raises(ValueError):
+        await pool.run(_fail)
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        async with TaskGroup() as tg:
+            tg.create_task(pool.run(_fail))
+            tg.create_task(pool.run(sleep, 10))
+    assert exc_info.value.subgroup(ValueError) is not None
+
+
+async def test_deadline(pool: LoopPool) -> None:
+    """The current effective deadline applies in the worker."""
+    assert await pool.run(_remaining) == float("inf")
+
+    with fail_after(1):
+        remaining = await pool.run(_remaining)
+    assert 0.5 < remaining <= 1
+
+
+async def test_cancellation(pool: LoopPool) -> None:
+    """Cancelling a call cancels and waits for the coroutine in the worker."""
+    started = Event()
+    loop = get_running_loop()
+    cancelled = []
+
+    async def forever() -> None:
+        loop.call_soon_threadsafe(started.set)
+        try:
+            await sleep(10)
+        except CancelledError:
+            await sleep(0.01)
+            cancelled.append(True)
+            raise
+
+    t = create_task(pool.run(forever))
+    await started.wait()
+    t.cancel()
+    with pytest.raises(CancelledError):
+        await t
+    assert cancelled == [True]
+
+    with move_on_after(0.01) as scope:
+        await pool.run(sleep, 10)
+    assert scope.cancelled_caught
+
+
+async def test_processes() -> None:
+    """Workers can be processes."""
+    with LoopPool(2, processes=True) as pool:
+        assert await gather(*(pool.run(_slow_square, i, 0) for i in range(4))) == (
+            0,
+            1,
+            4,
+            9,
+        )
+        with pytest.raises(ValueError):
+            await pool.run(_fail)
+        with pytest.raises(TimeoutError), fail_after(0.1):
+            await pool.run(_slow_square, 1, 1)
+
+
+async def test_closed() -> None:
+    """Closed pools refuse calls."""
+    with LoopPool(1) as pool:
+        pass
+
+    with pytest.raises(RuntimeError, match="closed"):
+        await pool.run(_square, 1)
+
+
+async def test_scheduling_failure(pool: LoopPool) -> None:
+    """Coroutines that cannot be scheduled on a worker are closed."""
+    scheduled = []
+
+    def fail(callback: object, job: object, coro: Coroutine[Any, Any, Any]) -> None:
+        scheduled.append(coro)
+        raise RuntimeError()
+
+    # The least busy worker is the first one.
+    shard = pool._shards[0]
+    with (
+        patch.object(shard.loop, "call_soon_threadsafe", fail),
+        pytest.raises(RuntimeError),
+    ):
+        await pool.run(_square, 1)
+
+    [coro] = scheduled
+    assert getcoroutinestate(coro) == CORO_CLOSED
+    assert shard.load == 0
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError):
+        LoopPool(0)
@@ -3,7 +3,7 @@ from time import monotonic, time
 
 import pytest
 
-from quattro import move_on_after
+from quattro import CancelScope, move_on_after
 
 
 async def test_move_on_after():
@@ -199,6 +199,45 @@ async def test_move_on_after_move_deadline_to_past():
     assert 0.1 <= spent <= 0.15
 
 
+async def test_reschedule():
+    """Rescheduling works as a sliding idle timeout, without timer churn."""
+    start = time()
+    with move_on_after(0.05) as cancel_scope:
+        handlers = {id(cancel_scope._timeout_handler)}
+        for _ in range(15):
+            await sleep(0.01)
+            cancel_scope.reschedule(0.05)
+            handlers.add(id(cancel_scope._timeout_handler))
+        await sleep(1)
+
+    # The timer only re-arms when it fires, roughly every 0.05 seconds.
+    assert len(handlers) <= 4
+    assert cancel_scope.cancelled_caught
+    assert start + 0.2 <= time() <= start + 0.25
+
+
+async def test_reschedule_earlier():
+    """Moving the deadline earlier reschedules the timer."""
+    start = time()
+    with move_on_after(1) as cancel_scope:
+        cancel_scope.reschedule(0.05)
+        await sleep(1)
+
+    assert cancel_scope.cancelled_caught
+    assert time() - start <= 0.1
+
+
+async def test_reschedule_no_deadline():
+    """Scopes without a deadline can be rescheduled."""
+    start = time()
+    with CancelScope() as cancel_scope:
+        cancel_scope.reschedule(0.05)
+        await sleep(1)
+
+    assert cancel_scope.cancelled_caught
+    assert time() - start <= 0.1
+
+
 async def test_enter_twice():
     """Cannot enter twice."""
     with (c := move_on_after(0.2)), pytest.raises(RuntimeError), c:
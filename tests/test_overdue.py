@@ -0,0 +1,71 @@
+"""Tests for the overdue cancellation detector."""
+
+import time
+from asyncio import sleep, to_thread
+
+import pytest
+
+from quattro import OverdueDetector, OverdueReport, move_on_after
+
+
+@pytest.fixture
+def reports():
+    reports: list[OverdueReport] = []
+    detector = OverdueDetector(0.05, reports.append)
+    detector.install()
+    yield reports
+    detector.uninstall()
+
+
+async def test_blocked_scope_is_reported(reports: list[OverdueReport]) -> None:
+    """A scope blocked past its deadline is reported, with the blocking stack."""
+
+    def blocking_section() -> None:
+        time.sleep(0.3)
+
+    with move_on_after(0.05, label="blocked") as scope:
+        blocking_section()
+        await sleep(1)
+
+    assert scope.cancelled_caught
+    [report] = reports
+    assert report.label == "blocked"
+    assert report.cancelled_caught
+    # Loose bounds, since CI machines can stall for a while.
+    assert 0.2 < report.lag < 5
+    assert report.stack is not None
+    assert any("blocking_section" in line for line in report.stack)
+
+
+async def test_timely_scopes_are_not_reported(reports: list[OverdueReport]) -> None:
+    """Scopes cancelled on time, or finishing early, are not reported."""
+    with move_on_after(0.01):
+        await sleep(1)
+    with move_on_after(1):
+        await sleep(0)
+    with move_on_after(0.01) as scope:
+        scope.deadline = None
+        await sleep(0.1)
+
+    assert reports == []
+
+
+async def test_finished_scopes_are_purged() -> None:
+    """Scopes exiting long before their deadlines do not pile up."""
+    detector = OverdueDetector(0.05)
+    detector.install()
+    try:
+        for _ in range(10_000):
+            with move_on_after(3600):
+                pass
+        # Let the watchdog catch up.
+        for _ in range(100):
+            if len(detector._incoming) < 1024:
+                break
+            await to_thread(time.sleep, 0.01)
+
+        assert detector._entries == {}
+        assert len(detector._heap) + len(detector._incoming) < 5000
+        assert all(e.scope is None for _, e in detector._heap)
+    finally:
+        detector.uninstall()
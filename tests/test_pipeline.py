@@ -0,0 +1,119 @@
+"""Tests for pipelines."""
+
+import sys
+from asyncio import CancelledError, sleep
+
+import pytest
+
+from quattro import Stage, pipeline
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
+
+async def test_pipeline() -> None:
+    """Items flow through all stages in order."""
+
+    async def double(x: int) -> int:
+        await sleep(0)
+        return x * 2
+
+    async def inc(x: int) -> int:
+        return x + 1
+
+    async with pipeline(range(10), double, inc) as results:
+        assert [r async for r in results] == [x * 2 + 1 for x in range(10)]
+
+
+async def test_async_source_and_concurrency() -> None:
+    """Stages with concurrency process items in parallel."""
+    running = 0
+    max_running = 0
+
+    async def source():
+        for i in range(20):
+            yield i
+
+    async def slow(x: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.01)
+        running -= 1
+        return x
+
+    async with pipeline(source(), Stage(slow, concurrency=4)) as results:
+        assert sorted([r async for r in results]) == list(range(20))
+
+    assert max_running == 4
+
+
+async def test_backpressure() -> None:
+    """A slow consumer limits how far ahead the source gets."""
+    produced = 0
+
+    def source():
+        nonlocal produced
+        for i in range(100):
+            produced += 1
+            yield i
+
+    async def ident(x: int) -> int:
+        return x
+
+    async with pipeline(source(), Stage(ident, buffer_size=2)) as results:
+        async for _ in results:
+            await sleep(0.01)
+            # Source buffer, stage in progress and stage buffer.
+            assert produced <= 6
+            break
+
+
+async def test_errors_cancel_pipeline() -> None:
+    """An error in any stage cancels all the others."""
+    cancelled = False
+
+    async def fail(x: int) -> int:
+        if x == 3:
+            raise ValueError()
+        return x
+
+    async def slow(x: int) -> int:
+        nonlocal cancelled
+        try:
+            await sleep(1)
+        except CancelledError:
+            cancelled = True
+            raise
+        return x
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        async with pipeline(range(10), fail, Stage(slow, concurrency=10)) as results:
+            async for _ in results:
+                pass
+
+    assert exc_info.value.subgroup(ValueError) is not None
+    assert cancelled
+
+
+async def test_empty() -> None:
+    """Empty sources and pipelines work."""
+    async with pipeline([]) as results:
+        assert [r async for r in results] == []
+
+    async with pipeline([1, 2]) as results:
+        assert [r async for r in results] == [1, 2]
+
+
+def test_validation() -> None:
+    """Invalid sizes are rejected."""
+
+    async def ident(x: int) -> int:
+        return x
+
+    with pytest.raises(ValueError):
+        Stage(ident, concurrency=0)
+    with pytest.raises(ValueError):
+        Stage(ident, buffer_size=0)
+    with pytest.raises(ValueError):
+        pipeline([], buffer_size=0)
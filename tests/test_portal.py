@@ -0,0 +1,167 @@
+"""Tests for task group portals."""
+
+import sys
+import threading
+from asyncio import CancelledError, Event, get_running_loop, sleep, to_thread
+from concurrent.futures import CancelledError as FutureCancelledError
+from unittest.mock import patch
+
+import pytest
+
+from quattro import TaskGroup, get_current_effective_deadline, move_on_after
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import ExceptionGroup
+
+
+async def _double(x: int) -> int:
+    await sleep(0)
+    return x * 2
+
+
+async def _fail() -> None:
+    raise ValueError()
+
+
+async def test_submit() -> None:
+    """Submitted children run in the group, and report back."""
+    async with TaskGroup() as tg:
+        portal = tg.portal()
+
+        def work() -> list[int]:
+            futs = [portal.submit(_double, i) for i in range(10)]
+            return [f.result() for f in futs]
+
+        assert await to_thread(work) == [i * 2 for i in range(10)]
+
+
+async def test_errors() -> None:
+    """Errors are set on the futures, and do not abort the group."""
+    async with TaskGroup() as tg:
+        portal = tg.portal()
+        fut = await to_thread(portal.submit, _fail)
+        with pytest.raises(ValueError):
+            await to_thread(fut.result)
+
+        # The factory failing is an error too.
+        bad_call = await to_thread(
+            lambda: portal.submit(_double)  # type: ignore[call-arg]
+        )
+        with pytest.raises(TypeError):
+            await to_thread(bad_call.result)
+
+        ok = await to_thread(lambda: portal.submit(_double, 1))
+        assert await to_thread(ok.result) == 2
+
+
+async def test_returned_exceptions() -> None:
+    """Exceptions returned by children are results, not errors."""
+
+    async def make_error() -> ValueError:
+        return ValueError("returned")
+
+    async with TaskGroup() as tg:
+        portal = tg.portal()
+        fut = await to_thread(portal.submit, make_error)
+        res = await to_thread(fut.result)
+        assert isinstance(res, ValueError)
+        assert res.args == ("returned",)
+
+
+async def test_concurrency_limit() -> None:
+    """Submitted children respect the concurrency limit."""
+    running = 0
+    max_running = 0
+
+    async def child() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.001)
+        running -= 1
+
+    async with TaskGroup(concurrency_limit=2) as tg:
+        portal = tg.portal()
+
+        def work() -> None:
+            for fut in [portal.submit(child) for _ in range(10)]:
+                fut.result()
+
+        await to_thread(work)
+
+    assert max_running == 2
+
+
+async def test_context() -> None:
+    """Submitted children run in the context the portal was created in."""
+    loop = get_running_loop()
+
+    async def get_deadline() -> float:
+        return get_current_effective_deadline()
+
+    async with TaskGroup() as tg:
+        with move_on_after(10):
+            deadline = get_current_effective_deadline()
+            portal = tg.portal()
+        fut = await to_thread(portal.submit, get_deadline)
+        assert await to_thread(fut.result) == deadline
+        assert deadline > loop.time()
+
+
+async def test_cancellation() -> None:
+    """Cancelling futures cancels children, and vice versa."""
+    started = threading.Event()
+    cancelled = Event()
+
+    async def forever() -> None:
+        started.set()
+        try:
+            await sleep(10)
+        except CancelledError:
+            cancelled.set()
+            raise
+
+    async with TaskGroup() as tg:
+        portal = tg.portal()
+        fut = await to_thread(portal.submit, forever)
+        await to_thread(started.wait)
+        assert fut.cancel()
+        await cancelled.wait()
+
+    with pytest.raises(ExceptionGroup):
+        async with TaskGroup() as tg:
+            portal = tg.portal()
+            fut = await to_thread(portal.submit, sleep, 10)
+            await sleep(0)
+            tg.create_task(_fail())
+
+    with pytest.raises(FutureCancelledError):
+        fut.result()
+
+
+async def test_finished_group() -> None:
+    """Submitting to finished groups fails."""
+    async with TaskGroup() as tg:
+        portal = tg.portal()
+
+    fut = await to_thread(portal.submit, _double, 1)
+    with pytest.raises(RuntimeError):
+        await to_thread(fut.result)
+
+
+async def test_batched_wakeups() -> None:
+    """A burst of submissions wakes the loop up once."""
+    loop = get_running_loop()
+    async with TaskGroup() as tg:
+        portal = tg.portal()
+        with patch.object(
+            loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+        ) as mock:
+            # Keep the loop busy, so the submissions pile up.
+            thread = threading.Thread(
+                target=lambda: [portal.submit(_double, i) for i in range(100)]
+            )
+            thread.start()
+            thread.join()
+        await sleep(0.01)
+    assert mock.call_count == 1
@@ -0,0 +1,131 @@
+"""Tests for the cross-process limiter."""
+
+import os
+import signal
+import subprocess
+import sys
+from asyncio import create_subprocess_exec, get_running_loop, sleep
+from pathlib import Path
+
+import pytest
+
+import quattro
+from quattro import ProcessLimiter, TaskGroup, gather
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX only")
+
+_HOLDER = """
+import asyncio, sys
+from quattro import ProcessLimiter
+
+async def main():
+    limiter = ProcessLimiter(sys.argv[1], 1)
+    await limiter.acquire()
+    print("acquired", flush=True)
+    await asyncio.sleep(float(sys.argv[2]))
+    limiter.release()
+
+asyncio.run(main())
+"""
+
+
+async def _start_holder(path: Path, hold: float):
+    """Start a process holding the only token for `hold` seconds."""
+    env = {**os.environ, "PYTHONPATH": str(Path(quattro.__file__).parent.parent)}
+    proc = await create_subprocess_exec(
+        sys.executable,
+        "-c",
+        _HOLDER,
+        str(path),
+        str(hold),
+        stdout=subprocess.PIPE,
+        env=env,
+    )
+    assert proc.stdout is not None
+    assert await proc.stdout.readline() == b"acquired\n"
+    return proc
+
+
+async def test_local(tmp_path: Path) -> None:
+    """Within a process, it works like a semaphore."""
+    limiter = ProcessLimiter(tmp_path / "limiter", 2)
+    running = 0
+    max_running = 0
+
+    async def worker() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.01)
+        running -= 1
+
+    async with TaskGroup(concurrency_limit=limiter) as tg:
+        for _ in range(6):
+            tg.create_task(worker())
+    await gather(*(worker() for _ in range(6)), concurrency_limit=limiter)
+
+    assert max_running == 2
+    assert limiter.borrowed_tokens == 0
+    with pytest.raises(ValueError):
+        limiter.release()
+    limiter.close()
+
+
+async def test_cross_process_wakeup(tmp_path: Path) -> None:
+    """Releases in other processes wake waiters up without polling."""
+    path = tmp_path / "limiter"
+    limiter = ProcessLimiter(path, 1, reclaim_interval=60)
+    proc = await _start_holder(path, 0.2)
+
+    assert limiter.locked()
+    assert limiter.borrowed_tokens == 1
+    loop = get_running_loop()
+    start = loop.time()
+    async with limiter:
+        assert loop.time() - start < 5
+    assert await proc.wait() == 0
+    limiter.close()
+
+
+async def test_dead_holder(tmp_path: Path) -> None:
+    """Tokens held by dead processes are reclaimed."""
+    path = tmp_path / "limiter"
+    limiter = ProcessLimiter(path, 1, reclaim_interval=0.05)
+    proc = await _start_holder(path, 60)
+
+    async def kill() -> None:
+        await sleep(0.1)
+        proc.send_signal(signal.SIGKILL)
+
+    async with TaskGroup() as tg:
+        tg.create_task(kill())
+        await limiter.acquire()
+    assert limiter.borrowed_tokens == 1
+    limiter.release()
+    await proc.wait()
+    limiter.close()
+
+
+async def test_cancelled_waiter(tmp_path: Path) -> None:
+    """Cancelled waiters stop waiting, and do not take tokens."""
+    limiter = ProcessLimiter(tmp_path / "limiter", 1)
+    await limiter.acquire()
+
+    with quattro.move_on_after(0.01) as scope:
+        await limiter.acquire()
+    assert scope.cancelled_caught
+    assert limiter._wake_fd == -1
+
+    limiter.release()
+    assert not limiter.locked()
+    limiter.close()
+
+
+def test_validation(tmp_path: Path) -> None:
+    """The number of tokens needs to match the file."""
+    path = tmp_path / "limiter"
+    ProcessLimiter(path, 2).locked()
+    with pytest.raises(ValueError):
+        ProcessLimiter(path, 3).locked()
+    with pytest.raises(ValueError):
+        ProcessLimiter(path, 0)
@@ -0,0 +1,121 @@
+"""Tests for retries."""
+
+from asyncio import get_running_loop, sleep
+
+import pytest
+
+from quattro import ExponentialBackoff, fail_after, move_on_after, retry
+
+
+async def test_retry_until_success() -> None:
+    """Failed attempts are retried."""
+    calls = 0
+
+    async def flaky() -> int:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ValueError()
+        return calls
+
+    assert await retry(flaky, 5, backoff=ExponentialBackoff(0.001)) == 3
+
+
+async def test_retry_exhausted() -> None:
+    """The last error is raised when attempts are exhausted."""
+    calls = 0
+
+    async def failing() -> None:
+        nonlocal calls
+        calls += 1
+        raise ValueError(calls)
+
+    with pytest.raises(ValueError, match="3"):
+        await retry(failing, 3, backoff=lambda _: 0)
+
+    assert calls == 3
+
+
+async def test_retry_on() -> None:
+    """Only selected errors are retried."""
+    calls = 0
+
+    async def failing() -> None:
+        nonlocal calls
+        calls += 1
+        raise KeyError()
+
+    with pytest.raises(KeyError):
+        await retry(failing, 3, backoff=lambda _: 0, retry_on=ValueError)
+
+    assert calls == 1
+
+
+async def test_attempt_timeout() -> None:
+    """Attempts time out individually."""
+    calls = 0
+
+    async def slow_then_fast() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await sleep(1)
+        return calls
+
+    assert (
+        await retry(slow_then_fast, 2, backoff=lambda _: 0, attempt_timeout=0.01) == 2
+    )
+
+
+async def test_retries_respect_deadline() -> None:
+    """Retries that cannot finish before the deadline are skipped."""
+    calls = 0
+
+    async def slow_failure() -> None:
+        nonlocal calls
+        calls += 1
+        await sleep(0.05)
+        raise ValueError()
+
+    loop = get_running_loop()
+    start = loop.time()
+    with pytest.raises(ValueError), fail_after(0.15):
+        await retry(slow_failure, 10, backoff=lambda _: 0.02)
+
+    # The third attempt would have finished at ~0.19.
+    assert calls == 2
+    assert loop.time() - start < 0.15
+
+
+async def test_min_attempt_duration() -> None:
+    """The minimum attempt duration is taken into account."""
+    calls = 0
+
+    async def failure() -> None:
+        nonlocal calls
+        calls += 1
+        raise ValueError()
+
+    with move_on_after(1), pytest.raises(ValueError):
+        await retry(failure, 10, backoff=lambda _: 0, min_attempt_duration=2)
+
+    assert calls == 1
+
+
+def test_backoff() -> None:
+    """Backoff delays grow exponentially, up to the maximum."""
+    backoff = ExponentialBackoff(1, 2, 5, jitter=False)
+    assert [backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+    jittered = ExponentialBackoff(1, 2, 5)
+    assert all(0 <= jittered(n) <= 5 for n in range(1, 10))
+
+
+async def test_invalid_attempts() -> None:
+    """At least one attempt is required."""
+
+    async def noop() -> None:
+        pass
+
+    with pytest.raises(ValueError):
+        await retry(noop, 0)
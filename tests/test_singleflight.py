@@ -0,0 +1,101 @@
+"""Tests for request coalescing."""
+
+from asyncio import CancelledError, Event, create_task, sleep
+
+import pytest
+
+from quattro import SingleFlight, TaskGroup, gather, move_on_after
+
+
+async def test_coalescing() -> None:
+    """Concurrent calls with the same key share a computation."""
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        res = calls
+        await sleep(0.01)
+        return res
+
+    async with SingleFlight[str, int]() as flight:
+        assert await gather(*(flight.do("a", compute) for _ in range(10))) == (1,) * 10
+        assert "a" not in flight
+        assert await flight.do("a", compute) == 2
+        assert await gather(flight.do("b", compute), flight.do("c", compute)) == (
+            3,
+            4,
+        )
+
+
+async def test_errors_are_shared() -> None:
+    """Errors are propagated to all callers, without aborting the group."""
+
+    async def compute() -> int:
+        await sleep(0.01)
+        raise ValueError()
+
+    async with SingleFlight[str, int]() as flight:
+        results = await gather(
+            flight.do("a", compute), flight.do("a", compute), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+async def test_per_caller_deadlines() -> None:
+    """Callers leave on their own deadlines; the last one cancels the work."""
+    cancelled = Event()
+
+    async def compute() -> int:
+        try:
+            await sleep(1)
+        except CancelledError:
+            cancelled.set()
+            raise
+        return 1
+
+    async with TaskGroup() as tg:
+        flight = SingleFlight[str, int](tg)
+
+        async def impatient() -> None:
+            with move_on_after(0.01):
+                await flight.do("a", compute)
+
+        async def patient() -> None:
+            with move_on_after(0.05):
+                await flight.do("a", compute)
+
+        waiter = create_task(patient())
+        await impatient()
+        assert not cancelled.is_set()
+        assert "a" in flight
+
+        await waiter
+        await sleep(0)
+        assert cancelled.is_set()
+        assert "a" not in flight
+
+
+async def test_shutdown_cancels_work() -> None:
+    """In-flight computations are cancelled when the owner exits."""
+    started = Event()
+
+    async def compute() -> int:
+        started.set()
+        await sleep(10)
+        return 1
+
+    async with SingleFlight[str, int]() as flight:
+        waiter = create_task(flight.do("a", compute))
+        await started.wait()
+
+    assert "a" not in flight
+    with pytest.raises(CancelledError):
+        await waiter
+
+
+async def test_requires_task_group() -> None:
+    """Using an unentered SingleFlight without a group is an error."""
+    flight = SingleFlight[str, None]()
+    with pytest.raises(RuntimeError):
+        await flight.do("a", lambda: sleep(0))
@@ -0,0 +1,213 @@
+"""Tests for deadline-aware synchronization primitives."""
+
+from asyncio import CancelledError, TimeoutError, create_task, get_running_loop, sleep
+from collections.abc import Sequence
+
+import pytest
+
+from quattro import (
+    CapacityLimiter,
+    Lock,
+    Semaphore,
+    TaskGroup,
+    fail_after,
+    gather,
+    move_on_after,
+)
+
+
+async def test_semaphore() -> None:
+    """Semaphores limit concurrency, and hand out slots in order."""
+    sem = Semaphore(2)
+    order = []
+
+    async def worker(i: int) -> None:
+        async with sem:
+            order.append(i)
+            await sleep(0.01)
+
+    async with TaskGroup() as tg:
+        for i in range(5):
+            tg.create_task(worker(i))
+        await sleep(0)
+        assert sem.locked()
+        assert sem.statistics().tasks_waiting == 3
+
+    assert order == list(range(5))
+    stats = sem.statistics()
+    assert stats.acquisitions == 5
+    assert stats.borrowed_tokens == 0
+    assert stats.mean_hold_time is not None
+    assert stats.mean_hold_time == pytest.approx(0.01, abs=0.005)
+
+    with pytest.raises(ValueError):
+        sem.release()
+
+
+async def test_fast_fail() -> None:
+    """Waits that cannot fit in the deadline fail right away."""
+    lock = Lock()
+
+    async with lock:
+        await sleep(0.05)
+
+    async def holder() -> None:
+        async with lock:
+            await sleep(0.05)
+
+    t = create_task(holder())
+    await sleep(0)
+
+    loop = get_running_loop()
+    start = loop.time()
+    with pytest.raises(TimeoutError), fail_after(0.01):
+        await lock.acquire()
+    assert loop.time() - start < 0.01
+    assert lock.statistics().rejections == 1
+    assert lock.statistics().tasks_waiting == 0
+
+    # Deadlines that fit wait normally.
+    with fail_after(1):
+        await lock.acquire()
+    lock.release()
+    await t
+
+
+async def test_no_fast_fail_without_data() -> None:
+    """Without observed hold times, waiters wait until their deadline."""
+    lock = Lock()
+    await lock.acquire()
+
+    async def waiter() -> bool:
+        with move_on_after(0.02) as scope:
+            await lock.acquire()
+        return scope.cancelled_caught
+
+    assert await create_task(waiter())
+    assert lock.statistics().rejections == 0
+    lock.release()
+
+
+async def test_lock_ownership() -> None:
+    """Locks can only be released by their owner."""
+    lock = Lock()
+    with pytest.raises(RuntimeError):
+        lock.release()
+
+    await lock.acquire()
+    assert lock.locked()
+    with pytest.raises(RuntimeError):
+        await lock.acquire()
+    with pytest.raises(RuntimeError):
+        await create_task(_release(lock))
+    lock.release()
+    assert not lock.locked()
+
+
+async def _release(lock: Lock) -> None:
+    lock.release()
+
+
+async def test_capacity_limiter() -> None:
+    """Capacity limiters track borrowers, and can be resized."""
+    limiter = CapacityLimiter(1)
+    await limiter.acquire_on_behalf_of("a")
+    assert limiter.available_tokens == 0
+
+    t = create_task(limiter.acquire_on_behalf_of("b"))
+    await sleep(0)
+    assert not t.done()
+    limiter.total_tokens = 2
+    await t
+    assert limiter.borrowed_tokens == 2
+
+    limiter.release_on_behalf_of("a")
+    limiter.release_on_behalf_of("b")
+    with pytest.raises(RuntimeError):
+        limiter.release_on_behalf_of("b")
+    with pytest.raises(ValueError):
+        limiter.total_tokens = 0
+
+
+async def test_cancelled_waiter_passes_token_on() -> None:
+    """A waiter cancelled right after getting a token passes it on."""
+    sem = Semaphore(1)
+    await sem.acquire()
+
+    first = create_task(sem.acquire())
+    second = create_task(sem.acquire())
+    await sleep(0)
+    sem.release()
+    first.cancel()
+
+    with pytest.raises(CancelledError):
+        await first
+    assert await second
+    assert sem.statistics().borrowed_tokens == 1
+
+
+async def test_taskgroup_limiter() -> None:
+    """Task groups can share a deadline-aware limiter."""
+    limiter = CapacityLimiter(2)
+    running = 0
+    max_running = 0
+
+    async def worker() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.01)
+        running -= 1
+
+    async with (
+        TaskGroup(concurrency_limit=limiter) as tg1,
+        TaskGroup(concurrency_limit=limiter) as tg2,
+    ):
+        for _ in range(4):
+            tg1.create_task(worker())
+            tg2.create_task(worker())
+
+    assert max_running == 2
+    assert limiter.statistics().acquisitions == 8
+
+
+async def test_gather_shared_limiter() -> None:
+    """Concurrent gather calls can share a process-wide limit."""
+    limiter = CapacityLimiter(3)
+    running = 0
+    max_running = 0
+
+    async def worker() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        assert len(limiter.borrowers) == running
+        await sleep(0.01)
+        running -= 1
+        return 1
+
+    async def handler() -> Sequence[int]:
+        return await gather(*(worker() for _ in range(4)), concurrency_limit=limiter)
+
+    results = await gather(*(handler() for _ in range(3)))
+    assert results == ((1, 1, 1, 1),) * 3
+    assert max_running == 3
+    assert limiter.borrowers == ()
+    assert limiter.statistics().acquisitions == 12
+
+
+async def test_resize_shared_limiter() -> None:
+    """Resizing a shared limiter applies to the task groups using it."""
+    limiter = CapacityLimiter(1)
+
+    async with TaskGroup(concurrency_limit=limiter) as tg:
+        assert tg._concurrency_limit == 1
+        for _ in range(4):
+            tg.create_task(sleep(0.01))
+        await sleep(0)
+        assert limiter.statistics().tasks_waiting == 3
+        limiter.total_tokens = 4
+        assert tg._concurrency_limit == 4
+        assert limiter.statistics().tasks_waiting == 0
+        await sleep(0)
+        assert len(limiter.borrowers) == 4
@@ -0,0 +1,121 @@
+"""Tests for cancel scope telemetry."""
+
+import json
+from asyncio import TimeoutError, sleep
+from collections.abc import Mapping
+
+import pytest
+
+from quattro import (
+    CancelScope,
+    CancelScopeTelemetry,
+    ScopeStats,
+    _cancelscope,
+    fail_after,
+    move_on_after,
+)
+
+
+@pytest.fixture
+def telemetry():
+    telemetry = CancelScopeTelemetry()
+    telemetry.install()
+    yield telemetry
+    telemetry.uninstall()
+
+
+async def test_fired_and_not_fired(telemetry: CancelScopeTelemetry) -> None:
+    """Fired and completed scopes are tracked per label."""
+    with move_on_after(0.01, label="db"):
+        await sleep(1)
+    with move_on_after(1, label="db"):
+        pass
+    with pytest.raises(TimeoutError), fail_after(0.01, label="http"):
+        await sleep(1)
+
+    db = telemetry.stats["db"]
+    assert db.entered == 2
+    assert db.fired == 1
+    assert db.timers_armed == 2
+    assert db.live_timers == 0
+    assert db.cancel_latency.count == 1
+    assert db.remaining.count == 1
+    assert db.remaining.sum > 0.9
+
+    http = telemetry.stats["http"]
+    assert http.entered == 1
+    assert http.fired == 1
+    assert http.cancel_latency.count == 1
+    assert http.remaining.count == 0
+
+
+async def test_manual_cancel(telemetry: CancelScopeTelemetry) -> None:
+    """Scopes cancelled manually before their deadline did not fire."""
+    with move_on_after(1, label="manual") as scope:
+        scope.cancel()
+        await sleep(0)
+    assert scope.cancelled_caught
+
+    scope = CancelScope(label="manual")
+    scope.cancel()
+    with scope:
+        await sleep(1)
+
+    stats = telemetry.stats["manual"]
+    assert stats.fired == 0
+    assert stats.cancel_latency.count == 0
+    assert stats.remaining.count == 0
+
+    with move_on_after(0, label="past"):
+        await sleep(1)
+    with move_on_after(1, label="past") as scope:
+        scope.deadline = 0
+        await sleep(1)
+    assert telemetry.stats["past"].fired == 2
+    assert telemetry.stats["past"].cancel_latency.count == 2
+
+
+async def test_live_timers(telemetry: CancelScopeTelemetry) -> None:
+    """Live timers are counted while scopes are active."""
+    with move_on_after(1, label="outer") as scope:
+        with move_on_after(1):
+            assert telemetry.stats["outer"].live_timers == 1
+            assert telemetry.stats[None].live_timers == 1
+        assert telemetry.stats[None].live_timers == 0
+
+        scope.deadline = None
+        assert telemetry.stats["outer"].live_timers == 0
+
+    assert telemetry.stats["outer"].timers_armed == 1
+
+
+async def test_export(telemetry: CancelScopeTelemetry) -> None:
+    """The exporter receives snapshots, and stats can be reset."""
+    exported: list[Mapping[str | None, ScopeStats]] = []
+    telemetry.exporter = exported.append
+
+    with move_on_after(1, label="a"):
+        pass
+
+    telemetry.export(reset=True)
+    assert exported[0]["a"].entered == 1
+    assert telemetry.stats == {}
+
+    with move_on_after(1, label="a"):
+        pass
+    assert exported[0]["a"].entered == 1
+    assert json.loads(json.dumps(telemetry.to_dict()))["a"]["entered"] == 1
+
+
+async def test_uninstall() -> None:
+    """Uninstalled telemetry records nothing."""
+    telemetry = CancelScopeTelemetry()
+    telemetry.install()
+    telemetry.install()
+    assert _cancelscope._observers.count(telemetry) == 1
+    telemetry.uninstall()
+    assert telemetry not in _cancelscope._observers
+
+    with move_on_after(1):
+        pass
+    assert telemetry.stats == {}
@@ -0,0 +1,90 @@
+"""Tests for the virtual clock."""
+
+import sys
+from asyncio import TimeoutError, get_running_loop, sleep, to_thread
+from itertools import pairwise
+from math import inf
+from time import monotonic
+
+import pytest
+
+from quattro import (
+    ExponentialBackoff,
+    TaskGroup,
+    fail_after,
+    move_on_after,
+    retry,
+)
+from quattro.testing import VirtualClock, VirtualClockEventLoop
+
+if sys.version_info >= (3, 11):
+    from asyncio import Runner
+
+
+async def test_autojump(virtual_clock: VirtualClock) -> None:
+    """Sleeps and timeouts take no real time."""
+    loop = get_running_loop()
+    start = loop.time()
+    real_start = monotonic()
+
+    with pytest.raises(TimeoutError), fail_after(3600):
+        await sleep(7200)
+    assert loop.time() == start + 3600
+
+    with move_on_after(10) as scope:
+        async with TaskGroup() as tg:
+            tg.create_task(sleep(5))
+            tg.create_task(sleep(8))
+    assert not scope.cancelled_caught
+    assert loop.time() == start + 3608
+
+    assert monotonic() - real_start < 1
+
+
+async def test_retries(virtual_clock: VirtualClock) -> None:
+    """Retries back off in virtual time."""
+    attempts = []
+
+    async def flaky() -> int:
+        attempts.append(get_running_loop().time())
+        if len(attempts) < 4:
+            raise ValueError()
+        return 1
+
+    backoff = ExponentialBackoff(initial=60, maximum=inf, jitter=False)
+    assert await retry(flaky, 5, backoff=backoff) == 1
+    assert [b - a for a, b in pairwise(attempts)] == [60, 120, 240]
+
+
+async def test_advance(virtual_clock: VirtualClock) -> None:
+    """The clock can be moved manually."""
+    virtual_clock.autojump_threshold = inf
+    loop = get_running_loop()
+    start = loop.time()
+
+    virtual_clock.advance(10)
+    assert loop.time() == start + 10
+    with pytest.raises(ValueError):
+        virtual_clock.advance(-1)
+
+    # I/O and calls from threads still wake the loop up.
+    assert await to_thread(lambda: 1) == 1
+    assert loop.time() == start + 10
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="No asyncio.Runner")
+def test_event_loop() -> None:
+    """The virtual clock is available as an event loop."""
+
+    async def main() -> float:
+        await sleep(100)
+        return get_running_loop().time()
+
+    with Runner(loop_factory=VirtualClockEventLoop) as runner:
+        assert runner.run(main()) == 100
+        assert isinstance(runner.get_loop(), VirtualClockEventLoop)
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError):
+        VirtualClock(autojump_threshold=-1)
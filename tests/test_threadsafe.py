@@ -0,0 +1,86 @@
+"""Tests for thread-safe cancel scope operations."""
+
+import threading
+from asyncio import get_running_loop, sleep, to_thread
+from unittest.mock import patch
+
+from quattro import CancelScope, fail_after, move_on_after
+
+
+async def test_cancel_threadsafe() -> None:
+    """Scopes can be cancelled from other threads."""
+    with CancelScope() as scope:
+        await to_thread(scope.cancel_threadsafe)
+        await sleep(1)
+    assert scope.cancelled_caught
+
+
+async def test_cancel_threadsafe_before_entering() -> None:
+    """Scopes cancelled before entering are cancelled on entering."""
+    scope = CancelScope()
+    await to_thread(scope.cancel_threadsafe)
+    with scope:
+        await sleep(1)
+    assert scope.cancelled_caught
+
+
+async def test_cancel_threadsafe_after_exiting() -> None:
+    """Cancelling finished scopes is a no-op."""
+    with CancelScope() as scope:
+        pass
+    await to_thread(scope.cancel_threadsafe)
+    await sleep(0)
+    assert not scope.cancelled_caught
+
+
+async def test_set_deadline_threadsafe() -> None:
+    """Deadlines can be moved from other threads."""
+    loop = get_running_loop()
+    with move_on_after(10) as scope:
+        await to_thread(scope.set_deadline_threadsafe, loop.time() + 0.01)
+        await sleep(1)
+    assert scope.cancelled_caught
+
+    with fail_after(0.01) as scope:
+        await to_thread(scope.set_deadline_threadsafe, None)
+        await sleep(0.02)
+    assert not scope.cancelled_caught
+    assert scope.deadline is None
+
+    scope = CancelScope()
+    await to_thread(scope.set_deadline_threadsafe, loop.time() - 1)
+    with scope:
+        await sleep(1)
+    assert scope.cancelled_caught
+
+
+async def test_batched_wakeups() -> None:
+    """Many cancels from other threads wake the loop up once."""
+    loop = get_running_loop()
+    scopes = [CancelScope() for _ in range(100)]
+    cancelled = []
+
+    async def child(scope: CancelScope) -> None:
+        with scope:
+            await sleep(1)
+        cancelled.append(scope.cancelled_caught)
+
+    tasks = [loop.create_task(child(scope)) for scope in scopes]
+    await sleep(0)
+
+    def cancel_all() -> None:
+        for scope in scopes:
+            scope.cancel_threadsafe()
+
+    with patch.object(
+        loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+    ) as mock:
+        # Keep the loop busy, so the calls pile up.
+        thread = threading.Thread(target=cancel_all)
+        thread.start()
+        thread.join()
+    for task in tasks:
+        await task
+
+    assert cancelled == [True] * 100
+    assert mock.call_count == 1